@@ -0,0 +1,101 @@
+"""Micro-benchmarks for Markdown escaping and URL sanitizing.
+
+Compares BaseFormatter's helpers with the implementations they replaced
+(kept below as the baseline) on a synthetic list of repositories: escaping
+every description, and sanitizing every repository URL twice (as a second
+section or a second run in the same process would).
+
+Usage:
+    python benchmarks/escape.py [--repos 10000] [--dirty 0.05] [--runs 5]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import urllib.parse
+from collections.abc import Callable
+
+from github2md.constants import ALLOWED_URL_SCHEMES
+from github2md.formatters.base import BaseFormatter, _sanitize_url
+
+
+def legacy_escape_md(text: str | None) -> str:
+    if not text:
+        return ""
+    return text.replace("|", "\\|").replace("\n", " ").replace("\r", "")
+
+
+def legacy_sanitize_url(url: str | None) -> str:
+    if not url:
+        return ""
+    url = url.strip()
+    try:
+        parsed = urllib.parse.urlparse(url)
+        if not parsed.scheme:
+            return ""
+        if parsed.scheme.lower() not in ALLOWED_URL_SCHEMES:
+            return ""
+    except Exception:
+        return ""
+    return url.replace(")", "%29").replace("[", "%5B").replace("]", "%5D")
+
+
+def timed(func: Callable[[], object], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument("--repos", type=int, default=10_000)
+    parser.add_argument("--dirty", type=float, default=0.05)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    descriptions = [
+        "A tool | with\na table" if rng.random() < args.dirty else f"Project {i}"
+        for i in range(args.repos)
+    ]
+    urls = [f"https://github.com/user{i % 97}/repo-{i}" for i in range(args.repos)]
+    formatter = BaseFormatter()
+
+    expected = [legacy_escape_md(d) for d in descriptions]
+    assert [formatter._escape_md(d) for d in descriptions] == expected
+    assert [formatter._sanitize_url(u) for u in urls] == [
+        legacy_sanitize_url(u) for u in urls
+    ]
+
+    def sanitize_new() -> None:
+        _sanitize_url.cache_clear()
+        for _ in range(2):
+            for url in urls:
+                formatter._sanitize_url(url)
+
+    cases = [
+        (
+            "escape (per value)",
+            lambda: [legacy_escape_md(d) for d in descriptions],
+            lambda: [formatter._escape_md(d) for d in descriptions],
+        ),
+        (
+            "sanitize URLs x2",
+            lambda: [legacy_sanitize_url(u) for _ in range(2) for u in urls],
+            sanitize_new,
+        ),
+    ]
+    print(f"{args.repos} repositories, {args.dirty:.0%} need escaping")
+    for name, before, after in cases:
+        old, new = timed(before, args.runs), timed(after, args.runs)
+        print(f"  {name:<20} {old:8.2f} ms -> {new:8.2f} ms ({old / new:4.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""Rendering benchmark: template formatters versus hand-written ones.
+
+Renders the profile, repositories and contributions sections for a number
+of synthetic users with the template-based formatters and with the
+hand-written ``lines.append`` formatters they replaced (kept below as the
+baseline), after checking that both produce identical output.
+
+Usage:
+    python benchmarks/render.py [--users 2000] [--repos 50] [--runs 5]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Any
+
+from github2md.constants import MAX_REPOS
+from github2md.formatters.base import BaseFormatter
+from github2md.formatters.contributions import ContributionsFormatter
+from github2md.formatters.profile import ProfileFormatter
+from github2md.formatters.repos import ReposFormatter
+from github2md.records import RepoRecord
+
+
+class LegacyFormatters(BaseFormatter):
+    """The formatters as they were before templates."""
+
+    def profile(self, data: dict[str, Any]) -> str:
+        lines = [f"# GitHub Profile: {data.get('username', 'Unknown')}\n"]
+        if data.get("name"):
+            lines.append(f"**{data['name']}**\n")
+        if data.get("bio"):
+            lines.append(f"> {data['bio']}\n")
+        lines.append("## Info\n")
+        info = [
+            ("Company", data.get("company")),
+            ("Location", data.get("location")),
+            ("Blog", data.get("blog")),
+            ("Twitter", data.get("twitter")),
+            ("Member since", data.get("created_at")),
+        ]
+        for label, value in info:
+            if value:
+                lines.append(f"- **{label}:** {value}")
+        lines.append("\n## Stats\n")
+        lines.append(f"- **Public Repos:** {data.get('public_repos', 0)}")
+        lines.append(f"- **Followers:** {data.get('followers', 0)}")
+        lines.append(f"- **Following:** {data.get('following', 0)}")
+        if data.get("html_url"):
+            lines.append(f"\n**Profile:** {data['html_url']}")
+        return "\n".join(lines) + "\n"
+
+    def repos(self, data: dict[str, Any]) -> str:
+        lines = [f"# Repositories ({data.get('total', 0)} total)\n"]
+        stars = data.get("total_stars", 0)
+        forks = data.get("total_forks", 0)
+        lines.append(f"**Total Stars:** {stars} | **Total Forks:** {forks}\n")
+        languages = data.get("languages", {})
+        if languages:
+            lines.append("## Languages\n")
+            for lang, count in list(languages.items())[:10]:
+                lines.append(f"- **{lang}:** {count} repos")
+            lines.append("")
+        repos = data.get("repos", [])
+        if repos:
+            lines.append("## Top Repositories\n")
+            for repo in repos[:MAX_REPOS]:
+                desc = self._truncate(repo.description, 100) or "No description"
+                lines.append(f"### {self._make_link(repo.name or 'Unknown', repo.url)}")
+                lines.append(f"{desc}")
+                lang = repo.language or "Unknown"
+                lines.append(f"- **Language:** {lang} | **Stars:** {repo.stars}")
+                lines.append("")
+        return "\n".join(lines) + "\n"
+
+    def contributions(self, data: dict[str, Any]) -> str:
+        lines = ["# Contributions\n"]
+        total = data.get("total_contributions", 0)
+        lines.append(f"**Total Contributions (last year):** {total}\n")
+        lines.append("## Breakdown\n")
+        lines.append(f"- **Commits:** {data.get('total_commits', 0)}")
+        lines.append(f"- **Pull Requests:** {data.get('total_prs', 0)}")
+        lines.append(f"- **Issues:** {data.get('total_issues', 0)}")
+        lines.append(f"- **Code Reviews:** {data.get('total_reviews', 0)}")
+        return "\n".join(lines) + "\n"
+
+
+def make_user(i: int, repos: int) -> dict[str, dict[str, Any]]:
+    records = [
+        RepoRecord.create(
+            name=f"repo-{i}-{j}",
+            description=f"Repository {j} of user {i}, " * (j % 6),
+            url=f"https://github.com/user{i}/repo-{j}",
+            language=("Python", "Go", "Rust", None)[j % 4],
+            stars=repos - j,
+        )
+        for j in range(repos)
+    ]
+    return {
+        "profile": {
+            "username": f"user{i}",
+            "name": f"User {i}",
+            "bio": "Writes code",
+            "location": "Earth",
+            "created_at": "2015-06-01",
+            "public_repos": repos,
+            "followers": i,
+            "following": 3,
+            "html_url": f"https://github.com/user{i}",
+        },
+        "repos": {
+            "repos": records,
+            "total": repos,
+            "total_stars": sum(r.stars for r in records),
+            "total_forks": 0,
+            "languages": {"Python": 20, "Go": 12, "Rust": 12},
+        },
+        "contributions": {"total_contributions": 1234, "total_commits": 1000},
+    }
+
+
+def timed(render, users) -> float:
+    start = time.thread_time()
+    for user in users:
+        render(user)
+    return time.thread_time() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--repos", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    legacy = LegacyFormatters()
+    profile, repos, contributions = (
+        ProfileFormatter(),
+        ReposFormatter(),
+        ContributionsFormatter(),
+    )
+
+    def render_legacy(user):
+        return [
+            legacy.profile(user["profile"]),
+            legacy.repos(user["repos"]),
+            legacy.contributions(user["contributions"]),
+        ]
+
+    def render_templates(user):
+        return [
+            profile.format(user["profile"]),
+            repos.format(user["repos"]),
+            contributions.format(user["contributions"]),
+        ]
+
+    users = [make_user(i, args.repos) for i in range(args.users)]
+    if render_legacy(users[0]) != render_templates(users[0]):
+        print("FAIL: template output differs from the hand-written formatters")
+        return 1
+
+    # Interleave the runs and compare them pairwise, so drift on a noisy
+    # machine hits both sides of every ratio alike.
+    samples: dict[str, list[float]] = {"hand-written": [], "templates": []}
+    for _ in range(args.runs):
+        samples["hand-written"].append(timed(render_legacy, users))
+        samples["templates"].append(timed(render_templates, users))
+    for name, times in samples.items():
+        median = statistics.median(times)
+        per_user = median / args.users * 1e6
+        print(f"{name:>12}: {median * 1000:8.1f} ms ({per_user:.1f} us/user)")
+    ratios = [
+        template / legacy
+        for legacy, template in zip(
+            samples["hand-written"], samples["templates"], strict=True
+        )
+    ]
+    print(f"{'ratio':>12}: {statistics.median(ratios):8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
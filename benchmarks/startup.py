@@ -0,0 +1,70 @@
+"""Startup benchmark for the github2md CLI.
+
+Runs ``python -X importtime -c "import <module>"`` in fresh interpreters and
+reports the median cumulative import time, plus the slowest modules of the
+last run. With --max-ms it exits non-zero when the median exceeds the
+budget, so CI can catch import-time regressions.
+
+Usage:
+    python benchmarks/startup.py [--runs 10] [--module github2md.cli] [--max-ms 60]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Return the cumulative import time (us) of every module imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument("--module", default="github2md.cli")
+    parser.add_argument("--runs", type=positive_int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    samples = [times[args.module] / 1000 for times in runs]
+    times = runs[-1]
+    median = statistics.median(samples)
+
+    print(f"{args.module}: median {median:.1f} ms over {args.runs} runs")
+    print(f"  min {min(samples):.1f} ms, max {max(samples):.1f} ms")
+    print("Slowest imports (cumulative, last run):")
+    del times[args.module]
+    slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)
+    for name, micros in slowest[: args.top]:
+        print(f"  {micros / 1000:7.1f} ms  {name}")
+
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"FAIL: median {median:.1f} ms exceeds {args.max_ms} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,16 @@
 """github2md - Convert GitHub profile data to Markdown."""
 
-try:
-    from importlib.metadata import version
 
-    __version__ = version("github2md")
-except Exception:
-    __version__ = "0.1.0"
+def __getattr__(name: str) -> str:
+    # __version__ is resolved on first use: importlib.metadata is slow to
+    # import and most invocations never need it.
+    if name == "__version__":
+        try:
+            from importlib.metadata import version
+
+            value = version("github2md")
+        except Exception:
+            value = "0.1.0"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,265 @@
+"""asyncio-native extraction through the gh CLI."""
+
+import asyncio
+import sys
+from collections.abc import Awaitable, Callable
+from datetime import date
+from typing import Any
+
+from .cache import CachingTransport, ResponseCache, _conditional
+from .constants import (
+    DEFAULT_ASYNC_CONCURRENCY,
+    DEFAULT_EXTRACT_WORKERS,
+    RATE_LIMIT_MAX_RETRIES,
+    REPOS_PAGE_SIZE,
+)
+from .extractor import (
+    CONTRIBUTIONS_QUERY,
+    GitHubExtractor,
+    _next_page_url,
+    compact_contributions,
+    graphql_body,
+    raise_for_status,
+)
+from .protocols import AsyncApiTransport, AsyncDataExtractor, DualApiTransport
+from .ratelimit import RateLimitedTransport, RateLimiter, is_rate_limited, resource_for
+from .transport import ApiResponse, GhCliTransport
+
+
+class AsyncGhCliTransport(GhCliTransport, AsyncApiTransport):
+    """Run ``gh api`` as asyncio subprocesses.
+
+    A semaphore bounds how many gh processes run at once, so any number of
+    coroutines can issue requests on one event loop. The synchronous
+    ``request`` inherited from GhCliTransport keeps working.
+    """
+
+    def __init__(
+        self, token: str | None = None, concurrency: int = DEFAULT_ASYNC_CONCURRENCY
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        super().__init__(token)
+        self._concurrency = concurrency
+        self._semaphores: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore of the running loop (they are loop-bound)."""
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            for known in [k for k in self._semaphores if k.is_closed()]:
+                del self._semaphores[known]
+            self._semaphores[loop] = asyncio.Semaphore(self._concurrency)
+        return self._semaphores[loop]
+
+    async def request_async(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> ApiResponse:
+        args, stdin = self._command(method, path, body, headers)
+        async with self._semaphore():
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=asyncio.subprocess.PIPE if stdin else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=self._env(),
+            )
+            stdout, stderr = await process.communicate(stdin)
+        return self._response(stdout, stderr)
+
+
+class AsyncRateLimitedTransport(RateLimitedTransport, DualApiTransport):
+    """RateLimitedTransport that also paces coroutines.
+
+    Coroutines wait for their slot with asyncio.sleep instead of blocking
+    the event loop; threads and coroutines share one limiter, so both kinds
+    of requests draw on the same budgets and pause together on backoff.
+    """
+
+    def __init__(
+        self,
+        inner: DualApiTransport,
+        limiter: RateLimiter,
+        max_retries: int = RATE_LIMIT_MAX_RETRIES,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        super().__init__(inner, limiter, max_retries)
+        self._async_inner = inner
+        self._async_sleep = sleep
+
+    async def request_async(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> ApiResponse:
+        resource = resource_for(path)
+        attempt = 0
+        while True:
+            wait = self._limiter.reserve(resource)
+            if wait > 0:
+                await self._async_sleep(wait)
+            response = await self._async_inner.request_async(
+                method, path, body=body, headers=headers
+            )
+            self._limiter.update(resource, response.headers)
+            if not is_rate_limited(response, resource) or attempt >= self._max_retries:
+                return response
+            self._limiter.backoff(resource, response.headers, attempt)
+            attempt += 1
+
+
+class AsyncCachingTransport(CachingTransport, DualApiTransport):
+    """CachingTransport that also serves and revalidates for coroutines."""
+
+    def __init__(self, inner: DualApiTransport, cache: ResponseCache) -> None:
+        super().__init__(inner, cache)
+        self._async_inner = inner
+
+    async def request_async(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> ApiResponse:
+        if method != "GET" or body is not None:
+            return await self._async_inner.request_async(
+                method, path, body=body, headers=headers
+            )
+        key = f"GET {path}"
+        entry, cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = await self._async_inner.request_async(
+            method, path, headers=_conditional(entry, headers)
+        )
+        return self._settle(key, entry, response)
+
+
+def create_async_transport(
+    token: str | None = None,
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+    concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+) -> DualApiTransport:
+    """Create a paced, optionally cached gh transport for coroutines.
+
+    The asyncio counterpart of ``create_transport``: requests are paced by
+    limiter (a fresh RateLimiter if None) and cache hits are served before
+    reaching it.
+    """
+    api: DualApiTransport = AsyncRateLimitedTransport(
+        AsyncGhCliTransport(token, concurrency), limiter or RateLimiter()
+    )
+    if cache is not None:
+        api = AsyncCachingTransport(api, cache)
+    return api
+
+
+class AsyncGitHubExtractor(GitHubExtractor, AsyncDataExtractor):
+    """Extract GitHub data with coroutines instead of threads.
+
+    ``extract_async`` gathers all sections on the running loop; the
+    synchronous ``extract`` is a thin wrapper that runs it with asyncio.run.
+    Without a transport, requests go through ``create_async_transport``
+    and so are paced by a rate limiter.
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        transport: DualApiTransport | None = None,
+        max_workers: int = DEFAULT_EXTRACT_WORKERS,
+        since: date | None = None,
+        data_cache: ResponseCache | None = None,
+        languages: bool = False,
+    ):
+        self._async_transport = transport or create_async_transport(token)
+        super().__init__(
+            token, max_workers, self._async_transport, since, data_cache, languages
+        )
+
+    def extract(self, username: str) -> dict[str, Any]:
+        """Extract all GitHub data for a user."""
+        return asyncio.run(self.extract_async(username))
+
+    async def extract_async(self, username: str) -> dict[str, Any]:
+        """Extract all GitHub data for a user, fetching sections concurrently.
+
+        The sections are those of GitHubExtractor (``_section_fetchers``), so
+        both produce the same data. Sections with a coroutine version run on
+        the loop; the others run in worker threads, through the same
+        transport and so the same rate limiter and cache.
+        """
+        fetchers = self._section_fetchers(username)
+        native = self._async_fetchers(username)
+        results = await asyncio.gather(
+            *(
+                native[key]() if key in native else asyncio.to_thread(fetch)
+                for key, fetch in fetchers.items()
+            ),
+            return_exceptions=True,
+        )
+        return self._merge_sections(username, dict(zip(fetchers, results, strict=True)))
+
+    def _async_fetchers(self, username: str) -> dict[str, Callable[[], Awaitable[Any]]]:
+        """Map raw data keys to coroutine versions of their fetchers.
+
+        With languages, the repository list is shared with the languages
+        section, and with since, contributions are a multi-year history;
+        both then keep their synchronous fetchers.
+        """
+        fetchers: dict[str, Callable[[], Awaitable[Any]]] = {
+            "profile": lambda: self._get_profile_async(username),
+        }
+        if not self._languages:
+            fetchers["repos"] = lambda: self._get_repos_async(username)
+        if self._since is None:
+            fetchers["contributions"] = lambda: self._get_contributions_async(username)
+        return fetchers
+
+    async def _request_async(
+        self, method: str, path: str, body: Any = None
+    ) -> ApiResponse:
+        """Send a request and raise RuntimeError for error responses."""
+        response = await self._async_transport.request_async(method, path, body=body)
+        return raise_for_status(response)
+
+    async def _get_profile_async(self, username: str) -> list[dict[str, Any]]:
+        response = await self._request_async("GET", f"/users/{username}")
+        return [response.json()]
+
+    async def _get_repos_async(self, username: str) -> list[list[dict[str, Any]]]:
+        """Get all repository pages, following Link headers."""
+        pages: list[list[dict[str, Any]]] = []
+        endpoint: str | None = f"/users/{username}/repos?per_page={REPOS_PAGE_SIZE}"
+        try:
+            while endpoint:
+                response = await self._request_async("GET", endpoint)
+                page = response.json()
+                if not isinstance(page, list) or not page:
+                    break
+                pages.append(page)
+                endpoint = _next_page_url(response.headers.get("link"))
+        except Exception as e:
+            if pages:
+                print(f"Warning: Section 'repos' truncated: {e}", file=sys.stderr)
+        return pages
+
+    async def _get_contributions_async(self, username: str) -> dict[str, Any]:
+        body = graphql_body(CONTRIBUTIONS_QUERY, {"login": username})
+        try:
+            response = await self._request_async("POST", "graphql", body)
+            user = response.json().get("data", {}).get("user", {})
+            return compact_contributions(user.get("contributionsCollection", {}))
+        except Exception:
+            return {}
@@ -0,0 +1,196 @@
+"""Export many users concurrently with shared dependencies."""
+
+import contextlib
+import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .constants import DEFAULT_ASYNC_CONCURRENCY, DEFAULT_BATCH_WORKERS
+from .converter import GitHubToMarkdownConverter
+from .manifest import Manifest
+from .protocols import AsyncDataExtractor, DataExtractor
+from .writer import MarkdownFileWriter
+
+if TYPE_CHECKING:
+    from .bundle import Bundle
+
+# GitHub logins: alphanumerics and single hyphens, at most 39 characters.
+_USERNAME_RE = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9]|-(?=[A-Za-z0-9])){0,38}$")
+
+
+@dataclass(slots=True)
+class BatchResult:
+    """Outcome of exporting one user."""
+
+    username: str
+    files: list[Path] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(slots=True, frozen=True)
+class ExportConfig:
+    """How each user of a batch is rendered.
+
+    With a bundle, users are written into it under ``username/`` instead of
+    into subdirectories; incremental and fsync do not apply then.
+    """
+
+    incremental: bool = False
+    options: dict[str, Any] = field(default_factory=dict)
+    fsync: bool = False
+    bundle: "Bundle | None" = None
+
+
+def read_usernames(lines: Iterable[str]) -> list[str]:
+    """Collect usernames, one per line or whitespace separated.
+
+    Blank lines and ``#`` comments are ignored; duplicates keep their first
+    position.
+    """
+    usernames: dict[str, None] = {}
+    for line in lines:
+        for name in line.split("#", 1)[0].split():
+            usernames.setdefault(name, None)
+    return list(usernames)
+
+
+def _describe(error: Exception) -> str:
+    """Describe a failure; unexpected exception types are named."""
+    if isinstance(error, (ValueError, RuntimeError, OSError)):
+        return str(error)
+    return f"{type(error).__name__}: {error}"
+
+
+def _converter(
+    extractor: DataExtractor | AsyncDataExtractor,
+    user_dir: Path,
+    config: ExportConfig | None,
+) -> GitHubToMarkdownConverter:
+    config = config or ExportConfig()
+    if config.bundle is not None:
+        bundled = config.bundle.writer(f"{user_dir.name}/")
+        return GitHubToMarkdownConverter(extractor, bundled, options=config.options)
+    writer = MarkdownFileWriter(user_dir, config.fsync)
+    manifest = Manifest(user_dir) if config.incremental else None
+    return GitHubToMarkdownConverter(
+        extractor, writer, manifest, options=config.options
+    )
+
+
+def export_user(
+    username: str,
+    output_dir: Path,
+    extractor: DataExtractor,
+    config: ExportConfig | None = None,
+) -> BatchResult:
+    """Export one user into output_dir/username, capturing any failure.
+
+    Any exception is recorded in the user's result, so that one user's
+    unexpected data cannot abort a batch.
+    """
+    if not _USERNAME_RE.match(username):
+        return BatchResult(username, error="Invalid username")
+    user_dir = output_dir / username
+    try:
+        converter = _converter(extractor, user_dir, config)
+        return BatchResult(username, files=converter.convert(username))
+    except Exception as e:
+        with contextlib.suppress(OSError):
+            user_dir.rmdir()  # only succeeds if nothing was written
+        return BatchResult(username, error=_describe(e))
+
+
+async def export_user_async(
+    username: str,
+    output_dir: Path,
+    extractor: DataExtractor | AsyncDataExtractor,
+    config: ExportConfig | None = None,
+) -> BatchResult:
+    """Export one user like export_user, on the running event loop."""
+    if not _USERNAME_RE.match(username):
+        return BatchResult(username, error="Invalid username")
+    user_dir = output_dir / username
+    try:
+        converter = _converter(extractor, user_dir, config)
+        return BatchResult(username, files=await converter.convert_async(username))
+    except Exception as e:
+        with contextlib.suppress(OSError):
+            user_dir.rmdir()  # only succeeds if nothing was written
+        return BatchResult(username, error=_describe(e))
+
+
+async def export_batch_async(
+    usernames: list[str],
+    output_dir: Path,
+    extractor: DataExtractor | AsyncDataExtractor,
+    concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    config: ExportConfig | None = None,
+) -> list[BatchResult]:
+    """Export users as coroutines on one event loop.
+
+    At most ``concurrency`` users are in flight at once; with an
+    AsyncGitHubExtractor their requests are multiplexed without threads.
+
+    Returns:
+        One result per username, in input order.
+    """
+    import asyncio
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(username: str) -> BatchResult:
+        async with semaphore:
+            return await export_user_async(username, output_dir, extractor, config)
+
+    return await asyncio.gather(*(bounded(name) for name in usernames))
+
+
+def export_batch(
+    usernames: list[str],
+    output_dir: Path,
+    extractor: DataExtractor,
+    workers: int = DEFAULT_BATCH_WORKERS,
+    config: ExportConfig | None = None,
+) -> list[BatchResult]:
+    """Export users on a pool of workers sharing one extractor.
+
+    The extractor (and so its transport, cache and rate limiter) is shared
+    by all workers; each user is written to its own subdirectory.
+
+    Returns:
+        One result per username, in input order.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(export_user, name, output_dir, extractor, config)
+            for name in usernames
+        ]
+        results = []
+        for future in futures:
+            result = future.result()
+            status = "done" if result.ok else f"failed: {result.error}"
+            print(f"[{len(results) + 1}/{len(futures)}] {result.username} {status}")
+            results.append(result)
+    return results
+
+
+def print_summary(results: list[BatchResult], output_dir: Path) -> None:
+    """Print a per-user success/failure summary."""
+    succeeded = sum(result.ok for result in results)
+    print(f"\nExported {succeeded}/{len(results)} users to {output_dir}/")
+    for result in results:
+        if result.ok:
+            print(f"  ok    {result.username} ({len(result.files)} files)")
+        else:
+            print(f"  FAIL  {result.username}: {result.error}")
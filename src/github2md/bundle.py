@@ -0,0 +1,238 @@
+"""Single-file output: every section of one or many exports in one bundle."""
+
+import io
+import os
+import re
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from pathlib import Path
+from typing import IO, Self
+
+from .protocols import StreamingOutputWriter
+
+
+class Bundle(ABC):
+    """A file collecting sections under member names like ``alice/profile.md``.
+
+    The bundle is built in a temporary file that replaces ``path`` on
+    close, and is discarded if the ``with`` block raises. Members may be
+    added from several threads.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = path.with_name(f".{path.name}.tmp")
+        self._lock = threading.Lock()
+        self._closed = False
+        self._open(self._tmp)
+
+    def writer(self, prefix: str = "") -> "BundleWriter":
+        """Return a writer adding sections under prefix (e.g. ``"alice/"``)."""
+        return BundleWriter(self, prefix)
+
+    def add(self, name: str, content: str) -> None:
+        """Add a member.
+
+        Raises:
+            ValueError: If the bundle is closed.
+        """
+        data = content.encode("utf-8")
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"Bundle is closed: {self.path}")
+            self._add(name, data)
+
+    def close(self) -> None:
+        """Finish the bundle and move it into place."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._finish()
+        os.replace(self._tmp, self.path)
+
+    def discard(self) -> None:
+        """Abandon the bundle, leaving any previous file at path in place."""
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._abort()
+        self._tmp.unlink(missing_ok=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    @abstractmethod
+    def _open(self, tmp: Path) -> None:
+        """Start writing the bundle to tmp."""
+
+    @abstractmethod
+    def _add(self, name: str, data: bytes) -> None:
+        """Write one member (called under the lock)."""
+
+    @abstractmethod
+    def _finish(self) -> None:
+        """Complete and close the file at tmp."""
+
+    def _abort(self) -> None:
+        self._finish()
+
+
+class ZipBundle(Bundle):
+    """Sections as members of a deflated zip archive."""
+
+    def _open(self, tmp: Path) -> None:
+        self._zip = zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED)
+
+    def _add(self, name: str, data: bytes) -> None:
+        info = zipfile.ZipInfo(name, time.localtime()[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+        self._zip.writestr(info, data)
+
+    def _finish(self) -> None:
+        self._zip.close()
+
+
+class TarBundle(Bundle):
+    """Sections as members of a gzip-compressed tar archive."""
+
+    def _open(self, tmp: Path) -> None:
+        self._tar = tarfile.open(tmp, "w:gz")
+
+    def _add(self, name: str, data: bytes) -> None:
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        self._tar.addfile(info, io.BytesIO(data))
+
+    def _finish(self) -> None:
+        self._tar.close()
+
+
+class MarkdownBundle(Bundle):
+    """Sections concatenated into one Markdown document with a contents list.
+
+    Sections are spooled to a temporary file as they arrive and laid out
+    sorted by member name on close, so the document does not depend on the
+    order in which exports finished.
+    """
+
+    def _open(self, tmp: Path) -> None:
+        self._body: IO[bytes] = tempfile.TemporaryFile(dir=tmp.parent)
+        self._members: list[tuple[str, int, int]] = []  # name, offset, size
+
+    def _add(self, name: str, data: bytes) -> None:
+        self._members.append((name, self._body.tell(), len(data)))
+        self._body.write(data)
+
+    def _finish(self) -> None:
+        members = sorted(self._members)
+        anchors = _anchors([name for name, _, _ in members])
+        try:
+            with self._tmp.open("wb") as out:
+                out.write(b"# Contents\n\n")
+                for (name, _, _), anchor in zip(members, anchors, strict=True):
+                    out.write(f"- [{name}](#{anchor})\n".encode())
+                for (_, offset, size), anchor in zip(members, anchors, strict=True):
+                    out.write(f'\n---\n\n<a id="{anchor}"></a>\n\n'.encode())
+                    self._body.seek(offset)
+                    out.write(self._body.read(size))
+        finally:
+            self._body.close()
+
+    def _abort(self) -> None:
+        self._body.close()
+
+
+def _anchors(names: list[str]) -> list[str]:
+    """Unique HTML ids for member names."""
+    seen: set[str] = set()
+    anchors = []
+    for name in names:
+        base = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "section"
+        anchor, n = base, 1
+        while anchor in seen:
+            n += 1
+            anchor = f"{base}-{n}"
+        seen.add(anchor)
+        anchors.append(anchor)
+    return anchors
+
+
+BUNDLE_TYPES: dict[str, type[Bundle]] = {
+    "zip": ZipBundle,
+    "tar.gz": TarBundle,
+    "md": MarkdownBundle,
+}
+
+
+def open_bundle(path_stem: Path, kind: str) -> Bundle:
+    """Open a bundle of kind (a BUNDLE_TYPES key, also its extension).
+
+    Raises:
+        ValueError: If kind is unknown.
+    """
+    if kind not in BUNDLE_TYPES:
+        raise ValueError(f"Unknown bundle format: {kind}")
+    return BUNDLE_TYPES[kind](path_stem.with_name(f"{path_stem.name}.{kind}"))
+
+
+class BundleWriter(StreamingOutputWriter):
+    """Write sections of one export into a shared Bundle.
+
+    Sections are held until ``flush()``, which the converter calls once
+    the export is complete, so a failed export adds nothing to the bundle.
+    """
+
+    def __init__(self, bundle: Bundle, prefix: str = "") -> None:
+        self._bundle = bundle
+        self._prefix = prefix
+        self._sections: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _member(self, filename: str) -> str:
+        """Return the member name for filename.
+
+        Raises:
+            ValueError: If filename is absolute or leaves the prefix.
+        """
+        if (
+            "\x00" in filename
+            or ".." in filename
+            or filename.startswith(("/", "\\"))
+            or (len(filename) > 1 and filename[1] == ":")
+        ):
+            raise ValueError(f"Invalid filename: {filename}")
+        if not filename.endswith(".md"):
+            filename = f"{filename}.md"
+        return f"{self._prefix}{filename}"
+
+    def write(self, filename: str, content: str) -> Path:
+        member = self._member(filename)
+        with self._lock:
+            self._sections[member] = content
+        return Path(member)
+
+    def write_chunks(self, filename: str, chunks: Iterable[str]) -> Path:
+        return self.write(filename, "".join(chunks))
+
+    def flush(self) -> None:
+        """Add the sections written so far to the bundle, by member name."""
+        with self._lock:
+            sections, self._sections = self._sections, {}
+        for member in sorted(sections):
+            self._bundle.add(member, sections[member])
@@ -0,0 +1,235 @@
+"""Persistent on-disk cache for GitHub API responses."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .constants import CACHED_HEADERS, DEFAULT_CACHE_MAX_BYTES, DEFAULT_CACHE_TTL
+from .protocols import ApiTransport
+from .transport import ApiResponse
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory ($XDG_CACHE_HOME/github2md)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "github2md"
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters describing how a cache has been used."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """A cached response body with its validators."""
+
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+    permanent: bool = False
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+
+class ResponseCache:
+    """Key/value store of responses on disk with TTL and LRU eviction.
+
+    Each entry is one file: a JSON metadata line followed by the raw body.
+    Eviction removes the least recently used entries once the total size
+    exceeds ``max_bytes``; a file's mtime carries its last use across runs.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl: float = DEFAULT_CACHE_TTL,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._dir = cache_dir
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        # LRU order (oldest first) and size of every entry; persisted across
+        # runs through each file's mtime.
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        files = [(p.stat(), p.name) for p in self._dir.glob("*.entry")]
+        for stat, name in sorted(files, key=lambda f: f[0].st_mtime_ns):
+            self._entries[name] = stat.st_size
+        self.stats = CacheStats()
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self._dir / f"{digest}.entry"
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether an entry is permanent or young enough to use as is."""
+        return entry.permanent or self._clock() - entry.stored_at < self._ttl
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for key, marking it as recently used."""
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            if path.name in self._entries:
+                self._entries.move_to_end(path.name)
+        return CacheEntry(
+            meta["headers"], body, meta["stored_at"], meta.get("permanent", False)
+        )
+
+    def put(
+        self, key: str, headers: dict[str, str], body: bytes, permanent: bool = False
+    ) -> CacheEntry:
+        """Store a body and its validators under key.
+
+        Permanent entries, for data that can no longer change, never go
+        stale (they can still be evicted).
+        """
+        entry = CacheEntry(headers, body, self._clock(), permanent)
+        meta = json.dumps(
+            {
+                "key": key,
+                "headers": headers,
+                "stored_at": entry.stored_at,
+                "permanent": permanent,
+            }
+        )
+        path = self._path(key)
+        fd, tmp = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(meta.encode() + b"\n")
+            f.write(body)
+        os.replace(tmp, path)
+
+        with self._lock:
+            self._entries[path.name] = path.stat().st_size
+            self._entries.move_to_end(path.name)
+            self.stats.stores += 1
+            self._evict()
+        return entry
+
+    def record(self, *events: str) -> None:
+        """Increment the named CacheStats counters (thread-safe)."""
+        with self._lock:
+            for event in events:
+                setattr(self.stats, event, getattr(self.stats, event) + 1)
+
+    def refresh(self, key: str, entry: CacheEntry) -> CacheEntry:
+        """Restart an entry's TTL after a successful revalidation."""
+        return self.put(key, entry.headers, entry.body)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under max_bytes."""
+        total = sum(self._entries.values())
+        while total > self._max_bytes and len(self._entries) > 1:
+            name, size = self._entries.popitem(last=False)
+            (self._dir / name).unlink(missing_ok=True)
+            total -= size
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            for path in self._dir.glob("*.entry"):
+                path.unlink(missing_ok=True)
+            self._entries.clear()
+
+
+class CachingTransport(ApiTransport):
+    """Serve GET requests from a ResponseCache, revalidating with ETags.
+
+    Fresh entries are returned without a request. Stale entries are
+    revalidated with If-None-Match / If-Modified-Since; a 304 answer costs
+    no rate limit and reuses the cached body.
+    """
+
+    def __init__(self, inner: ApiTransport, cache: ResponseCache) -> None:
+        self._inner = inner
+        self._cache = cache
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> ApiResponse:
+        if method != "GET" or body is not None:
+            return self._inner.request(method, path, body=body, headers=headers)
+        key = f"GET {path}"
+        entry, cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = self._inner.request(
+            method, path, headers=_conditional(entry, headers)
+        )
+        return self._settle(key, entry, response)
+
+    def _lookup(self, key: str) -> tuple[CacheEntry | None, ApiResponse | None]:
+        """Return the entry for key, and the response to serve if it is fresh."""
+        entry = self._cache.get(key)
+        if entry is not None and self._cache.is_fresh(entry):
+            self._cache.record("hits")
+            return entry, ApiResponse(200, entry.headers, entry.body)
+        return entry, None
+
+    def _settle(
+        self, key: str, entry: CacheEntry | None, response: ApiResponse
+    ) -> ApiResponse:
+        """Store or refresh the entry for key from the network's response."""
+        if response.status == 304 and entry is not None:
+            self._cache.record("hits", "revalidated")
+            entry = self._cache.refresh(key, entry)
+            return ApiResponse(200, entry.headers, entry.body)
+
+        self._cache.record("misses")
+        if response.status == 200:
+            kept = {k: v for k, v in response.headers.items() if k in CACHED_HEADERS}
+            self._cache.put(key, kept, response.body)
+        return response
+
+
+def _conditional(
+    entry: CacheEntry | None, headers: dict[str, str] | None
+) -> dict[str, str]:
+    """Request headers revalidating entry (if any) on top of headers."""
+    conditional = dict(headers or {})
+    if entry is not None and entry.etag:
+        conditional["If-None-Match"] = entry.etag
+    if entry is not None and entry.last_modified:
+        conditional["If-Modified-Since"] = entry.last_modified
+    return conditional
@@ -3,10 +3,23 @@
 import argparse
 import subprocess
 import sys
+from datetime import date
 from pathlib import Path
 
-from . import __version__
-from .converter import create_converter
+from .constants import (
+    BACKENDS,
+    BATCH_BUNDLE_NAME,
+    BUNDLE_FORMATS,
+    DEFAULT_BATCH_WORKERS,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_SORT_KEY,
+    SORT_KEYS,
+    TRANSPORT_NAMES,
+)
+from .protocols import ApiTransport, DataExtractor
+
+# Everything else is imported inside main() once arguments are parsed, so
+# --help, --version and usage errors stay fast.
 
 
 def get_authenticated_user():
@@ -23,16 +36,31 @@ def get_authenticated_user():
         return None
 
 
-def main():
-    """Main entry point for the CLI."""
+class _VersionAction(argparse.Action):
+    """Like action="version", but resolves the version only when asked."""
+
+    def __init__(self, option_strings: list[str], dest: str, **kwargs) -> None:
+        kwargs.setdefault("help", "show program's version number and exit")
+        super().__init__(option_strings, dest, nargs=0, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        from . import __version__
+
+        parser.exit(message=f"{parser.prog} {__version__}\n")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         prog="github2md",
         description="Convert GitHub profile data to Markdown for LLM analysis",
     )
     parser.add_argument(
-        "username",
-        nargs="?",
-        help="GitHub username (defaults to authenticated user)",
+        "usernames",
+        nargs="*",
+        metavar="username",
+        help="GitHub username(s) (defaults to authenticated user); several "
+        "usernames export each one into its own subdirectory",
     )
     parser.add_argument(
         "-o",
@@ -41,18 +69,169 @@ def main():
         default=Path("github_export"),
         help="Output directory (default: github_export)",
     )
+    parser.add_argument(
+        "--users-file",
+        type=argparse.FileType("r", encoding="utf-8"),
+        help="Read usernames from a file, one per line ('-' for stdin)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=DEFAULT_BATCH_WORKERS,
+        help="Users exported concurrently in batch mode "
+        f"(default: {DEFAULT_BATCH_WORKERS})",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="rest",
+        help="API used to fetch data: rest (one call per section) or "
+        "graphql (one batched query) (default: rest)",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORT_NAMES,
+        default="gh",
+        help="How requests are sent: gh (the gh CLI) or http (direct pooled "
+        "HTTPS connections, token from GH_TOKEN/GITHUB_TOKEN or gh) "
+        "(default: gh)",
+    )
+    parser.add_argument(
+        "--sort",
+        choices=SORT_KEYS,
+        default=DEFAULT_SORT_KEY,
+        help="How to rank the repositories listed (default: %(default)s; "
+        "score weighs forks twice as much as stars)",
+    )
+    parser.add_argument(
+        "--template-dir",
+        type=Path,
+        default=None,
+        help="Directory of custom section templates named like the files "
+        "they replace (e.g. repositories.md)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only rewrite sections whose data changed since the last export",
+    )
+    parser.add_argument(
+        "--fsync",
+        action="store_true",
+        help="Flush written files to disk before finishing each export",
+    )
+    parser.add_argument(
+        "--bundle",
+        choices=BUNDLE_FORMATS,
+        default=None,
+        help="Write everything into one file in the output directory: a zip "
+        "or tar.gz archive, or one Markdown document with a table of contents",
+    )
+    parser.add_argument(
+        "--languages",
+        action="store_true",
+        help="Also fetch the language bytes of every non-fork repository for "
+        "a byte-weighted breakdown in languages.md (one request per "
+        "repository pushed to since the last run)",
+    )
+    history = parser.add_mutually_exclusive_group()
+    history.add_argument(
+        "--years",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Contribution history of this and the N-1 previous calendar years "
+        "(default: the last 12 months)",
+    )
+    history.add_argument(
+        "--since",
+        type=_iso_date,
+        default=None,
+        metavar="YYYY-MM-DD",
+        help="Contribution history since a date",
+    )
+    parser.add_argument(
+        "--org",
+        default=None,
+        help="Export every member of an organization into its own "
+        "subdirectory, plus an org summary (repositories and contributors)",
+    )
+    snapshots = parser.add_mutually_exclusive_group()
+    snapshots.add_argument(
+        "--save-snapshot",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Also save the raw data of each user to DIR, for --from-snapshot",
+    )
+    snapshots.add_argument(
+        "--from-snapshot",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Render each user's latest snapshot from DIR instead of fetching "
+        "(without usernames: every user in DIR)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk response cache",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Response cache directory (default: ~/.cache/github2md)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        help="Seconds a cached response is used before being revalidated "
+        f"(default: {DEFAULT_CACHE_TTL:g})",
+    )
     parser.add_argument(
         "-v",
         "--version",
-        action="version",
-        version=f"%(prog)s {__version__}",
+        action=_VersionAction,
     )
+    return parser
+
+
+def main():
+    """Main entry point for the CLI."""
+    args = _build_parser().parse_args()
+    if args.bundle and args.incremental:
+        print("Error: --incremental cannot be used with --bundle", file=sys.stderr)
+        sys.exit(1)
+    if args.org and (args.usernames or args.users_file):
+        print("Error: --org cannot be used with usernames", file=sys.stderr)
+        sys.exit(1)
+    if args.org and (args.save_snapshot or args.from_snapshot):
+        print("Error: --org cannot be used with snapshots", file=sys.stderr)
+        sys.exit(1)
+
+    from .batch import read_usernames
+    from .cache import ResponseCache, default_cache_dir
+    from .converter import create_extractor, create_transport
+    from .probe import PROBES_FILENAME, ProbeCache, authenticated_user, gh_version
 
-    args = parser.parse_args()
+    cache_dir = args.cache_dir or default_cache_dir()
+    probes = ProbeCache(None if args.no_cache else cache_dir / PROBES_FILENAME)
 
-    username = args.username
-    if not username:
-        username = get_authenticated_user()
+    usernames = read_usernames(args.usernames)
+    batch = args.users_file is not None or len(usernames) > 1
+    if args.users_file is not None:
+        with args.users_file:
+            usernames = read_usernames([*args.usernames, *args.users_file])
+
+    if args.from_snapshot is not None:
+        _replay_snapshots(usernames, batch, args)
+        return
+
+    if not usernames and not batch and not args.org:
+        username = authenticated_user(probes, get_authenticated_user)
         if not username:
             print(
                 "Error: No username provided and not authenticated.",
@@ -61,23 +240,212 @@ def main():
             print("Run 'gh auth login' first.", file=sys.stderr)
             sys.exit(1)
         print(f"Using authenticated user: {username}")
+        usernames = [username]
 
-    try:
-        subprocess.run(["gh", "--version"], capture_output=True, check=True)
-    except FileNotFoundError:
+    if args.transport == "gh" and gh_version(probes) is None:
         print("Error: gh CLI not found.", file=sys.stderr)
         sys.exit(1)
 
+    _apply_template_dir(args)
+
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(cache_dir, args.cache_ttl)
+
+    try:
+        api = create_transport(args.transport, cache)
+        extractor: DataExtractor = create_extractor(
+            args.backend,
+            api,
+            cache,
+            since=_history_start(args),
+            languages=args.languages,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if args.org:
+        failed = _export_org(args.org, api, extractor, args)
+    else:
+        if args.save_snapshot is not None:
+            from .snapshot import RecordingExtractor, SnapshotStore
+
+            store = SnapshotStore(args.save_snapshot)
+            extractor = RecordingExtractor(extractor, store)
+        failed = _export(usernames, batch, extractor, args)
+
+    if cache is not None:
+        stats = cache.stats
+        print(
+            f"Cache: {stats.hits} hits ({stats.revalidated} revalidated), "
+            f"{stats.misses} misses"
+        )
+    if failed:
+        sys.exit(1)
+
+
+def _iso_date(value: str) -> date:
+    try:
+        result = date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date: {value!r}") from None
+    if result > date.today():
+        raise argparse.ArgumentTypeError(f"date is in the future: {value!r}")
+    return result
+
+
+def _history_start(args: argparse.Namespace) -> date | None:
+    """Return the start of the contribution history (None: the last year).
+
+    Raises:
+        ValueError: If --years is less than 1.
+    """
+    if args.years is not None:
+        from .history import since_years
+
+        return since_years(args.years, date.today())
+    return args.since
+
+
+def _apply_template_dir(args: argparse.Namespace) -> None:
+    """Use --template-dir, exiting if it is not a directory."""
+    if args.template_dir is None:
+        return
+    if not args.template_dir.is_dir():
+        print(f"Error: Not a directory: {args.template_dir}", file=sys.stderr)
+        sys.exit(1)
+    from .templates import set_template_dir
+
+    set_template_dir(args.template_dir)
+
+
+def _replay_snapshots(
+    usernames: list[str], batch: bool, args: argparse.Namespace
+) -> None:
+    """Export users from saved snapshots, without gh or network access."""
+    from .snapshot import SnapshotExtractor, SnapshotStore
+
+    store = SnapshotStore(args.from_snapshot)
+    if not usernames and not batch:
+        usernames = store.usernames()
+        batch = len(usernames) != 1
+    _apply_template_dir(args)
+    if _export(usernames, batch, SnapshotExtractor(store), args):
+        sys.exit(1)
+
+
+def _export(
+    usernames: list[str],
+    batch: bool,
+    extractor: DataExtractor,
+    args: argparse.Namespace,
+) -> bool:
+    """Export one user or a batch; return whether any user failed.
+
+    Exits on errors that stop the whole export.
+    """
     try:
-        converter = create_converter(args.output)
-        print(f"Fetching GitHub data for: {username}")
+        if batch:
+            return _export_batch(usernames, extractor, args)
+        _export_single(usernames[0], extractor, args)
+        return False
+    except (ValueError, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _export_single(
+    username: str, extractor: DataExtractor, args: argparse.Namespace
+) -> None:
+    """Export one user directly into the output directory."""
+    from .converter import GitHubToMarkdownConverter
+    from .manifest import Manifest
+    from .writer import MarkdownFileWriter
+
+    options = {"sort": args.sort}
+    print(f"Fetching GitHub data for: {username}")
+    if args.bundle:
+        from .bundle import open_bundle
+
+        with open_bundle(args.output / username, args.bundle) as bundle:
+            converter = GitHubToMarkdownConverter(
+                extractor, bundle.writer(), options=options
+            )
+            files = converter.convert(username)
+        print(f"\nBundled {len(files)} files into {bundle.path}")
+    else:
+        writer = MarkdownFileWriter(args.output, args.fsync)
+        manifest = Manifest(args.output) if args.incremental else None
+        converter = GitHubToMarkdownConverter(
+            extractor, writer, manifest, options=options
+        )
         files = converter.convert(username)
         print(f"\nCreated {len(files)} files in {args.output}/")
-        for f in files:
-            print(f"  - {f.name}")
+    for f in files:
+        print(f"  - {f.name}")
+    if converter.unchanged:
+        print(f"Unchanged: {', '.join(converter.unchanged)}")
+
+
+def _export_batch(
+    usernames: list[str], extractor: DataExtractor, args: argparse.Namespace
+) -> bool:
+    """Export users into per-user subdirectories; return whether any failed."""
+    from .batch import ExportConfig, export_batch, print_summary
+
+    if not usernames:
+        raise ValueError("No usernames to export")
+    print(f"Exporting {len(usernames)} users with {args.workers} workers")
+    options = {"sort": args.sort}
+    if args.bundle:
+        from .bundle import open_bundle
+
+        with open_bundle(args.output / BATCH_BUNDLE_NAME, args.bundle) as bundle:
+            config = ExportConfig(options=options, bundle=bundle)
+            results = export_batch(
+                usernames, args.output, extractor, args.workers, config
+            )
+        print(f"Bundled into {bundle.path}")
+    else:
+        config = ExportConfig(args.incremental, options, args.fsync)
+        results = export_batch(usernames, args.output, extractor, args.workers, config)
+    print_summary(results, args.output)
+    return not all(result.ok for result in results)
+
+
+def _export_org(
+    org: str, api: ApiTransport, extractor: DataExtractor, args: argparse.Namespace
+) -> bool:
+    """Export an organization's members and summary; return whether any failed.
+
+    Exits if the organization's members cannot be listed.
+    """
+    from .batch import ExportConfig
+    from .org import OrgExtractor, export_org, print_org_summary
+
+    org_extractor = OrgExtractor(transport=api)
+    options = {"sort": args.sort}
+    print(f"Exporting organization {org} with {args.workers} workers")
+    try:
+        if args.bundle:
+            from .bundle import open_bundle
+
+            with open_bundle(args.output / org, args.bundle) as bundle:
+                config = ExportConfig(options=options, bundle=bundle)
+                summary, results = export_org(
+                    org, args.output, org_extractor, extractor, args.workers, config
+                )
+            print(f"Bundled into {bundle.path}")
+        else:
+            config = ExportConfig(args.incremental, options, args.fsync)
+            summary, results = export_org(
+                org, args.output, org_extractor, extractor, args.workers, config
+            )
     except (ValueError, RuntimeError) as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    print_org_summary(summary, results, args.output)
+    return not (summary.ok and all(result.ok for result in results))
 
 
 if __name__ == "__main__":
@@ -13,12 +13,75 @@ MAX_STARRED = 50
 MAX_TOPICS = 30
 MAX_GISTS = 20
 MAX_ORGS = 20
+MAX_ORG_CONTRIBUTORS = 30
+MAX_ORG_CONTRIBUTOR_REPOS = 100  # most-starred repos whose contributors are counted
+
+# Extraction backends and transports (see converter.EXTRACTOR_BACKENDS/TRANSPORTS)
+BACKENDS = ("rest", "graphql")
+TRANSPORT_NAMES = ("gh", "http")
+
+# Repository rankings (see ranking.RANKING_KEYS)
+SORT_KEYS = ("stars", "forks", "updated", "score")
+DEFAULT_SORT_KEY = "stars"
+SCORE_STAR_WEIGHT = 1.0
+SCORE_FORK_WEIGHT = 2.0
+
+# API endpoints
+DEFAULT_API_URL = "https://api.github.com"
+GITHUB_API_VERSION = "2022-11-28"
+
+# HTTP transport
+DEFAULT_HTTP_POOL_SIZE = 8
+DEFAULT_HTTP_TIMEOUT = 30.0
+
+# Response cache
+DEFAULT_CACHE_TTL = 3600.0
+DEFAULT_CACHE_MAX_BYTES = 100 * 1024 * 1024
+CACHED_HEADERS = {"etag", "last-modified", "link", "content-type"}
+
+# Rate limiting
+RATE_LIMIT_MAX_RETRIES = 5
+RATE_LIMIT_PACING_THRESHOLD = 0.1
+RATE_LIMIT_BACKOFF_BASE = 1.0
+RATE_LIMIT_BACKOFF_MAX = 300.0
+RATE_LIMIT_RESET_GRACE = 1.0
+RATE_LIMIT_NOTICE_AFTER = 5.0
+
+# REST page size (GitHub maximum)
+REPOS_PAGE_SIZE = 100
+
+# GraphQL search page size (GitHub maximum per connection)
+SEARCH_PAGE_SIZE = 100
+
+# Bytes decoded at a time when streaming JSON array responses
+JSON_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Extraction concurrency
+DEFAULT_EXTRACT_WORKERS = 3
+
+# Sections parsed, formatted and written at once by the converter
+DEFAULT_RENDER_WORKERS = 4
+
+# Concurrent gh processes per asyncio transport
+DEFAULT_ASYNC_CONCURRENCY = 16
+
+# Batch export
+DEFAULT_BATCH_WORKERS = 4
+
+# Raw data snapshots (see snapshot.SnapshotStore)
+SNAPSHOT_SUFFIX = ".json.gz"
+SNAPSHOT_COMPRESS_LEVEL = 6  # gzip's default of 9 is much slower for little gain
+
+# Single-file output (see bundle.BUNDLE_TYPES); batches go to BATCH_BUNDLE_NAME
+BUNDLE_FORMATS = ("zip", "tar.gz", "md")
+BATCH_BUNDLE_NAME = "github2md"
 
 # Text truncation
 DEFAULT_TRUNCATE_LENGTH = 100
 
 # URL security
 ALLOWED_URL_SCHEMES = {"http", "https", "mailto"}
+URL_CACHE_SIZE = 4096  # sanitized URLs memoized by formatters
 
 # PR state icons
 PR_STATE_ICONS = {
@@ -32,3 +95,15 @@ ISSUE_STATE_ICONS = {
     "OPEN": "\U0001f7e2",
     "CLOSED": "\U0001f7e3",
 }
+
+# Contribution calendar (date.weekday() order)
+WEEKDAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+SPARKLINE_BLOCKS = "▁▂▃▄▅▆▇█"
@@ -1,63 +1,376 @@
 """Main orchestrator for GitHub to Markdown conversion."""
 
+import hashlib
+import itertools
 import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date
+from graphlib import TopologicalSorter
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from . import formatters, parsers  # noqa: F401
+from .cache import CachingTransport, ResponseCache
+from .constants import DEFAULT_RENDER_WORKERS
 from .extractor import GitHubExtractor
-from .protocols import DataExtractor, OutputWriter
+from .graphql import GitHubGraphQLExtractor
+from .manifest import Manifest, hash_text, section_hash
+from .protocols import (
+    ApiTransport,
+    AsyncDataExtractor,
+    DataExtractor,
+    FormatterRegistry,
+    OutputWriter,
+    ParserRegistry,
+    SectionFormatter,
+    SectionParser,
+    StreamingOutputWriter,
+    StreamingSectionFormatter,
+)
+from .ratelimit import RateLimitedTransport, RateLimiter
 from .registry import get_formatter_registry, get_parser_registry
+from .transport import GhCliTransport
 from .writer import MarkdownFileWriter
 
+EXTRACTOR_BACKENDS: dict[str, type[GitHubExtractor]] = {
+    "rest": GitHubExtractor,
+    "graphql": GitHubGraphQLExtractor,
+}
+
+
+def _http_transport() -> ApiTransport:
+    # Imported on demand: http.client pulls in ssl and email.
+    from .http_transport import HttpTransport
+
+    return HttpTransport()
+
+
+TRANSPORTS: dict[str, Callable[[], ApiTransport]] = {
+    "gh": GhCliTransport,
+    "http": _http_transport,
+}
+
+
+def _nonblank(chunks: Iterable[str]) -> Iterator[str] | None:
+    """Return chunks unchanged, or None if they are all blank."""
+    chunks = iter(chunks)
+    held: list[str] = []
+    for chunk in chunks:
+        held.append(chunk)
+        if chunk.strip():
+            return itertools.chain(held, chunks)
+    return None
+
+
+def _hashing(chunks: Iterable[str], update: Callable[[bytes], object]) -> Iterator[str]:
+    """Pass chunks through, feeding their UTF-8 encoding to update."""
+    for chunk in chunks:
+        update(chunk.encode("utf-8"))
+        yield chunk
+
+
+def _section_graph(
+    parsers: list[SectionParser], formatters: list[SectionFormatter]
+) -> dict[tuple[str, int], set[tuple[str, int]]]:
+    """Build the dependency graph of parse and format steps.
+
+    A section's formatter runs after its parser; parsers and formatters
+    run after the sections named in their optional ``depends_on``. Parsers
+    sharing a section key keep their registration order (the last wins).
+    Dependencies on sections nobody provides are ignored.
+    """
+    parsers_of: dict[str, list[int]] = {}
+    formatters_of: dict[str, list[int]] = {}
+    graph: dict[tuple[str, int], set[tuple[str, int]]] = {}
+    for i, parser in enumerate(parsers):
+        earlier = parsers_of.setdefault(parser.section_key, [])
+        graph[("parse", i)] = {("parse", j) for j in earlier}
+        earlier.append(i)
+    for i, formatter in enumerate(formatters):
+        formatters_of.setdefault(formatter.section_key, []).append(i)
+
+    for i, parser in enumerate(parsers):
+        for dep in getattr(parser, "depends_on", ()):
+            graph[("parse", i)].update(("parse", j) for j in parsers_of.get(dep, ()))
+    for i, formatter in enumerate(formatters):
+        needs = {("parse", j) for j in parsers_of.get(formatter.section_key, ())}
+        for dep in getattr(formatter, "depends_on", ()):
+            needs.update(("format", j) for j in formatters_of.get(dep, ()))
+        graph[("format", i)] = needs
+    return graph
+
 
 class GitHubToMarkdownConverter:
-    """Convert GitHub profile data to Markdown files."""
+    """Convert GitHub profile data to Markdown files.
+
+    With a manifest, sections whose input is unchanged since the last run
+    (and whose file is still intact) are neither formatted nor written;
+    their output filenames are listed in ``unchanged`` after convert.
+
+    Sections are streamed chunk by chunk when both the formatter and the
+    writer support it, so large sections are never held in memory whole.
+
+    Sections are parsed, formatted and written concurrently on up to
+    ``max_workers`` threads, ordered by the plugins' ``depends_on``.
+
+    options (e.g. ``{"sort": "forks"}``) are handed to parsers as
+    ``raw_data["options"]``.
+    """
 
-    def __init__(self, extractor: DataExtractor, writer: OutputWriter) -> None:
+    def __init__(
+        self,
+        extractor: DataExtractor | AsyncDataExtractor,
+        writer: OutputWriter,
+        manifest: Manifest | None = None,
+        max_workers: int = DEFAULT_RENDER_WORKERS,
+        parser_registry: ParserRegistry | None = None,
+        formatter_registry: FormatterRegistry | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self._extractor = extractor
         self._writer = writer
-        self._parser_registry = get_parser_registry()
-        self._formatter_registry = get_formatter_registry()
+        self._manifest = manifest
+        self._max_workers = max_workers
+        self._options = options or {}
+        self.unchanged: list[str] = []
+        self._parser_registry = parser_registry or get_parser_registry()
+        self._formatter_registry = formatter_registry or get_formatter_registry()
 
     def convert(self, username: str) -> list[Path]:
-        """Convert GitHub data for a user to Markdown files."""
-        raw_data = self._extractor.extract(username)
-        parsed = self._parse_all(raw_data)
-        return self._format_and_write_all(parsed)
+        """Convert GitHub data for a user to Markdown files.
+
+        Extractors implementing AsyncDataExtractor are run with asyncio.run.
+        """
+        if isinstance(self._extractor, AsyncDataExtractor):
+            import asyncio
+
+            raw_data = asyncio.run(self._extractor.extract_async(username))
+        else:
+            raw_data = self._extractor.extract(username)
+        return self._render(raw_data)
+
+    async def convert_async(self, username: str) -> list[Path]:
+        """Convert GitHub data for a user without blocking the event loop.
+
+        Extractors implementing AsyncDataExtractor are awaited directly,
+        others run in a worker thread; parsing, formatting and writing also
+        run in a worker thread.
+        """
+        import asyncio
+
+        if isinstance(self._extractor, AsyncDataExtractor):
+            raw_data = await self._extractor.extract_async(username)
+        else:
+            raw_data = await asyncio.to_thread(self._extractor.extract, username)
+        return await asyncio.to_thread(self._render, raw_data)
 
-    def _parse_all(self, raw_data: dict[str, Any]) -> dict[str, Any]:
-        """Parse all sections using registered parsers."""
+    def _render(self, raw_data: dict[str, Any]) -> list[Path]:
+        """Parse, format and write extracted data.
+
+        Every section runs as soon as what it depends on is done, on a
+        worker pool; files are reported in formatter registration order.
+        """
+        if self._options:
+            raw_data = {**raw_data, "options": self._options}
+        parsers = self._parser_registry.get_all()
+        formatters = self._formatter_registry.get_all()
         parsed: dict[str, Any] = {}
-        for parser in self._parser_registry.get_all():
-            try:
-                parsed[parser.section_key] = parser.parse(raw_data)
-            except Exception as e:
-                key = parser.section_key
-                print(f"Warning: Parser '{key}' failed: {e}", file=sys.stderr)
-                parsed[parser.section_key] = None
-        return parsed
-
-    def _format_and_write_all(self, parsed: dict[str, Any]) -> list[Path]:
-        """Format and write all sections using registered formatters."""
-        created_files: list[Path] = []
-        for formatter in self._formatter_registry.get_all():
+        created: dict[int, Path] = {}
+        unchanged: dict[int, str] = {}
+
+        def run(node: tuple[str, int]) -> None:
+            stage, index = node
+            if stage == "parse":
+                self._parse_section(parsers[index], raw_data, parsed)
+                return
+            formatter = formatters[index]
             section_data = parsed.get(formatter.section_key)
             if section_data is None:
-                continue
-            try:
-                markdown = formatter.format(section_data)
-                if markdown and markdown.strip():
-                    path = self._writer.write(formatter.output_filename, markdown)
-                    created_files.append(path)
-            except Exception as e:
-                key = formatter.section_key
-                print(f"Warning: Formatter '{key}' failed: {e}", file=sys.stderr)
-        return created_files
-
-
-def create_converter(output_dir: Path) -> GitHubToMarkdownConverter:
-    """Factory function to create a converter with default dependencies."""
-    extractor = GitHubExtractor()
-    writer = MarkdownFileWriter(output_dir)
-    return GitHubToMarkdownConverter(extractor, writer)
+                return
+            outcome = self._format_section(formatter, section_data)
+            if isinstance(outcome, Path):
+                created[index] = outcome
+            elif outcome is not None:
+                unchanged[index] = outcome
+
+        self._run_graph(_section_graph(parsers, formatters), run)
+        flush = getattr(self._writer, "flush", None)
+        if flush is not None:
+            flush()
+        self.unchanged = [unchanged[i] for i in sorted(unchanged)]
+        if self._manifest is not None:
+            self._manifest.save()
+        return [created[i] for i in sorted(created)]
+
+    def _run_graph(
+        self,
+        graph: dict[tuple[str, int], set[tuple[str, int]]],
+        run: Callable[[tuple[str, int]], None],
+    ) -> None:
+        """Run every node of graph once its predecessors have finished.
+
+        Raises:
+            graphlib.CycleError: If plugins declare circular dependencies.
+        """
+        sorter = TopologicalSorter(graph)
+        sorter.prepare()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            pending: dict[Future[None], tuple[str, int]] = {}
+            while sorter.is_active():
+                for node in sorter.get_ready():
+                    pending[pool.submit(run, node)] = node
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+                    sorter.done(pending.pop(future))
+
+    def _parse_section(
+        self, parser: SectionParser, raw_data: dict[str, Any], parsed: dict[str, Any]
+    ) -> None:
+        """Parse one section into parsed, warning and storing None on failure.
+
+        A parser declaring ``depends_on`` finds those sections' parsed data
+        under ``raw_data["parsed"]``.
+        """
+        key = parser.section_key
+        depends_on = getattr(parser, "depends_on", ())
+        if depends_on:
+            deps = MappingProxyType({dep: parsed.get(dep) for dep in depends_on})
+            raw_data = {**raw_data, "parsed": deps}
+        try:
+            parsed[key] = parser.parse(raw_data)
+        except Exception as e:
+            print(f"Warning: Parser '{key}' failed: {e}", file=sys.stderr)
+            parsed[key] = None
+
+    def _format_section(
+        self, formatter: SectionFormatter, section_data: Any
+    ) -> Path | str | None:
+        """Format and write one section, warning on failure.
+
+        Returns:
+            The written path, the output filename if the manifest shows the
+            section unchanged, or None if nothing was written.
+        """
+        manifest = self._manifest
+        key = formatter.section_key
+        try:
+            input_hash: str | None = None
+            if manifest is not None:
+                input_hash = section_hash(formatter, section_data)
+                if manifest.is_current(key, input_hash):
+                    return formatter.output_filename
+            written = self._write_section(formatter, section_data)
+            if written is None:
+                return None
+            path, output_hash = written
+            if manifest is not None and input_hash is not None:
+                manifest.record(key, path, input_hash, output_hash)
+            return path
+        except Exception as e:
+            print(f"Warning: Formatter '{key}' failed: {e}", file=sys.stderr)
+            return None
+
+    def _write_section(
+        self, formatter: SectionFormatter, section_data: Any
+    ) -> tuple[Path, str] | None:
+        """Format and write one section.
+
+        Returns:
+            The written path and hash of its content, or None if the section
+            rendered blank and nothing was written.
+        """
+        writer = self._writer
+        if isinstance(formatter, StreamingSectionFormatter) and isinstance(
+            writer, StreamingOutputWriter
+        ):
+            chunks = _nonblank(formatter.format_chunks(section_data))
+            if chunks is None:
+                return None
+            digest = hashlib.sha256()
+            path = writer.write_chunks(
+                formatter.output_filename, _hashing(chunks, digest.update)
+            )
+            return path, digest.hexdigest()
+        markdown = formatter.format(section_data)
+        if not markdown or not markdown.strip():
+            return None
+        return writer.write(formatter.output_filename, markdown), hash_text(markdown)
+
+
+def create_transport(
+    transport: str = "gh",
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+) -> ApiTransport:
+    """Factory function to create a paced, optionally cached transport.
+
+    Requests are paced by limiter (a fresh RateLimiter if None); cache hits
+    are served before reaching it and cost no budget.
+
+    Raises:
+        ValueError: If transport is unknown.
+    """
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Unknown transport: {transport}")
+    api: ApiTransport = RateLimitedTransport(
+        TRANSPORTS[transport](), limiter or RateLimiter()
+    )
+    if cache is not None:
+        api = CachingTransport(api, cache)
+    return api
+
+
+def create_extractor(
+    backend: str = "rest",
+    transport: str | ApiTransport = "gh",
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+    since: date | None = None,
+    languages: bool = False,
+) -> GitHubExtractor:
+    """Factory function to create an extractor for a backend and transport.
+
+    transport is a TRANSPORTS name (see create_transport for how requests
+    are paced and cached) or a transport from create_transport to share.
+    With since, contributions reach back to that date; with languages,
+    repositories' language bytes are fetched too. Closed years and
+    languages of repositories not pushed to since are kept in cache.
+
+    Raises:
+        ValueError: If backend or transport is unknown.
+    """
+    if backend not in EXTRACTOR_BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}")
+    if isinstance(transport, str):
+        transport = create_transport(transport, cache, limiter)
+    return EXTRACTOR_BACKENDS[backend](
+        transport=transport, since=since, data_cache=cache, languages=languages
+    )
+
+
+def create_converter(
+    output_dir: Path,
+    backend: str = "rest",
+    transport: str = "gh",
+    cache: ResponseCache | None = None,
+    incremental: bool = False,
+    options: dict[str, Any] | None = None,
+    fsync: bool = False,
+) -> GitHubToMarkdownConverter:
+    """Factory function to create a converter with default dependencies.
+
+    With incremental, a manifest in output_dir is used to skip sections
+    that have not changed since the last export. With fsync, written files
+    are flushed to disk at the end of each conversion.
+
+    Raises:
+        ValueError: If backend or transport is unknown.
+    """
+    extractor = create_extractor(backend, transport, cache)
+    writer = MarkdownFileWriter(output_dir, fsync)
+    manifest = Manifest(output_dir) if incremental else None
+    return GitHubToMarkdownConverter(extractor, writer, manifest, options=options)
@@ -1,93 +1,459 @@
-"""GitHub data extractor using gh CLI."""
+"""GitHub data extractors."""
 
+import hashlib
+import itertools
 import json
-import subprocess
+import re
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime
 from typing import Any
 
-from .protocols import DataExtractor
+from .cache import ResponseCache
+from .constants import (
+    DEFAULT_EXTRACT_WORKERS,
+    MAX_EXTERNAL_ISSUES,
+    MAX_EXTERNAL_PRS,
+    MAX_RECENT_ISSUES,
+    MAX_RECENT_PRS,
+    REPOS_PAGE_SIZE,
+    SEARCH_PAGE_SIZE,
+)
+from .history import (
+    Window,
+    contribution_windows,
+    merge_contributions,
+    window_variables,
+)
+from .protocols import ApiTransport, DataExtractor
+from .records import compact_calendar
+from .shared import SharedStore
+from .transport import ApiResponse, GhCliTransport
+
+CONTRIBUTIONS_FIELDS = """
+  totalCommitContributions
+  totalIssueContributions
+  totalPullRequestContributions
+  totalPullRequestReviewContributions
+  contributionCalendar {
+    totalContributions
+    weeks {
+      contributionDays {
+        date
+        contributionCount
+      }
+    }
+  }
+"""
+
+CONTRIBUTIONS_QUERY = f"""
+query($login: String!) {{
+  user(login: $login) {{
+    contributionsCollection {{{CONTRIBUTIONS_FIELDS}}}
+  }}
+}}
+"""
+
+CONTRIBUTIONS_WINDOW_QUERY = f"""
+query($login: String!, $from: DateTime!, $to: DateTime!) {{
+  user(login: $login) {{
+    contributionsCollection(from: $from, to: $to) {{{CONTRIBUTIONS_FIELDS}}}
+  }}
+}}
+"""
+
+SEARCH_FIELDS = """
+  issueCount
+  pageInfo { hasNextPage endCursor }
+  nodes {
+    ... on PullRequest {
+      number
+      title
+      url
+      state
+      createdAt
+      repository { nameWithOwner url }
+    }
+    ... on Issue {
+      number
+      title
+      url
+      state
+      createdAt
+      repository { nameWithOwner url }
+    }
+  }
+"""
+
+SEARCH_QUERY = f"""
+query($search: String!, $first: Int!, $after: String) {{
+  search(query: $search, type: ISSUE, first: $first, after: $after) {{{SEARCH_FIELDS}}}
+}}
+"""
+
+# Pull request and issue sections: raw data key -> part -> (search type,
+# whether it covers the author's own repositories, most results kept)
+AUTHORED_SECTIONS: dict[str, dict[str, tuple[str, bool, int]]] = {
+    "pull_requests": {
+        "own": ("pr", True, MAX_RECENT_PRS),
+        "external": ("pr", False, MAX_EXTERNAL_PRS),
+    },
+    "issues": {
+        "own": ("issue", True, MAX_RECENT_ISSUES),
+        "external": ("issue", False, MAX_EXTERNAL_ISSUES),
+    },
+}
+
+# Part of history cache keys, so that changing the query invalidates them
+_WINDOW_QUERY_DIGEST = hashlib.sha256(CONTRIBUTIONS_WINDOW_QUERY.encode()).hexdigest()
+
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+
+
+def _next_page_url(link_header: str | None) -> str | None:
+    """Return the rel="next" URL from a Link header, if any."""
+    if not link_header:
+        return None
+    match = _NEXT_LINK_RE.search(link_header)
+    return match.group(1) if match else None
+
+
+def compact_contributions(collection: dict[str, Any]) -> dict[str, Any]:
+    """Return a contributionsCollection with its calendar days compacted."""
+    calendar = collection.get("contributionCalendar")
+    if not calendar:
+        return collection
+    return {**collection, "contributionCalendar": compact_calendar(calendar)}
+
+
+def authored_query(username: str, kind: str, own: bool) -> str:
+    """Search for a user's public pull requests or issues, newest first.
+
+    own selects those in the user's own repositories, otherwise those in
+    everyone else's.
+    """
+    scope = f"user:{username}" if own else f"-user:{username}"
+    return f"author:{username} is:{kind} is:public {scope} sort:created-desc"
+
+
+def raise_for_status(response: ApiResponse) -> ApiResponse:
+    """Return a successful response; raise RuntimeError for error statuses."""
+    if response.status < 400:
+        return response
+    payload = response.json()
+    message = payload.get("message", "") if isinstance(payload, dict) else ""
+    if response.status in (403, 429) and "rate limit" in message.lower():
+        raise RuntimeError("GitHub API rate limit exceeded")
+    if response.status == 404:
+        raise RuntimeError("User or resource not found")
+    raise RuntimeError(f"GitHub API request failed (HTTP {response.status})")
+
+
+def graphql_body(query: str, variables: dict[str, Any]) -> dict[str, Any]:
+    """Build a GraphQL request body; None-valued variables are omitted."""
+    return {
+        "query": query,
+        "variables": {k: v for k, v in variables.items() if v is not None},
+    }
+
+
+def _until_error[T](items: Iterator[T], section: str) -> Iterator[T]:
+    """Yield from items, stopping with a warning on the first failure."""
+    try:
+        yield from items
+    except Exception as e:
+        print(f"Warning: Section '{section}' truncated: {e}", file=sys.stderr)
 
 
 class GitHubExtractor(DataExtractor):
-    """Extract GitHub data using gh CLI."""
+    """Extract GitHub data using gh CLI.
+
+    Requests go through an ApiTransport, by default gh itself. Independent
+    sections are fetched concurrently on a bounded worker pool; pass
+    ``max_workers=1`` to fetch them one after another.
+
+    With since, contributions cover since..now instead of the last year,
+    fetched one calendar year at a time on the same pool size. With
+    languages, each non-fork repository's language bytes are fetched too,
+    also on a pool of max_workers. Data that can no longer change, past
+    years and the languages of a repository at a given ``pushed_at``, is
+    kept permanently in data_cache.
+    """
 
-    def __init__(self, token: str | None = None):
+    def __init__(
+        self,
+        token: str | None = None,
+        max_workers: int = DEFAULT_EXTRACT_WORKERS,
+        transport: ApiTransport | None = None,
+        since: date | None = None,
+        data_cache: ResponseCache | None = None,
+        languages: bool = False,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self._token = token
+        self._max_workers = max_workers
+        self._transport = transport or GhCliTransport(token)
+        self._since = since
+        self._data_cache = data_cache
+        self._languages = languages
 
-    def _run_gh(self, *args: str) -> dict[str, Any]:
-        """Run gh CLI command and return JSON response."""
-        env = None
-        if self._token:
-            import os
+    def _request(self, method: str, path: str, body: Any = None) -> ApiResponse:
+        """Send a request and raise RuntimeError for error responses."""
+        return raise_for_status(self._transport.request(method, path, body=body))
 
-            env = os.environ.copy()
-            env["GH_TOKEN"] = self._token
+    def _get(self, path: str) -> Any:
+        """GET a REST endpoint and return its decoded JSON."""
+        return self._request("GET", path).json()
 
-        try:
-            result = subprocess.run(
-                ["gh", *args],
-                capture_output=True,
-                text=True,
-                check=True,
-                env=env,
-            )
-            return json.loads(result.stdout) if result.stdout.strip() else {}
-        except subprocess.CalledProcessError as e:
-            if "rate limit" in e.stderr.lower():
-                raise RuntimeError("GitHub API rate limit exceeded") from None
-            if "not found" in e.stderr.lower():
-                raise RuntimeError("User or resource not found") from None
-            raise RuntimeError("GitHub CLI command failed") from None
-        except json.JSONDecodeError:
-            return {}
+    def _graphql(self, query: str, **variables: str | int | None) -> dict[str, Any]:
+        """Run a GraphQL query; None-valued variables are omitted."""
+        response = self._request("POST", "graphql", graphql_body(query, variables))
+        result = response.json()
+        return result if isinstance(result, dict) else {}
+
+    def _paginate(self, endpoint: str) -> Iterator[Iterator[dict[str, Any]]]:
+        """Yield pages of a REST list endpoint, following Link headers.
+
+        Each page is itself an iterator decoding items from the response
+        body as they are consumed; the next page is requested once the
+        caller asks for it.
+        """
+        next_endpoint: str | None = endpoint
+        while next_endpoint:
+            response = self._request("GET", next_endpoint)
+            items = response.iter_json()
+            first = next(items, None)
+            if first is None:
+                return
+            yield itertools.chain([first], items)
+            next_endpoint = _next_page_url(response.headers.get("link"))
+
+    def _section_fetchers(self, username: str) -> dict[str, Callable[[], Any]]:
+        """Map each raw data key to the call that fetches it.
+
+        With languages, the repository list is read once, as a whole, and
+        shared by the repos and languages sections.
+        """
+        fetchers: dict[str, Callable[[], Any]] = {
+            "profile": lambda: [self._get_profile(username)],
+            "repos": lambda: self._get_repos(username),
+            "contributions": lambda: self._get_contributions(username),
+            "pull_requests": lambda: self._get_authored(username, "pull_requests"),
+            "issues": lambda: self._get_authored(username, "issues"),
+        }
+        if self._languages:
+            store = SharedStore[str, list[dict[str, Any]]]()
+
+            def listing() -> list[dict[str, Any]]:
+                return store.get(
+                    username,
+                    lambda: [
+                        repo for page in self._get_repos(username) for repo in page
+                    ],
+                )
+
+            fetchers["repos"] = lambda: [listing()]
+            fetchers["languages"] = lambda: self._get_languages(listing())
+        return fetchers
 
     def extract(self, username: str) -> dict[str, Any]:
         """Extract all GitHub data for a user."""
+        fetchers = self._section_fetchers(username)
+        workers = min(self._max_workers, len(fetchers))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {key: pool.submit(fetch) for key, fetch in fetchers.items()}
+        outcomes = {
+            key: future.exception() or future.result()
+            for key, future in futures.items()
+        }
+        return self._merge_sections(username, outcomes)
+
+    def _merge_sections(
+        self, username: str, outcomes: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Merge per-section results, where failed sections hold their error."""
         data: dict[str, Any] = {"username": username}
-        data["profile"] = [self._get_profile(username)]
-        data["repos"] = self._get_repos(username)
-        data["contributions"] = self._get_contributions(username)
+        errors: dict[str, Exception] = {}
+        for key, outcome in outcomes.items():
+            if isinstance(outcome, Exception):
+                errors[key] = outcome
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                data[key] = outcome
+
+        if errors:
+            # Every section has settled: report the others, raise the first.
+            first, *rest = errors.items()
+            for key, error in rest:
+                print(f"Warning: Section '{key}' failed: {error}", file=sys.stderr)
+            raise first[1]
         return data
 
     def _get_profile(self, username: str) -> dict[str, Any]:
         """Get user profile."""
-        return self._run_gh("api", f"/users/{username}")
+        return self._get(f"/users/{username}")
+
+    def _get_repos(self, username: str) -> Iterator[Iterator[dict[str, Any]]]:
+        """Get user repositories as a lazy stream of pages.
 
-    def _get_repos(self, username: str) -> list[dict[str, Any]]:
-        """Get user repositories."""
+        The first page is fetched eagerly so it overlaps with the other
+        sections; later pages are fetched as the parser consumes them.
+        """
+        pages = self._paginate(f"/users/{username}/repos?per_page={REPOS_PAGE_SIZE}")
         try:
-            result = self._run_gh(
-                "api", f"/users/{username}/repos", "-f", "per_page=100"
-            )
-            return result if isinstance(result, list) else []
+            first = next(pages, None)
         except Exception:
-            return []
+            return iter(())
+        if first is None:
+            return iter(())
+        return itertools.chain([first], _until_error(pages, "repos"))
 
     def _get_contributions(self, username: str) -> dict[str, Any]:
         """Get contribution data via GraphQL."""
-        query = """
-        query($login: String!) {
-          user(login: $login) {
-            contributionsCollection {
-              totalCommitContributions
-              totalIssueContributions
-              totalPullRequestContributions
-              totalPullRequestReviewContributions
-              contributionCalendar {
-                totalContributions
-              }
-            }
-          }
-        }
-        """
         try:
-            result = self._run_gh(
-                "api", "graphql", "-f", f"query={query}", "-f", f"login={username}"
-            )
+            if self._since is not None:
+                return self._get_contribution_history(username, self._since)
+            result = self._graphql(CONTRIBUTIONS_QUERY, login=username)
             user = result.get("data", {}).get("user", {})
-            return user.get("contributionsCollection", {})
+            return compact_contributions(user.get("contributionsCollection", {}))
         except Exception:
             return {}
 
+    def _get_authored(self, username: str, key: str) -> dict[str, Any]:
+        """Get a user's pull requests or issues (see AUTHORED_SECTIONS).
+
+        Returns {} with a warning if they cannot be searched.
+        """
+        try:
+            return {
+                part: self._search(authored_query(username, kind, own), limit)
+                for part, (kind, own, limit) in AUTHORED_SECTIONS[key].items()
+            }
+        except (RuntimeError, ValueError) as e:
+            print(f"Warning: Section '{key}' skipped: {e}", file=sys.stderr)
+            return {}
+
+    def _search(
+        self, query: str, limit: int, first_page: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Return up to limit search results and the total number of matches.
+
+        Follows cursors from first_page (fetched if None). Each page asks
+        only for the results still missing, so pagination stops as soon as
+        limit is reached.
+        """
+        nodes: list[dict[str, Any]] = []
+        search = first_page
+        cursor: str | None = None
+        while True:
+            if search is None:
+                result = self._graphql(
+                    SEARCH_QUERY,
+                    search=query,
+                    first=min(limit - len(nodes), SEARCH_PAGE_SIZE),
+                    after=cursor,
+                )
+                search = (result.get("data") or {}).get("search") or {}
+            page = [node for node in search.get("nodes") or () if node]
+            nodes.extend(page)
+            info = search.get("pageInfo") or {}
+            cursor = info.get("endCursor")
+            if not page or len(nodes) >= limit or not info.get("hasNextPage"):
+                break
+            search = None
+        return {"total": search.get("issueCount", len(nodes)), "nodes": nodes[:limit]}
+
+    def _get_contribution_history(self, username: str, since: date) -> dict[str, Any]:
+        """Fetch contributions since a date as one merged timeline."""
+        now = datetime.now(UTC).replace(microsecond=0)
+        windows = contribution_windows(since, now)
+        if not windows:
+            return merge_contributions(since, [])
+        workers = min(self._max_workers, len(windows))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(lambda w: self._get_window(username, w), windows))
+        return merge_contributions(since, parts)
+
+    def _get_window(self, username: str, window: Window) -> dict[str, Any]:
+        """Fetch one window's contributionsCollection, cached if closed."""
+
+        def load() -> dict[str, Any]:
+            result = self._graphql(
+                CONTRIBUTIONS_WINDOW_QUERY, login=username, **window_variables(window)
+            )
+            user = (result.get("data") or {}).get("user") or {}
+            return user.get("contributionsCollection") or {}
+
+        if not window.closed:
+            return load()
+        key = (
+            f"contributions {username} {window.start:%Y-%m-%d} "
+            f"{window.end:%Y-%m-%d} {_WINDOW_QUERY_DIGEST}"
+        )
+        return self._permanent(key, load)
+
+    def _get_languages(
+        self, repos: Iterable[dict[str, Any]]
+    ) -> dict[str, dict[str, int]]:
+        """Fetch language bytes of each non-fork repository, by full name.
+
+        A repository's languages only change when it is pushed to, so they
+        are cached under its ``pushed_at``. Repositories whose languages
+        cannot be fetched are left out with a warning.
+        """
+        wanted = {
+            repo["full_name"]: repo.get("pushed_at")
+            for repo in repos
+            if repo.get("full_name") and not repo.get("fork")
+        }
+        if not wanted:
+            return {}
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            fetched = pool.map(self._get_repo_languages, wanted, wanted.values())
+            return {
+                name: languages
+                for name, languages in zip(wanted, fetched, strict=True)
+                if languages is not None
+            }
+
+    def _get_repo_languages(
+        self, full_name: str, pushed_at: str | None
+    ) -> dict[str, int] | None:
+        """Fetch one repository's languages (None if unavailable)."""
+
+        def load() -> dict[str, int]:
+            languages = self._get(f"/repos/{full_name}/languages")
+            return languages if isinstance(languages, dict) else {}
+
+        try:
+            if not pushed_at:
+                return load()
+            return self._permanent(f"languages {full_name} {pushed_at}", load)
+        except (RuntimeError, ValueError) as e:
+            print(f"Warning: Languages of '{full_name}' skipped: {e}", file=sys.stderr)
+            return None
+
+    def _permanent[T](self, key: str, load: Callable[[], T]) -> T:
+        """Return data that can no longer change, from data_cache if kept.
+
+        Empty results are not kept.
+        """
+        cache = self._data_cache
+        if cache is None:
+            return load()
+        entry = cache.get(key)
+        if entry is not None:
+            cache.record("hits")
+            return json.loads(entry.body)
+        value = load()
+        cache.record("misses")
+        if value:
+            cache.put(key, {}, json.dumps(value).encode(), permanent=True)
+        return value
+
 
 class DictExtractor(DataExtractor):
     """Extract data from a pre-populated dictionary (for testing)."""
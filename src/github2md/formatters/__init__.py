@@ -1,5 +1,12 @@
 """Formatters package - auto-registers all formatters."""
 
-from . import contributions, profile, repos
+from . import contributions, issues, languages, profile, pull_requests, repos
 
-__all__ = ["contributions", "profile", "repos"]
+__all__ = [
+    "contributions",
+    "issues",
+    "languages",
+    "profile",
+    "pull_requests",
+    "repos",
+]
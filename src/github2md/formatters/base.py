@@ -1,38 +1,55 @@
 """Base formatter with shared utilities."""
 
+import functools
 import urllib.parse
+from collections.abc import Callable, Iterator
+from typing import Any
 
 from ..constants import (
     ALLOWED_URL_SCHEMES,
     DEFAULT_TRUNCATE_LENGTH,
     ISSUE_STATE_ICONS,
     PR_STATE_ICONS,
+    URL_CACHE_SIZE,
 )
+from ..templates import Renderer, bind_template, template_source
+
+
+@functools.lru_cache(maxsize=URL_CACHE_SIZE)
+def _sanitize_url(url: str) -> str:
+    """Sanitize a URL (memoized: the same URLs recur across sections and runs)."""
+    url = url.strip()
+    if not url.startswith(("https://", "http://")):
+        try:
+            parsed = urllib.parse.urlparse(url)
+            if not parsed.scheme:
+                return ""
+            if parsed.scheme.lower() not in ALLOWED_URL_SCHEMES:
+                return ""
+        except Exception:
+            return ""
+    return url.replace(")", "%29").replace("[", "%5B").replace("]", "%5D")
 
 
 class BaseFormatter:
     """Base class with utility methods for formatters."""
 
+    # Sections that must be written before this one
+    depends_on: tuple[str, ...] = ()
+
     def _escape_md(self, text: str | None) -> str:
         """Escape markdown special characters."""
         if not text:
             return ""
-        return text.replace("|", "\\|").replace("\n", " ").replace("\r", "")
+        if "|" in text or "\n" in text or "\r" in text:
+            return text.replace("|", "\\|").replace("\n", " ").replace("\r", "")
+        return text
 
     def _sanitize_url(self, url: str | None) -> str:
         """Sanitize URL for safe inclusion in Markdown."""
         if not url:
             return ""
-        url = url.strip()
-        try:
-            parsed = urllib.parse.urlparse(url)
-            if not parsed.scheme:
-                return ""
-            if parsed.scheme.lower() not in ALLOWED_URL_SCHEMES:
-                return ""
-        except Exception:
-            return ""
-        return url.replace(")", "%29").replace("[", "%5B").replace("]", "%5D")
+        return _sanitize_url(url)
 
     def _make_link(self, text: str, url: str | None) -> str:
         """Create a markdown link with sanitized URL."""
@@ -67,3 +84,44 @@ class BaseFormatter:
         if remaining <= 0:
             return ""
         return f"\n*...and {remaining} more {item_type}*\n"
+
+
+class TemplateFormatter(BaseFormatter):
+    """Base class for formatters that render a compiled template.
+
+    Subclasses set ``template`` (see github2md.templates) and may add
+    ``template_globals`` and filters. A file named like ``output_filename``
+    in the configured template directory replaces the built-in layout.
+    """
+
+    template = ""
+    template_globals: dict[str, Any] = {}
+    _bound: tuple[str, Renderer] | None = None
+
+    def template_filters(self) -> dict[str, Callable[..., Any]]:
+        """Filters available to the template besides the built-in ones."""
+        return {
+            "escape": self._escape_md,
+            "link": self._make_link,
+            "truncate": self._truncate,
+        }
+
+    @property
+    def template_source(self) -> str:
+        """The layout in effect: a custom template or the built-in one."""
+        return template_source(self.output_filename, self.template)  # type: ignore[attr-defined]
+
+    def _renderer(self) -> Renderer:
+        source = self.template_source
+        if self._bound is None or self._bound[0] is not source:
+            self._bound = (source, bind_template(source, self.template_filters()))
+        return self._bound[1]
+
+    def format(self, parsed_data: dict[str, Any]) -> str:
+        return "".join(self.format_chunks(parsed_data))
+
+    def format_chunks(self, parsed_data: dict[str, Any]) -> Iterator[str]:
+        """Yield the rendered section in chunks."""
+        if self.template_globals:
+            parsed_data = {**self.template_globals, **parsed_data}
+        return self._renderer()(parsed_data)
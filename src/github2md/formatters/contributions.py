@@ -1,15 +1,78 @@
 """Contributions formatter."""
 
+from collections.abc import Callable, Sequence
 from typing import Any
 
+from ..constants import SPARKLINE_BLOCKS
 from ..registry import register_formatter
-from .base import BaseFormatter
+from .base import TemplateFormatter
+
+TEMPLATE = """\
+# Contributions
+
+**Total Contributions ({period|default:"last year"}):** \
+{total_contributions|default:0}
+
+## Breakdown
+
+- **Commits:** {total_commits|default:0}
+- **Pull Requests:** {total_prs|default:0}
+- **Issues:** {total_issues|default:0}
+- **Code Reviews:** {total_reviews|default:0}
+{% if calendar_days %}
+
+## Calendar
+
+{calendar_start} to {calendar_end}: active on {active_days} of {calendar_days} days.
+
+- **Current streak:** {current_streak|days}
+{% if longest_streak %}
+- **Longest streak:** {longest_streak|days} \
+({longest_streak_start} to {longest_streak_end})
+{% endif %}
+- **Busiest weekday:** {busiest_weekday} ({busiest_weekday_total} contributions)
+- **Best week:** week of {best_week} ({best_week_total} contributions)
+
+### Weekly
+
+`{weekly|sparkline}`
+
+### Monthly
+
+| Month | Contributions |
+|---|---|
+{% for month, total in monthly|items %}
+| {month} | {total} |
+{% endfor %}
+
+### By Weekday
+
+| Day | Contributions |
+|---|---|
+{% for name, total in weekdays|items %}
+| {name} | {total} |
+{% endfor %}
+{% endif %}
+"""
+
+
+def _sparkline(values: Sequence[int] | None) -> str:
+    """One block character per value, scaled to the largest."""
+    top = max(values or (), default=0)
+    if not top:
+        return SPARKLINE_BLOCKS[0] * len(values or ())
+    return "".join(
+        SPARKLINE_BLOCKS[1 + 6 * v // top] if v else SPARKLINE_BLOCKS[0]
+        for v in values or ()
+    )
 
 
 @register_formatter
-class ContributionsFormatter(BaseFormatter):
+class ContributionsFormatter(TemplateFormatter):
     """Format contributions to Markdown."""
 
+    template = TEMPLATE
+
     @property
     def section_key(self) -> str:
         return "contributions"
@@ -18,13 +81,9 @@ class ContributionsFormatter(BaseFormatter):
     def output_filename(self) -> str:
         return "contributions.md"
 
-    def format(self, data: dict[str, Any]) -> str:
-        total = data.get("total_contributions", 0)
-        lines = ["# Contributions\n"]
-        lines.append(f"**Total Contributions (last year):** {total}\n")
-        lines.append("## Breakdown\n")
-        lines.append(f"- **Commits:** {data.get('total_commits', 0)}")
-        lines.append(f"- **Pull Requests:** {data.get('total_prs', 0)}")
-        lines.append(f"- **Issues:** {data.get('total_issues', 0)}")
-        lines.append(f"- **Code Reviews:** {data.get('total_reviews', 0)}")
-        return "\n".join(lines) + "\n"
+    def template_filters(self) -> dict[str, Callable[..., Any]]:
+        return {
+            **super().template_filters(),
+            "days": lambda n: f"{n} day" if n == 1 else f"{n} days",
+            "sparkline": _sparkline,
+        }
@@ -0,0 +1,55 @@
+"""Issues formatter."""
+
+from ..registry import register_formatter
+from .pull_requests import PullRequestsFormatter
+
+TEMPLATE = """\
+{% if total %}
+# Issues ({total} total)
+
+{% if external %}
+## Opened in Other Repositories
+
+{% for issue in external %}
+- {issue.state|icon} {issue.title|escape|link:issue.url} \
+({issue.repo|link:issue.repo_url}, {issue.created_at})
+{% endfor %}
+{% if total_external|more:external %}
+
+{total_external|more:external}
+{% endif %}
+
+{% endif %}
+{% if own %}
+## Own Repositories
+
+{% for issue in own %}
+- {issue.state|icon} {issue.title|escape|link:issue.url} \
+({issue.repo|link:issue.repo_url}, {issue.created_at})
+{% endfor %}
+{% if total_own|more:own %}
+
+{total_own|more:own}
+{% endif %}
+{% endif %}
+{% endif %}
+"""
+
+
+@register_formatter
+class IssuesFormatter(PullRequestsFormatter):
+    """Format issues, in other repositories first, to Markdown."""
+
+    template = TEMPLATE
+    item_type = "issues"
+
+    @property
+    def section_key(self) -> str:
+        return "issues"
+
+    @property
+    def output_filename(self) -> str:
+        return "issues.md"
+
+    def _state_icon(self, state: str) -> str:
+        return self._get_issue_state_icon(state)
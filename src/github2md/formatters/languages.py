@@ -0,0 +1,63 @@
+"""Byte-weighted languages formatter."""
+
+from collections.abc import Callable
+from typing import Any
+
+from ..registry import register_formatter
+from .base import TemplateFormatter
+
+TEMPLATE = """\
+{% if languages %}
+# Languages
+
+{total_bytes|size} of code across {repos_counted|repositories}, by bytes.
+
+| Language | Size | Share | Repositories |
+|---|---|---|---|
+{% for lang in languages %}
+| {lang.name|escape} | {lang.bytes|size} | {lang.share|percent} | {lang.repos} |
+{% endfor %}
+{% if other_bytes %}
+| Other | {other_bytes|size} | {other_share|percent} | |
+{% endif %}
+{% endif %}
+"""
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
+
+
+def _size(n: int | None) -> str:
+    """Human-readable byte count (1024-based)."""
+    value = float(n or 0)
+    unit = 0
+    while value >= 1024 and unit < len(_SIZE_UNITS) - 1:
+        value /= 1024
+        unit += 1
+    if not unit:
+        return f"{value:.0f} B"
+    return f"{value:.1f} {_SIZE_UNITS[unit]}"
+
+
+@register_formatter
+class LanguagesFormatter(TemplateFormatter):
+    """Format the byte-weighted language breakdown to Markdown."""
+
+    template = TEMPLATE
+
+    @property
+    def section_key(self) -> str:
+        return "languages"
+
+    @property
+    def output_filename(self) -> str:
+        return "languages.md"
+
+    def template_filters(self) -> dict[str, Callable[..., Any]]:
+        return {
+            **super().template_filters(),
+            "size": _size,
+            "percent": lambda value: f"{value or 0:.1f}%",
+            "repositories": lambda n: (
+                f"{n} repository" if n == 1 else f"{n} repositories"
+            ),
+        }
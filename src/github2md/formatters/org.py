@@ -0,0 +1,52 @@
+"""Organization contributors formatter (used by org exports, not registered)."""
+
+from collections.abc import Callable
+from typing import Any
+
+from .base import TemplateFormatter
+
+TEMPLATE = """\
+# Contributors: {org|default:"Unknown"}
+
+{% if contributors %}
+## Top Contributors
+
+Across the {repos_scanned} most-starred repositories \
+({total_contributors} contributors).
+
+| Contributor | Contributions | Repositories | Member |
+|---|---|---|---|
+{% for person in contributors %}
+| {person.login|link:person.url} | {person.contributions} | {person.repos} | \
+{person.member|mark} |
+{% endfor %}
+
+{% endif %}
+{% if members %}
+## Members ({members|count})
+
+{% for login in members %}
+- [{login}]({login}/profile.md)
+{% endfor %}
+{% endif %}
+"""
+
+
+class OrgContributorsFormatter(TemplateFormatter):
+    """Format an organization's top contributors and member index."""
+
+    template = TEMPLATE
+
+    @property
+    def section_key(self) -> str:
+        return "contributors"
+
+    @property
+    def output_filename(self) -> str:
+        return "contributors.md"
+
+    def template_filters(self) -> dict[str, Callable[..., Any]]:
+        return {
+            **super().template_filters(),
+            "mark": lambda value: "✓" if value else "",
+        }
@@ -0,0 +1,68 @@
+"""Pull requests formatter."""
+
+from collections.abc import Callable, Sized
+from typing import Any
+
+from ..registry import register_formatter
+from .base import TemplateFormatter
+
+TEMPLATE = """\
+{% if total %}
+# Pull Requests ({total} total)
+
+{% if external %}
+## External Contributions
+
+{% for pr in external %}
+- {pr.state|icon} {pr.title|escape|link:pr.url} \
+({pr.repo|link:pr.repo_url}, {pr.created_at})
+{% endfor %}
+{% if total_external|more:external %}
+
+{total_external|more:external}
+{% endif %}
+
+{% endif %}
+{% if own %}
+## Own Repositories
+
+{% for pr in own %}
+- {pr.state|icon} {pr.title|escape|link:pr.url} \
+({pr.repo|link:pr.repo_url}, {pr.created_at})
+{% endfor %}
+{% if total_own|more:own %}
+
+{total_own|more:own}
+{% endif %}
+{% endif %}
+{% endif %}
+"""
+
+
+@register_formatter
+class PullRequestsFormatter(TemplateFormatter):
+    """Format pull requests, to other repositories first, to Markdown."""
+
+    template = TEMPLATE
+    item_type = "pull requests"
+
+    @property
+    def section_key(self) -> str:
+        return "pull_requests"
+
+    @property
+    def output_filename(self) -> str:
+        return "pull_requests.md"
+
+    def _state_icon(self, state: str) -> str:
+        return self._get_pr_state_icon(state)
+
+    def _more(self, total: int | None, shown: Sized | None) -> str:
+        return self._format_more(len(shown or ()), total or 0, self.item_type).strip()
+
+    def template_filters(self) -> dict[str, Callable[..., Any]]:
+        return {
+            **super().template_filters(),
+            "icon": self._state_icon,
+            "more": self._more,
+        }
@@ -1,15 +1,50 @@
 """Repositories formatter."""
 
+from collections.abc import Callable
 from typing import Any
 
 from ..constants import MAX_REPOS
 from ..registry import register_formatter
-from .base import BaseFormatter
+from .base import TemplateFormatter
+
+RANKING_HEADINGS = {
+    "forks": " (by forks)",
+    "updated": " (recently updated)",
+    "score": " (by stars and forks)",
+}
+
+TEMPLATE = """\
+# Repositories ({total|default:0} total)
+
+**Total Stars:** {total_stars|default:0} | **Total Forks:** {total_forks|default:0}
+
+{% if languages %}
+## Languages
+
+{% for lang, count in languages|items|limit:10 %}
+- **{lang}:** {count} repos
+{% endfor %}
+
+{% endif %}
+{% if repos %}
+## Top Repositories{sort|ranked_by}
+
+{% for repo in repos|limit:max_repos %}
+### {repo.name|or:"Unknown"|link:repo.url}
+{repo.description|truncate:100|or:"No description"}
+- **Language:** {repo.language|or:"Unknown"} | **Stars:** {repo.stars|default:0}
+
+{% endfor %}
+{% endif %}
+"""
 
 
 @register_formatter
-class ReposFormatter(BaseFormatter):
-    """Format repositories to Markdown."""
+class ReposFormatter(TemplateFormatter):
+    """Format repositories to Markdown, one chunk per repository."""
+
+    template = TEMPLATE
+    template_globals = {"max_repos": MAX_REPOS}
 
     @property
     def section_key(self) -> str:
@@ -19,35 +54,8 @@ class ReposFormatter(BaseFormatter):
     def output_filename(self) -> str:
         return "repositories.md"
 
-    def format(self, data: dict[str, Any]) -> str:
-        repos = data.get("repos", [])
-        total = data.get("total", 0)
-        stars = data.get("total_stars", 0)
-        forks = data.get("total_forks", 0)
-
-        lines = [f"# Repositories ({total} total)\n"]
-        lines.append(f"**Total Stars:** {stars} | **Total Forks:** {forks}\n")
-
-        languages = data.get("languages", {})
-        if languages:
-            lines.append("## Languages\n")
-            for lang, count in list(languages.items())[:10]:
-                lines.append(f"- **{lang}:** {count} repos")
-            lines.append("")
-
-        if repos:
-            lines.append("## Top Repositories\n")
-            for repo in repos[:MAX_REPOS]:
-                name = repo.get("name", "Unknown")
-                url = repo.get("url", "")
-                desc = self._truncate(repo.get("description"), 100)
-                desc = desc or "No description"
-                repo_stars = repo.get("stars", 0)
-                lang = repo.get("language") or "Unknown"
-
-                lines.append(f"### {self._make_link(name, url)}")
-                lines.append(f"{desc}")
-                lines.append(f"- **Language:** {lang} | **Stars:** {repo_stars}")
-                lines.append("")
-
-        return "\n".join(lines) + "\n"
+    def template_filters(self) -> dict[str, Callable[..., Any]]:
+        return {
+            **super().template_filters(),
+            "ranked_by": lambda sort: RANKING_HEADINGS.get(sort or "", ""),
+        }
@@ -0,0 +1,206 @@
+"""GitHub data extractor using a single batched GraphQL query."""
+
+import itertools
+from collections.abc import Iterator
+from typing import Any
+
+from .constants import MAX_TOPICS, REPOS_PAGE_SIZE, SEARCH_PAGE_SIZE
+from .extractor import (
+    AUTHORED_SECTIONS,
+    CONTRIBUTIONS_FIELDS,
+    SEARCH_FIELDS,
+    GitHubExtractor,
+    _until_error,
+    authored_query,
+    compact_contributions,
+)
+
+REPO_FIELDS = f"""
+  nameWithOwner
+  name
+  description
+  url
+  isFork
+  stargazerCount
+  forkCount
+  primaryLanguage {{ name }}
+  repositoryTopics(first: {MAX_TOPICS}) {{ nodes {{ topic {{ name }} }} }}
+  createdAt
+  updatedAt
+  pushedAt
+"""
+
+REPOS_CONNECTION = f"""
+  repositories(
+    first: $first
+    after: $after
+    ownerAffiliations: OWNER
+    privacy: PUBLIC
+    orderBy: {{ field: CREATED_AT, direction: DESC }}
+  ) {{
+    totalCount
+    pageInfo {{ hasNextPage endCursor }}
+    nodes {{{REPO_FIELDS}}}
+  }}
+"""
+
+# First page of each AUTHORED_SECTIONS search, aliased <part>_<key>
+AUTHORED_ALIASES = {
+    f"{part}_{key}": (key, part, kind, own, limit)
+    for key, parts in AUTHORED_SECTIONS.items()
+    for part, (kind, own, limit) in parts.items()
+}
+AUTHORED_VARIABLES = "".join(f", ${alias}: String!" for alias in AUTHORED_ALIASES)
+AUTHORED_SEARCHES = "".join(
+    f"""
+    {alias}: search(
+      query: ${alias}
+      type: ISSUE
+      first: {min(limit, SEARCH_PAGE_SIZE)}
+    ) {{{SEARCH_FIELDS}}}"""
+    for alias, (*_, limit) in AUTHORED_ALIASES.items()
+)
+
+USER_QUERY = f"""
+query($login: String!, $first: Int!, $after: String{AUTHORED_VARIABLES}) {{
+  user(login: $login) {{
+    login
+    name
+    bio
+    company
+    location
+    websiteUrl
+    email
+    twitterUsername
+    createdAt
+    url
+    followers {{ totalCount }}
+    following {{ totalCount }}
+    gists(privacy: PUBLIC) {{ totalCount }}
+    {REPOS_CONNECTION}
+    contributionsCollection {{{CONTRIBUTIONS_FIELDS}}}
+  }}{AUTHORED_SEARCHES}
+}}
+"""
+
+REPOS_QUERY = f"""
+query($login: String!, $first: Int!, $after: String) {{
+  user(login: $login) {{
+    {REPOS_CONNECTION}
+  }}
+}}
+"""
+
+
+class GitHubGraphQLExtractor(GitHubExtractor):
+    """Extract GitHub data with one GraphQL round trip per user.
+
+    The profile, the first page of repositories, the contribution totals
+    and the first page of each pull request and issue search come back
+    from a single query. Further repository pages are requested
+    by cursor only when the parser reads past the first page (with
+    languages, all of them are read up front).
+    """
+
+    def extract(self, username: str) -> dict[str, Any]:
+        """Extract all GitHub data for a user."""
+        searches = {
+            alias: authored_query(username, kind, own)
+            for alias, (_, _, kind, own, _) in AUTHORED_ALIASES.items()
+        }
+        result = self._graphql(
+            USER_QUERY, login=username, first=REPOS_PAGE_SIZE, **searches
+        )
+        user = (result.get("data") or {}).get("user")
+        if not user:
+            raise RuntimeError("User or resource not found")
+
+        repos = user.get("repositories") or {}
+        if self._since is not None:
+            contributions = self._get_contributions(username)
+        else:
+            contributions = compact_contributions(
+                user.get("contributionsCollection") or {}
+            )
+        data: dict[str, Any] = {
+            "username": username,
+            "profile": [self._to_rest_profile(user, repos.get("totalCount", 0))],
+            "repos": self._repo_pages(username, repos),
+            "contributions": contributions,
+        }
+        payload = result.get("data") or {}
+        for alias, (key, part, _, _, limit) in AUTHORED_ALIASES.items():
+            first_page = payload.get(alias) or {}
+            data.setdefault(key, {})[part] = self._search(
+                searches[alias], limit, first_page
+            )
+        if self._languages:
+            listing = [repo for page in data["repos"] for repo in page]
+            data["repos"] = [listing]
+            data["languages"] = self._get_languages(listing)
+        return data
+
+    def _repo_pages(
+        self, username: str, first_page: dict[str, Any]
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Chain the embedded first page with lazily fetched follow-ups."""
+        page = [self._to_rest_repo(node) for node in first_page.get("nodes") or []]
+        info = first_page.get("pageInfo") or {}
+        if not info.get("hasNextPage"):
+            return iter([page])
+        rest = self._iter_repo_pages(username, info.get("endCursor"))
+        return itertools.chain([page], _until_error(rest, "repos"))
+
+    def _iter_repo_pages(
+        self, username: str, cursor: str | None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield repository pages after cursor until the last one."""
+        while cursor:
+            result = self._graphql(
+                REPOS_QUERY, login=username, first=REPOS_PAGE_SIZE, after=cursor
+            )
+            user = (result.get("data") or {}).get("user") or {}
+            repos = user.get("repositories") or {}
+            nodes = repos.get("nodes") or []
+            if not nodes:
+                return
+            yield [self._to_rest_repo(node) for node in nodes]
+            info = repos.get("pageInfo") or {}
+            cursor = info.get("endCursor") if info.get("hasNextPage") else None
+
+    def _to_rest_profile(self, user: dict[str, Any], repo_count: int) -> dict[str, Any]:
+        """Map a GraphQL user node to the REST /users/{login} shape."""
+        return {
+            "login": user.get("login"),
+            "name": user.get("name"),
+            "bio": user.get("bio"),
+            "company": user.get("company"),
+            "location": user.get("location"),
+            "blog": user.get("websiteUrl"),
+            "email": user.get("email") or None,
+            "twitter_username": user.get("twitterUsername"),
+            "public_repos": repo_count,
+            "public_gists": (user.get("gists") or {}).get("totalCount", 0),
+            "followers": (user.get("followers") or {}).get("totalCount", 0),
+            "following": (user.get("following") or {}).get("totalCount", 0),
+            "created_at": user.get("createdAt"),
+            "html_url": user.get("url"),
+        }
+
+    def _to_rest_repo(self, node: dict[str, Any]) -> dict[str, Any]:
+        """Map a GraphQL repository node to the REST repository shape."""
+        topics = (node.get("repositoryTopics") or {}).get("nodes") or []
+        return {
+            "full_name": node.get("nameWithOwner"),
+            "name": node.get("name"),
+            "description": node.get("description"),
+            "html_url": node.get("url"),
+            "fork": node.get("isFork", False),
+            "stargazers_count": node.get("stargazerCount", 0),
+            "forks_count": node.get("forkCount", 0),
+            "language": (node.get("primaryLanguage") or {}).get("name"),
+            "topics": [t["topic"]["name"] for t in topics if t.get("topic")],
+            "created_at": node.get("createdAt"),
+            "updated_at": node.get("updatedAt"),
+            "pushed_at": node.get("pushedAt"),
+        }
@@ -0,0 +1,97 @@
+"""Multi-year contribution history, fetched in one-year windows."""
+
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time
+from typing import Any
+
+from .records import compact_calendar
+
+# contributionsCollection totals summed across windows
+_TOTAL_FIELDS = (
+    "totalCommitContributions",
+    "totalIssueContributions",
+    "totalPullRequestContributions",
+    "totalPullRequestReviewContributions",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class Window:
+    """One contributionsCollection range (GitHub allows at most a year).
+
+    A closed window lies entirely in a past calendar year, so its data can
+    no longer change.
+    """
+
+    start: datetime
+    end: datetime
+    closed: bool
+
+
+def since_years(years: int, today: date) -> date:
+    """Return the start of the history covering this and years - 1 past years.
+
+    Raises:
+        ValueError: If years is less than 1.
+    """
+    if years < 1:
+        raise ValueError("years must be at least 1")
+    return date(today.year - years + 1, 1, 1)
+
+
+def contribution_windows(since: date, now: datetime) -> list[Window]:
+    """Split since..now into calendar-year windows, oldest first."""
+    windows = []
+    for year in range(since.year, now.year + 1):
+        start = max(since, date(year, 1, 1))
+        if year < now.year:
+            end = datetime.combine(date(year, 12, 31), time(23, 59, 59), UTC)
+            windows.append(Window(datetime.combine(start, time.min, UTC), end, True))
+        else:
+            start_at = datetime.combine(start, time.min, UTC)
+            windows.append(Window(start_at, now, False))
+    return windows
+
+
+def merge_contributions(since: date, parts: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    """Merge per-window contributionsCollections into one timeline.
+
+    Totals are summed; calendar days are laid out by date on one compact
+    array starting at since (overlapping days are counted once).
+    """
+    merged: dict[str, Any] = {"startedAt": since.isoformat()}
+    for field in _TOTAL_FIELDS:
+        merged[field] = sum(part.get(field) or 0 for part in parts)
+
+    total = 0
+    counts = array("I")
+    for part in parts:
+        calendar = compact_calendar(part.get("contributionCalendar") or {})
+        total += calendar.get("totalContributions") or 0
+        start, days = calendar.get("startDate"), calendar.get("counts")
+        if not start or not days:
+            continue
+        offset = (date.fromisoformat(start[:10]) - since).days
+        if offset < 0:
+            days, offset = days[-offset:], 0
+        end = offset + len(days)
+        if end > len(counts):
+            counts.extend([0] * (end - len(counts)))
+        counts[offset:end] = array("I", days)
+
+    calendar_out: dict[str, Any] = {"totalContributions": total}
+    if counts:
+        calendar_out["startDate"] = since.isoformat()
+        calendar_out["counts"] = counts
+    merged["contributionCalendar"] = calendar_out
+    return merged
+
+
+def window_variables(window: Window) -> dict[str, str]:
+    """GraphQL variables for a window."""
+    return {
+        "from": window.start.isoformat().replace("+00:00", "Z"),
+        "to": window.end.isoformat().replace("+00:00", "Z"),
+    }
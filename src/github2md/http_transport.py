@@ -0,0 +1,135 @@
+"""HTTP transport over pooled keep-alive connections (stdlib only)."""
+
+import gzip
+import http.client
+import json
+import queue
+import urllib.parse
+from typing import Any
+
+from . import __version__
+from .constants import (
+    DEFAULT_API_URL,
+    DEFAULT_HTTP_POOL_SIZE,
+    DEFAULT_HTTP_TIMEOUT,
+    GITHUB_API_VERSION,
+)
+from .protocols import ApiTransport
+from .transport import ApiResponse, resolve_token
+
+
+class HttpTransport(ApiTransport):
+    """Send requests over pooled keep-alive connections using http.client.
+
+    Idle connections are kept in a LIFO pool and reused by whichever thread
+    asks next, so a batch of requests pays for TLS setup only once per
+    pooled connection.
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        base_url: str = DEFAULT_API_URL,
+        pool_size: int = DEFAULT_HTTP_POOL_SIZE,
+        timeout: float = DEFAULT_HTTP_TIMEOUT,
+    ) -> None:
+        url = urllib.parse.urlsplit(base_url)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise ValueError(f"Invalid base URL: {base_url}")
+        self._scheme = url.scheme
+        self._host = url.hostname
+        self._port = url.port
+        self._prefix = url.path.rstrip("/")
+        self._timeout = timeout
+        self._pool: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(
+            maxsize=pool_size
+        )
+        self._headers = {
+            "Accept": "application/vnd.github+json",
+            "Accept-Encoding": "gzip",
+            "User-Agent": f"github2md/{__version__}",
+            "X-GitHub-Api-Version": GITHUB_API_VERSION,
+        }
+        token = resolve_token(token)
+        if token:
+            self._headers["Authorization"] = f"Bearer {token}"
+
+    def _target(self, path: str) -> str:
+        """Turn an API path or absolute URL (e.g. from Link) into a target."""
+        url = urllib.parse.urlsplit(path)
+        if url.scheme:
+            if (url.hostname, url.port) != (self._host, self._port):
+                raise ValueError(f"URL outside of the API host: {path}")
+            return urllib.parse.urlunsplit(("", "", url.path, url.query, ""))
+        return f"{self._prefix}/{path.lstrip('/')}"
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(
+                self._host, self._port, timeout=self._timeout
+            )
+        return http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+
+    def _checkout(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Take an idle connection from the pool, or open a new one."""
+        try:
+            return self._pool.get_nowait(), True
+        except queue.Empty:
+            return self._connect(), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> ApiResponse:
+        target = self._target(path)
+        send_headers = {**self._headers, **(headers or {})}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            send_headers["Content-Type"] = "application/json"
+
+        while True:
+            conn, reused = self._checkout()
+            try:
+                conn.request(method, target, body=payload, headers=send_headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (ConnectionError, http.client.HTTPException) as e:
+                conn.close()
+                if reused:
+                    # The server closed an idle keep-alive connection; retry
+                    # once the pool has been drained of stale connections.
+                    continue
+                raise RuntimeError(f"GitHub API request failed: {e}") from None
+            except OSError as e:
+                conn.close()
+                raise RuntimeError(f"GitHub API request failed: {e}") from None
+            break
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+
+        response_headers = {k.lower(): v for k, v in response.getheaders()}
+        if response_headers.get("content-encoding") == "gzip":
+            data = gzip.decompress(data)
+        return ApiResponse(response.status, response_headers, data)
+
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
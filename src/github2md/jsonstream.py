@@ -0,0 +1,77 @@
+"""Incremental decoding of JSON arrays."""
+
+import codecs
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+# Characters that can follow a complete number inside an array
+_NUMBER_END = _WHITESPACE + ",]"
+
+
+def iter_json_array(chunks: Iterable[bytes | memoryview]) -> Iterator[Any]:
+    """Yield the elements of top-level JSON arrays as their bytes arrive.
+
+    Only the undecoded tail of the input is held as text, so peak memory
+    is one chunk plus the element being decoded rather than the whole
+    document. Several arrays in a row (as ``gh api --paginate`` prints
+    them) are treated as one sequence.
+
+    Raises:
+        ValueError: If the input is not a sequence of JSON arrays.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    # "open": expecting "[", "first": a value or "]", "next": "," or "]",
+    # "value": a value after a comma.
+    state = "open"
+    pending = iter(chunks)
+    final = False
+    while not final:
+        chunk = next(pending, None)
+        final = chunk is None
+        buf += utf8.decode(chunk or b"", final)
+        pos = 0
+        end = len(buf)
+        while True:
+            while pos < end and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos == end:
+                break
+            char = buf[pos]
+            if state == "open":
+                if char != "[":
+                    raise ValueError(f"Expected a JSON array, got {char!r}")
+                state = "first"
+                pos += 1
+            elif state in ("first", "next") and char == "]":
+                state = "open"
+                pos += 1
+            elif state == "next":
+                if char != ",":
+                    raise ValueError(f"Expected ',' or ']', got {char!r}")
+                state = "value"
+                pos += 1
+            else:
+                try:
+                    value, value_end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break  # incomplete value: wait for more input
+                if (
+                    not final
+                    and isinstance(value, int | float)
+                    and (value_end == end or buf[value_end] not in _NUMBER_END)
+                ):
+                    # The number may continue in the next chunk ("1." + "5"),
+                    # and raw_decode has only matched a prefix of it.
+                    break
+                state = "next"
+                pos = value_end
+                yield value
+        buf = buf[pos:]
+    if state != "open":
+        raise ValueError("Unterminated JSON array")
@@ -0,0 +1,120 @@
+"""Content-hash manifest for incremental re-exports."""
+
+import dataclasses
+import hashlib
+import json
+import os
+from array import array
+from pathlib import Path
+from typing import Any
+
+MANIFEST_FILENAME = ".github2md-manifest.json"
+
+
+def _json_default(value: Any) -> Any:
+    """Make parsed section values (records, arrays, sets) JSON-encodable."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, array):
+        return value.tolist()
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=repr)
+    return str(value)
+
+
+def hash_data(data: Any) -> str:
+    """Hash parsed data canonically (independent of dict ordering)."""
+    encoded = json.dumps(
+        data, sort_keys=True, separators=(",", ":"), default=_json_default
+    )
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def section_hash(formatter: object, data: Any) -> str:
+    """Hash a section's formatter input.
+
+    The formatter class, its template and the package version are included
+    so that upgrading github2md or editing a layout re-renders the section.
+    """
+    from . import __version__
+
+    kind = type(formatter)
+    return hash_data(
+        {
+            "formatter": f"{kind.__module__}.{kind.__qualname__}",
+            "template": getattr(formatter, "template_source", None),
+            "version": __version__,
+            "data": data,
+        }
+    )
+
+
+def hash_text(text: str) -> str:
+    """Hash rendered output as it is written (UTF-8)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclasses.dataclass(slots=True)
+class ManifestEntry:
+    """What was written for one section on the last run."""
+
+    filename: str
+    input_hash: str
+    output_hash: str
+
+
+class Manifest:
+    """Per-section input and output hashes stored in the output directory.
+
+    A section is current when its input hash matches the last run and the
+    file it produced is still there, unmodified.
+    """
+
+    def __init__(self, output_dir: Path) -> None:
+        self._dir = output_dir
+        self._path = output_dir / MANIFEST_FILENAME
+        self._entries: dict[str, ManifestEntry] = {}
+        try:
+            raw = json.loads(self._path.read_text(encoding="utf-8"))
+            self._entries = {
+                key: ManifestEntry(**entry) for key, entry in raw["sections"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            self._entries = {}
+
+    def is_current(self, section: str, input_hash: str) -> bool:
+        """Whether section can be skipped for this input."""
+        entry = self._entries.get(section)
+        if entry is None or entry.input_hash != input_hash:
+            return False
+        try:
+            content = (self._dir / entry.filename).read_text(encoding="utf-8")
+        except OSError:
+            return False
+        return hash_text(content) == entry.output_hash
+
+    def record(
+        self, section: str, path: Path, input_hash: str, output_hash: str
+    ) -> None:
+        """Remember what was written for section.
+
+        path is where the writer put the file (usually already inside the
+        output directory); the entry stores it relative to that directory.
+        """
+        try:
+            filename = Path(path).resolve().relative_to(self._dir.resolve())
+        except ValueError:
+            filename = Path(path.name)
+        self._entries[section] = ManifestEntry(
+            filename.as_posix(), input_hash, output_hash
+        )
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        sections = {k: dataclasses.asdict(v) for k, v in self._entries.items()}
+        tmp = self._path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"version": 1, "sections": sections}, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self._path)
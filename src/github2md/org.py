@@ -0,0 +1,178 @@
+"""Organization-wide export: every member plus an org summary."""
+
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from .batch import BatchResult, ExportConfig, _describe, export_batch, print_summary
+from .constants import (
+    DEFAULT_BATCH_WORKERS,
+    DEFAULT_EXTRACT_WORKERS,
+    MAX_ORG_CONTRIBUTOR_REPOS,
+    REPOS_PAGE_SIZE,
+)
+from .converter import GitHubToMarkdownConverter
+from .extractor import GitHubExtractor
+from .formatters.org import OrgContributorsFormatter
+from .formatters.repos import ReposFormatter
+from .manifest import Manifest
+from .parsers.org import OrgContributorsParser
+from .parsers.repos import ReposParser
+from .protocols import ApiTransport, DataExtractor, OutputWriter
+from .registry import DefaultFormatterRegistry, DefaultParserRegistry
+from .shared import SharedStore
+from .writer import MarkdownFileWriter
+
+
+class OrgExtractor(GitHubExtractor):
+    """Extract an organization's repositories, contributors and members.
+
+    ``extract(org)`` returns raw data for the org summary. Within one
+    extractor, org data is fetched once through a SharedStore: the
+    repository list feeds both the repos and contributors sections, and the
+    member list is also what ``export_org`` exports. Member exports use
+    their own extractor and fetch no org data.
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        max_workers: int = DEFAULT_EXTRACT_WORKERS,
+        transport: ApiTransport | None = None,
+    ):
+        super().__init__(token, max_workers, transport)
+        self._store: SharedStore[tuple[str, str], Any] = SharedStore()
+
+    def members(self, org: str) -> list[str]:
+        """Return the logins of the organization's (visible) members."""
+        return self._store.get(
+            ("members", org),
+            lambda: [
+                member["login"]
+                for page in self._paginate(
+                    f"/orgs/{org}/members?per_page={REPOS_PAGE_SIZE}"
+                )
+                for member in page
+            ],
+        )
+
+    def repos(self, org: str) -> list[dict[str, Any]]:
+        """Return the organization's repositories."""
+        return self._store.get(
+            ("repos", org),
+            lambda: [
+                repo
+                for page in self._paginate(
+                    f"/orgs/{org}/repos?per_page={REPOS_PAGE_SIZE}"
+                )
+                for repo in page
+            ],
+        )
+
+    def contributors(self, full_name: str) -> list[dict[str, Any]]:
+        """Return a repository's top contributors ([] if unavailable)."""
+
+        def load() -> list[dict[str, Any]]:
+            try:
+                response = self._request(
+                    "GET", f"/repos/{full_name}/contributors?per_page=100"
+                )
+                return list(response.iter_json())
+            except (RuntimeError, ValueError) as e:
+                print(
+                    f"Warning: Contributors of '{full_name}' skipped: {e}",
+                    file=sys.stderr,
+                )
+                return []
+
+        return self._store.get(("contributors", full_name), load)
+
+    def _section_fetchers(self, username: str) -> dict[str, Callable[[], Any]]:
+        # username is the organization's login here
+        return {
+            "repos": lambda: self.repos(username),
+            "contributors": lambda: self._get_contributors(username),
+            "members": lambda: self.members(username),
+        }
+
+    def _get_contributors(self, org: str) -> dict[str, list[dict[str, Any]]]:
+        """Fetch contributors of the most-starred non-fork repositories."""
+        repos = sorted(
+            (repo for repo in self.repos(org) if not repo.get("fork")),
+            key=lambda repo: -(repo.get("stargazers_count") or 0),
+        )[:MAX_ORG_CONTRIBUTOR_REPOS]
+        names = [repo["full_name"] for repo in repos if repo.get("full_name")]
+        if not names:
+            return {}
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            return dict(zip(names, pool.map(self.contributors, names), strict=True))
+
+
+def org_registries() -> tuple[DefaultParserRegistry, DefaultFormatterRegistry]:
+    """Return the parsers and formatters of the org summary."""
+    parsers = DefaultParserRegistry()
+    parsers.register(ReposParser())
+    parsers.register(OrgContributorsParser())
+    formatters = DefaultFormatterRegistry()
+    formatters.register(ReposFormatter())
+    formatters.register(OrgContributorsFormatter())
+    return parsers, formatters
+
+
+def export_org(
+    org: str,
+    output_dir: Path,
+    org_extractor: OrgExtractor,
+    member_extractor: DataExtractor,
+    workers: int = DEFAULT_BATCH_WORKERS,
+    config: ExportConfig | None = None,
+) -> tuple[BatchResult, list[BatchResult]]:
+    """Export every member into output_dir/<login> and the org summary.
+
+    The summary (repositories.md and contributors.md) goes to output_dir
+    itself, or to the top of config.bundle. Like a member's, any failure
+    of the summary is recorded in its result.
+
+    Returns:
+        The summary's result (named after the org) and one per member.
+
+    Raises:
+        RuntimeError: If the member list cannot be fetched.
+    """
+    config = config or ExportConfig()
+    members = org_extractor.members(org)
+    writer: OutputWriter
+    if config.bundle is not None:
+        writer = config.bundle.writer()
+    else:
+        writer = MarkdownFileWriter(output_dir, config.fsync)
+    manifest = (
+        Manifest(output_dir) if config.incremental and config.bundle is None else None
+    )
+    parsers, formatters = org_registries()
+    converter = GitHubToMarkdownConverter(
+        org_extractor,
+        writer,
+        manifest,
+        parser_registry=parsers,
+        formatter_registry=formatters,
+        options=config.options,
+    )
+    try:
+        summary = BatchResult(org, files=converter.convert(org))
+    except Exception as e:
+        summary = BatchResult(org, error=_describe(e))
+    return summary, export_batch(members, output_dir, member_extractor, workers, config)
+
+
+def print_org_summary(
+    summary: BatchResult, members: list[BatchResult], output_dir: Path
+) -> None:
+    """Print the org summary's outcome, then the per-member summary."""
+    if summary.ok:
+        print(f"\nOrg summary for {summary.username}: {len(summary.files)} files")
+    else:
+        print(f"\nOrg summary for {summary.username} FAILED: {summary.error}")
+    print_summary(members, output_dir)
@@ -6,6 +6,9 @@ from typing import Any
 class BaseParser:
     """Base class with utility methods for parsers."""
 
+    # Sections whose parsed data this parser reads from raw_data["parsed"]
+    depends_on: tuple[str, ...] = ()
+
     def _safe_get(self, data: dict[str, Any], *keys: str, default: Any = None) -> Any:
         """Safely get nested dictionary values."""
         result = data
@@ -1,7 +1,11 @@
 """Contributions parser."""
 
+from collections.abc import Sequence
+from datetime import date, timedelta
 from typing import Any
 
+from ..constants import WEEKDAY_NAMES
+from ..records import compact_calendar
 from ..registry import register_parser
 from .base import BaseParser
 
@@ -16,11 +20,86 @@ class ContributionsParser(BaseParser):
 
     def parse(self, raw_data: dict[str, Any]) -> dict[str, Any]:
         contrib = raw_data.get("contributions", {})
-        calendar = contrib.get("contributionCalendar", {})
+        calendar = compact_calendar(contrib.get("contributionCalendar", {}))
         return {
             "total_commits": contrib.get("totalCommitContributions", 0),
             "total_issues": contrib.get("totalIssueContributions", 0),
             "total_prs": contrib.get("totalPullRequestContributions", 0),
             "total_reviews": contrib.get("totalPullRequestReviewContributions", 0),
             "total_contributions": calendar.get("totalContributions", 0),
+            **self._period(contrib.get("startedAt")),
+            **self._calendar_stats(calendar.get("startDate"), calendar.get("counts")),
         }
+
+    def _period(self, started_at: str | None) -> dict[str, Any]:
+        """Describe a history that does not cover just the last year."""
+        if not started_at:
+            return {}
+        return {"period": f"since {started_at[:10]}"}
+
+    def _calendar_stats(
+        self, start_date: str | None, counts: Sequence[int] | None
+    ) -> dict[str, Any]:
+        """Compute rollups and streaks over daily counts in one pass.
+
+        Weeks start on Sunday, as in GitHub's calendar. The current streak
+        still counts if the last day (usually today) has no contributions
+        yet.
+        """
+        if not start_date or not counts:
+            return {}
+        try:
+            start = date.fromisoformat(start_date[:10])
+        except ValueError:
+            return {}
+
+        weekdays = [0] * 7
+        weeks: list[int] = []
+        months: dict[tuple[int, int], int] = {}
+        active = 0
+        run = previous_run = 0
+        longest = longest_end = 0
+        first_weekday = start.weekday()
+        week_offset = (first_weekday + 1) % 7  # days since Sunday
+        day = start
+        for i, count in enumerate(counts):
+            day = start + timedelta(days=i)
+            weekdays[(first_weekday + i) % 7] += count
+            week = (i + week_offset) // 7
+            if week == len(weeks):
+                weeks.append(0)
+            weeks[week] += count
+            month = (day.year, day.month)
+            months[month] = months.get(month, 0) + count
+            previous_run = run
+            if count:
+                active += 1
+                run += 1
+                if run > longest:
+                    longest, longest_end = run, i
+            else:
+                run = 0
+
+        busiest = max(range(7), key=lambda d: (weekdays[d], -d))
+        best_week = max(range(len(weeks)), key=lambda w: (weeks[w], -w))
+        week_start = start - timedelta(days=week_offset)
+        stats: dict[str, Any] = {
+            "calendar_start": start.isoformat(),
+            "calendar_end": day.isoformat(),
+            "calendar_days": len(counts),
+            "active_days": active,
+            "current_streak": run if counts[-1] else previous_run,
+            "longest_streak": longest,
+            "weekly": weeks,
+            "best_week": (week_start + timedelta(weeks=best_week)).isoformat(),
+            "best_week_total": weeks[best_week],
+            "monthly": {f"{y:04d}-{m:02d}": total for (y, m), total in months.items()},
+            "weekdays": dict(zip(WEEKDAY_NAMES, weekdays, strict=True)),
+            "busiest_weekday": WEEKDAY_NAMES[busiest],
+            "busiest_weekday_total": weekdays[busiest],
+        }
+        if longest:
+            end = start + timedelta(days=longest_end)
+            stats["longest_streak_start"] = (end - timedelta(longest - 1)).isoformat()
+            stats["longest_streak_end"] = end.isoformat()
+        return stats
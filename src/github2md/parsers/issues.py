@@ -0,0 +1,16 @@
+"""Issues parser."""
+
+from ..registry import register_parser
+from .pull_requests import PullRequestsParser
+
+
+@register_parser
+class IssuesParser(PullRequestsParser):
+    """Parse a user's issues, in their own and in other repositories.
+
+    Reads ``raw_data["issues"]``, shaped like pull requests.
+    """
+
+    @property
+    def section_key(self) -> str:
+        return "issues"
@@ -0,0 +1,50 @@
+"""Byte-weighted languages parser."""
+
+from collections import Counter
+from typing import Any
+
+from ..constants import MAX_LANGUAGES
+from ..registry import register_parser
+from .base import BaseParser
+
+
+@register_parser
+class LanguagesParser(BaseParser):
+    """Aggregate language bytes across repositories.
+
+    Reads ``raw_data["languages"]`` (repository full name to its language
+    bytes), present only when languages were requested.
+    """
+
+    @property
+    def section_key(self) -> str:
+        return "languages"
+
+    def parse(self, raw_data: dict[str, Any]) -> dict[str, Any]:
+        by_repo = raw_data.get("languages") or {}
+        totals: Counter[str] = Counter()
+        repos: Counter[str] = Counter()
+        for languages in by_repo.values():
+            for name, size in languages.items():
+                if size:
+                    totals[name] += size
+                    repos[name] += 1
+
+        total = sum(totals.values())
+        top = totals.most_common(MAX_LANGUAGES)
+        other = total - sum(size for _, size in top)
+        return {
+            "languages": [
+                {
+                    "name": name,
+                    "bytes": size,
+                    "share": 100 * size / total,
+                    "repos": repos[name],
+                }
+                for name, size in top
+            ],
+            "total_bytes": total,
+            "other_bytes": other,
+            "other_share": 100 * other / total if total else 0.0,
+            "repos_counted": len(by_repo),
+        }
@@ -0,0 +1,53 @@
+"""Organization contributors parser (used by org exports, not registered)."""
+
+from collections import Counter
+from typing import Any
+
+from ..constants import MAX_ORG_CONTRIBUTORS
+from .base import BaseParser
+
+
+class OrgContributorsParser(BaseParser):
+    """Rank contributors across an organization's repositories.
+
+    Reads ``raw_data["contributors"]`` (repository name to its contributor
+    list) and ``raw_data["members"]`` (member logins).
+    """
+
+    @property
+    def section_key(self) -> str:
+        return "contributors"
+
+    def parse(self, raw_data: dict[str, Any]) -> dict[str, Any]:
+        members = sorted(raw_data.get("members") or [], key=str.lower)
+        member_set = set(members)
+        contributions: Counter[str] = Counter()
+        repos: Counter[str] = Counter()
+        urls: dict[str, str | None] = {}
+        by_repo = raw_data.get("contributors") or {}
+        for contributors in by_repo.values():
+            for person in contributors:
+                login = person.get("login")
+                if not login or person.get("type") == "Bot":
+                    continue
+                contributions[login] += person.get("contributions", 0)
+                repos[login] += 1
+                urls.setdefault(login, person.get("html_url"))
+
+        top = sorted(contributions, key=lambda login: (-contributions[login], login))
+        return {
+            "org": raw_data.get("username"),
+            "repos_scanned": len(by_repo),
+            "contributors": [
+                {
+                    "login": login,
+                    "url": urls[login],
+                    "contributions": contributions[login],
+                    "repos": repos[login],
+                    "member": login in member_set,
+                }
+                for login in top[:MAX_ORG_CONTRIBUTORS]
+            ],
+            "total_contributors": len(contributions),
+            "members": members,
+        }
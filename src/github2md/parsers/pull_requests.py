@@ -0,0 +1,45 @@
+"""Pull requests parser."""
+
+from typing import Any
+
+from ..registry import register_parser
+from .base import BaseParser
+
+
+@register_parser
+class PullRequestsParser(BaseParser):
+    """Parse a user's pull requests, to their own and to other repositories.
+
+    Reads ``raw_data["pull_requests"]``: ``own`` and ``external`` search
+    results, each with the total number of matches and the newest nodes.
+    """
+
+    @property
+    def section_key(self) -> str:
+        return "pull_requests"
+
+    def parse(self, raw_data: dict[str, Any]) -> dict[str, Any]:
+        data = raw_data.get(self.section_key) or {}
+        own = data.get("own") or {}
+        external = data.get("external") or {}
+        total_own = own.get("total", 0)
+        total_external = external.get("total", 0)
+        return {
+            "own": [self._item(node) for node in own.get("nodes") or ()],
+            "total_own": total_own,
+            "external": [self._item(node) for node in external.get("nodes") or ()],
+            "total_external": total_external,
+            "total": total_own + total_external,
+        }
+
+    def _item(self, node: dict[str, Any]) -> dict[str, Any]:
+        repo = node.get("repository") or {}
+        return {
+            "number": node.get("number"),
+            "title": node.get("title"),
+            "url": node.get("url"),
+            "state": node.get("state"),
+            "repo": repo.get("nameWithOwner"),
+            "repo_url": repo.get("url"),
+            "created_at": self._format_date(node.get("createdAt")),
+        }
@@ -1,7 +1,12 @@
 """Repositories parser."""
 
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from typing import Any
 
+from ..constants import DEFAULT_SORT_KEY, MAX_LANGUAGES, MAX_REPOS
+from ..ranking import TopK, ranking_key
+from ..records import RepoRecord
 from ..registry import register_parser
 from .base import BaseParser
 
@@ -14,43 +19,63 @@ class ReposParser(BaseParser):
     def section_key(self) -> str:
         return "repos"
 
+    def _iter_repos(self, repos: Iterable[Any]) -> Iterator[dict[str, Any]]:
+        """Flatten repos given either as repo dicts or as pages of them.
+
+        Pages may be lists or lazy iterators of repo dicts.
+        """
+        for item in repos:
+            if isinstance(item, dict):
+                yield item
+            else:
+                yield from item
+
     def parse(self, raw_data: dict[str, Any]) -> dict[str, Any]:
-        repos = raw_data.get("repos", [])
-        parsed = []
-        languages: dict[str, int] = {}
+        """Count, total and rank repositories in a single pass.
+
+        Only the top ``options["top"]`` repositories (by ``options["sort"]``)
+        become records; totals and language counts cover all of them.
+        """
+        options = raw_data.get("options", {})
+        sort = options.get("sort", DEFAULT_SORT_KEY)
+        rank = ranking_key(sort)
+        top = TopK[tuple[dict[str, Any], int, int]](options.get("top", MAX_REPOS))
+        languages: Counter[str] = Counter()
+        total = 0
         total_stars = 0
         total_forks = 0
 
-        for repo in repos:
+        for repo in self._iter_repos(raw_data.get("repos", [])):
             if repo.get("fork"):
                 continue
             stars = repo.get("stargazers_count", 0) or repo.get("stars", 0)
             forks = repo.get("forks_count", 0) or repo.get("forks", 0)
             lang = repo.get("language")
             if lang:
-                languages[lang] = languages.get(lang, 0) + 1
+                languages[lang] += 1
+            total += 1
             total_stars += stars
             total_forks += forks
-            parsed.append(
-                {
-                    "name": repo.get("name"),
-                    "description": repo.get("description"),
-                    "url": repo.get("html_url"),
-                    "language": lang,
-                    "stars": stars,
-                    "forks": forks,
-                    "topics": repo.get("topics", []),
-                    "created_at": self._format_date(repo.get("created_at")),
-                    "updated_at": self._format_date(repo.get("updated_at")),
-                }
-            )
-
-        parsed.sort(key=lambda x: x.get("stars", 0), reverse=True)
-        sorted_langs = sorted(languages.items(), key=lambda x: x[1], reverse=True)
+            top.add(rank(stars, forks, repo.get("updated_at")), (repo, stars, forks))
+
         return {
-            "repos": parsed,
-            "total": len(parsed),
+            "repos": [self._record(*ranked) for ranked in top.result()],
+            "sort": sort,
+            "total": total,
             "total_stars": total_stars,
             "total_forks": total_forks,
-            "languages": dict(sorted_langs),
+            "languages": dict(languages.most_common(MAX_LANGUAGES)),
         }
+
+    def _record(self, repo: dict[str, Any], stars: int, forks: int) -> RepoRecord:
+        return RepoRecord.create(
+            name=repo.get("name"),
+            description=repo.get("description"),
+            url=repo.get("html_url"),
+            language=repo.get("language"),
+            stars=stars,
+            forks=forks,
+            topics=repo.get("topics"),
+            created_at=self._format_date(repo.get("created_at")),
+            updated_at=self._format_date(repo.get("updated_at")),
+        )
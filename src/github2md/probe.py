@@ -0,0 +1,122 @@
+"""Cached probes of the local gh installation.
+
+Checking for gh and asking it for the authenticated login each cost a
+subprocess. Their answers are kept in a small JSON file next to the
+response cache and reused until what they depend on changes: the gh binary
+for the availability check, the token for the login.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+PROBES_FILENAME = "probes.json"
+
+
+def gh_config_dir() -> Path:
+    """Return gh's configuration directory, as gh resolves it."""
+    if os.environ.get("GH_CONFIG_DIR"):
+        return Path(os.environ["GH_CONFIG_DIR"])
+    base = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(base) / "gh"
+
+
+def token_fingerprint() -> str:
+    """Fingerprint whatever gh would authenticate with, without running it.
+
+    Covers the token environment variables and the stat of gh's hosts.yml,
+    which ``gh auth login``/``logout``/``switch`` rewrite.
+    """
+    parts = [os.environ.get(name, "") for name in ("GH_TOKEN", "GITHUB_TOKEN")]
+    parts.append(os.environ.get("GH_HOST", ""))
+    try:
+        stat = (gh_config_dir() / "hosts.yml").stat()
+        parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+    except OSError:
+        parts.append("")
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def gh_binary_fingerprint() -> str | None:
+    """Identify the gh binary on PATH, or None if there is none."""
+    path = shutil.which("gh")
+    if path is None:
+        return None
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+class ProbeCache:
+    """Probe results keyed by the fingerprint they were computed under.
+
+    With no cache file every probe simply runs.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self._path = path
+        self._data: dict[str, Any] = {}
+        if path is not None:
+            try:
+                self._data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._data = {}
+
+    def get_or_compute[T](
+        self, name: str, fingerprint: str, compute: Callable[[], T]
+    ) -> T:
+        """Return the cached value for name, recomputing on a new fingerprint.
+
+        None results are not cached, so failures are retried next time.
+        """
+        entry = self._data.get(name)
+        if isinstance(entry, dict) and entry.get("fingerprint") == fingerprint:
+            return entry["value"]
+        value = compute()
+        if value is not None:
+            self._data[name] = {"fingerprint": fingerprint, "value": value}
+            self._save()
+        return value
+
+    def _save(self) -> None:
+        if self._path is None:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._data), encoding="utf-8")
+            os.replace(tmp, self._path)
+        except OSError:
+            pass
+
+
+def gh_version(probes: ProbeCache) -> str | None:
+    """Return ``gh --version`` output, or None if gh is not installed."""
+    fingerprint = gh_binary_fingerprint()
+    if fingerprint is None:
+        return None
+
+    def run() -> str | None:
+        try:
+            result = subprocess.run(
+                ["gh", "--version"], capture_output=True, text=True, check=True
+            )
+            return result.stdout.strip()
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+
+    return probes.get_or_compute("gh_version", fingerprint, run)
+
+
+def authenticated_user(
+    probes: ProbeCache, lookup: Callable[[], str | None]
+) -> str | None:
+    """Return the authenticated login, asking lookup only on a new token."""
+    return probes.get_or_compute("login", token_fingerprint(), lookup)
@@ -5,8 +5,12 @@ All implementations depend on these abstractions, not concrete classes
 (Dependency Inversion Principle).
 """
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from .transport import ApiResponse
 
 
 @runtime_checkable
@@ -30,6 +34,87 @@ class DataExtractor(Protocol):
         ...
 
 
+@runtime_checkable
+class AsyncDataExtractor(Protocol):
+    """Protocol for extracting raw data on an asyncio event loop.
+
+    Implementations:
+    - AsyncGitHubExtractor: gh CLI run as asyncio subprocesses
+    """
+
+    async def extract_async(self, username: str) -> dict[str, Any]:
+        """Extract all data for a user without blocking the event loop.
+
+        Args:
+            username: GitHub username to extract data for.
+
+        Returns:
+            Dictionary with all extracted data sections.
+        """
+        ...
+
+
+@runtime_checkable
+class ApiTransport(Protocol):
+    """Protocol for sending requests to the GitHub API.
+
+    Implementations:
+    - GhCliTransport: Run requests through the gh CLI
+    - HttpTransport: Pooled keep-alive HTTPS connections
+    """
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> "ApiResponse":
+        """Send one request and return the response, whatever its status.
+
+        Args:
+            method: HTTP method, e.g. "GET".
+            path: API path ("/users/octocat", "graphql") or absolute URL.
+            body: Optional JSON-serializable request body.
+            headers: Extra request headers.
+
+        Returns:
+            The response, including error statuses.
+
+        Raises:
+            RuntimeError: If no response could be obtained at all.
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncApiTransport(Protocol):
+    """Protocol for sending GitHub API requests from coroutines."""
+
+    async def request_async(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> "ApiResponse":
+        """Send one request; same contract as ApiTransport.request."""
+        ...
+
+
+@runtime_checkable
+class DualApiTransport(ApiTransport, AsyncApiTransport, Protocol):
+    """Protocol for transports usable from both threads and coroutines.
+
+    Implementations:
+    - AsyncGhCliTransport: gh CLI as blocking or asyncio subprocesses
+    - AsyncRateLimitedTransport, AsyncCachingTransport: pacing and caching
+      of both kinds of requests
+    """
+
+
 @runtime_checkable
 class SectionParser(Protocol):
     """Protocol for parsing one section of raw GitLab data.
@@ -37,6 +122,10 @@ class SectionParser(Protocol):
     Each parser handles ONE section (Single Responsibility Principle).
     New parsers can be added via @register_parser decorator
     (Open/Closed Principle).
+
+    A parser may set ``depends_on`` to a tuple of section keys; it is then
+    run after those parsers and finds their results in
+    ``raw_data["parsed"]``.
     """
 
     @property
@@ -63,6 +152,9 @@ class SectionFormatter(Protocol):
     Each formatter handles ONE section (Single Responsibility Principle).
     New formatters can be added via @register_formatter decorator
     (Open/Closed Principle).
+
+    A formatter may set ``depends_on`` to a tuple of section keys whose
+    files must be written first.
     """
 
     @property
@@ -87,6 +179,26 @@ class SectionFormatter(Protocol):
         ...
 
 
+@runtime_checkable
+class StreamingSectionFormatter(SectionFormatter, Protocol):
+    """Formatter that can also render its section incrementally.
+
+    Implementations:
+    - ReposFormatter: One chunk per repository
+    """
+
+    def format_chunks(self, parsed_data: Any) -> Iterator[str]:
+        """Yield Markdown chunks whose concatenation equals format().
+
+        Args:
+            parsed_data: Parsed data from corresponding parser.
+
+        Returns:
+            Iterator of Markdown fragments.
+        """
+        ...
+
+
 @runtime_checkable
 class OutputWriter(Protocol):
     """Protocol for writing content to output destination.
@@ -94,6 +206,9 @@ class OutputWriter(Protocol):
     Implementations:
     - MarkdownFileWriter: Write to filesystem with security validation
     - InMemoryWriter: Write to memory for testing
+
+    Writers may also define ``flush()``, which the converter calls once
+    after all sections of an export were written.
     """
 
     def write(self, filename: str, content: str) -> Path:
@@ -112,6 +227,26 @@ class OutputWriter(Protocol):
         ...
 
 
+@runtime_checkable
+class StreamingOutputWriter(OutputWriter, Protocol):
+    """Writer that can consume content as it is produced."""
+
+    def write_chunks(self, filename: str, chunks: Iterable[str]) -> Path:
+        """Write chunks to destination in order and return path.
+
+        Args:
+            filename: The filename to write to.
+            chunks: Content fragments, consumed once.
+
+        Returns:
+            Path to the written file.
+
+        Raises:
+            ValueError: If filename is invalid (e.g., path traversal).
+        """
+        ...
+
+
 @runtime_checkable
 class ParserRegistry(Protocol):
     """Protocol for parser registry."""
@@ -0,0 +1,67 @@
+"""Top-K ranking of repositories."""
+
+import heapq
+from collections.abc import Callable
+from typing import Any
+
+from .constants import SCORE_FORK_WEIGHT, SCORE_STAR_WEIGHT
+
+# A ranking maps (stars, forks, updated_at) to a sort key, larger first.
+type Ranking = Callable[[int, int, str | None], Any]
+
+
+def weighted_score(stars: int, forks: int, updated_at: str | None) -> float:
+    """Rank by stars and forks together."""
+    return SCORE_STAR_WEIGHT * stars + SCORE_FORK_WEIGHT * forks
+
+
+RANKING_KEYS: dict[str, Ranking] = {
+    "stars": lambda stars, forks, updated_at: stars,
+    "forks": lambda stars, forks, updated_at: forks,
+    "updated": lambda stars, forks, updated_at: updated_at or "",
+    "score": weighted_score,
+}
+
+
+def ranking_key(name: str) -> Ranking:
+    """Return the ranking function for a sort key name.
+
+    Raises:
+        ValueError: If name is not a known ranking.
+    """
+    try:
+        return RANKING_KEYS[name]
+    except KeyError:
+        raise ValueError(f"Unknown sort key: {name}") from None
+
+
+class TopK[T]:
+    """Keep the k items with the largest keys, in O(n log k) overall.
+
+    Ties keep the order items were added in, like a stable
+    ``sorted(..., reverse=True)[:k]``.
+    """
+
+    def __init__(self, k: int) -> None:
+        self._k = k
+        self._heap: list[tuple[Any, int, T]] = []
+        self._seen = 0
+
+    def add(self, key: Any, item: T) -> bool:
+        """Offer an item; return whether it is (for now) among the top k."""
+        seq = self._seen
+        self._seen += 1
+        heap = self._heap
+        if len(heap) < self._k:
+            # Negated sequence numbers make later items lose ties; being
+            # unique they also keep comparisons from reaching the items.
+            heapq.heappush(heap, (key, -seq, item))
+            return True
+        if not heap or key <= heap[0][0]:
+            return False
+        heapq.heapreplace(heap, (key, -seq, item))
+        return True
+
+    def result(self) -> list[T]:
+        """Return the kept items, best first."""
+        return [item for _, _, item in sorted(self._heap, reverse=True)]
@@ -0,0 +1,198 @@
+"""Rate-limit-aware pacing and retrying of GitHub API requests."""
+
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .constants import (
+    RATE_LIMIT_BACKOFF_BASE,
+    RATE_LIMIT_BACKOFF_MAX,
+    RATE_LIMIT_MAX_RETRIES,
+    RATE_LIMIT_NOTICE_AFTER,
+    RATE_LIMIT_PACING_THRESHOLD,
+    RATE_LIMIT_RESET_GRACE,
+)
+from .protocols import ApiTransport
+from .transport import ApiResponse
+
+
+def resource_for(path: str) -> str:
+    """Name the rate limit budget a request is charged against."""
+    path = path.split("://", 1)[-1].partition("/")[2] if "://" in path else path
+    path = path.lstrip("/")
+    if path == "graphql":
+        return "graphql"
+    if path.startswith("search/"):
+        return "search"
+    return "core"
+
+
+def is_rate_limited(response: ApiResponse, resource: str = "core") -> bool:
+    """Whether a response was rejected by a primary or secondary limit.
+
+    GraphQL reports exhausted budgets as a 200 whose ``errors`` include one
+    of type RATE_LIMITED; that is only looked for in GraphQL responses.
+    """
+    if response.status == 429:
+        return True
+    if response.status == 403:
+        return (
+            response.headers.get("x-ratelimit-remaining") == "0"
+            or "retry-after" in response.headers
+            or b"rate limit" in response.body.lower()
+        )
+    if response.status != 200 or resource != "graphql":
+        return False
+    if b"RATE_LIMITED" not in response.body:
+        return False
+    payload = response.json()
+    errors = payload.get("errors") if isinstance(payload, dict) else None
+    return any(
+        isinstance(error, dict) and error.get("type") == "RATE_LIMITED"
+        for error in errors or ()
+    )
+
+
+@dataclass(slots=True)
+class RateBudget:
+    """What is known about one rate limit resource ("core", "graphql")."""
+
+    limit: int | None = None
+    remaining: float = float("inf")
+    reset_at: float = 0.0
+    next_slot: float = 0.0
+
+
+class RateLimiter:
+    """Token bucket pacing per rate limit resource.
+
+    Each budget starts full and is corrected from X-RateLimit-* headers.
+    Requests flow freely while plenty of budget remains; below
+    RATE_LIMIT_PACING_THRESHOLD the remaining tokens are spread evenly until
+    the reset, and an empty bucket waits for the reset instead of failing.
+    Backoffs move the next free slot, so every thread sharing the limiter
+    pauses together.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._budgets: dict[str, RateBudget] = {}
+
+    def budget(self, resource: str) -> RateBudget:
+        """Return the budget for a resource, creating it when unknown."""
+        return self._budgets.setdefault(resource, RateBudget())
+
+    def acquire(self, resource: str) -> None:
+        """Block until a request against resource may be sent."""
+        wait = self.reserve(resource)
+        if wait > 0:
+            self._sleep(wait)
+
+    def reserve(self, resource: str) -> float:
+        """Claim the next slot for resource; return the seconds until it.
+
+        The caller waits that long itself, e.g. with asyncio.sleep.
+        """
+        with self._lock:
+            budget = self.budget(resource)
+            now = self._clock()
+            start = max(now, budget.next_slot)
+            if budget.remaining < 1:
+                start = max(start, budget.reset_at + RATE_LIMIT_RESET_GRACE)
+                budget.remaining = budget.limit or 1
+            budget.remaining -= 1
+            budget.next_slot = start + self._interval(budget, start)
+
+        wait = start - now
+        if wait >= RATE_LIMIT_NOTICE_AFTER:
+            print(
+                f"Rate limit: waiting {wait:.0f}s for the {resource} budget",
+                file=sys.stderr,
+            )
+        return wait
+
+    def _interval(self, budget: RateBudget, now: float) -> float:
+        """Spacing between requests once the budget runs low."""
+        if budget.limit is None:
+            return 0.0
+        if budget.remaining >= budget.limit * RATE_LIMIT_PACING_THRESHOLD:
+            return 0.0
+        return max(budget.reset_at - now, 0.0) / max(budget.remaining, 1.0)
+
+    def update(self, resource: str, headers: dict[str, str]) -> None:
+        """Correct a budget from a response's X-RateLimit-* headers."""
+        try:
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset_at = float(headers["x-ratelimit-reset"])
+            limit = int(headers.get("x-ratelimit-limit", 0)) or None
+        except (KeyError, ValueError):
+            return
+        with self._lock:
+            budget = self.budget(resource)
+            budget.limit = limit or budget.limit
+            budget.remaining = remaining
+            budget.reset_at = reset_at
+
+    def backoff(self, resource: str, headers: dict[str, str], attempt: int) -> float:
+        """Push back the next slot after a rate-limited response.
+
+        Honours Retry-After, then an exhausted primary budget's reset time,
+        and otherwise backs off exponentially (secondary limits).
+        """
+        now = self._clock()
+        try:
+            delay = float(headers["retry-after"])
+        except (KeyError, ValueError):
+            delay = min(RATE_LIMIT_BACKOFF_BASE * 2**attempt, RATE_LIMIT_BACKOFF_MAX)
+            if headers.get("x-ratelimit-remaining") == "0":
+                try:
+                    reset_at = float(headers["x-ratelimit-reset"])
+                    delay = max(reset_at - now, 0.0) + RATE_LIMIT_RESET_GRACE
+                except (KeyError, ValueError):
+                    pass
+        with self._lock:
+            budget = self.budget(resource)
+            budget.next_slot = max(budget.next_slot, now + delay)
+        return delay
+
+
+class RateLimitedTransport(ApiTransport):
+    """Pace requests through a RateLimiter and retry rate-limited ones."""
+
+    def __init__(
+        self,
+        inner: ApiTransport,
+        limiter: RateLimiter,
+        max_retries: int = RATE_LIMIT_MAX_RETRIES,
+    ) -> None:
+        self._inner = inner
+        self._limiter = limiter
+        self._max_retries = max_retries
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> ApiResponse:
+        resource = resource_for(path)
+        attempt = 0
+        while True:
+            self._limiter.acquire(resource)
+            response = self._inner.request(method, path, body=body, headers=headers)
+            self._limiter.update(resource, response.headers)
+            if not is_rate_limited(response, resource) or attempt >= self._max_retries:
+                return response
+            self._limiter.backoff(resource, response.headers, attempt)
+            attempt += 1
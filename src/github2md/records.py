@@ -0,0 +1,92 @@
+"""Compact typed records for raw and parsed sections."""
+
+import sys
+from array import array
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if value else value
+
+
+@dataclass(slots=True, frozen=True)
+class RepoRecord:
+    """One repository as parsed by ReposParser.
+
+    Languages, topics and dates repeat across thousands of repositories and
+    are interned; item access (``record["stars"]``, ``record.get("url")``) is
+    kept for formatters written against the former dict layout.
+    """
+
+    name: str | None
+    description: str | None = None
+    url: str | None = None
+    language: str | None = None
+    stars: int = 0
+    forks: int = 0
+    topics: tuple[str, ...] = ()
+    created_at: str | None = None
+    updated_at: str | None = None
+
+    @classmethod
+    def create(
+        cls,
+        name: str | None,
+        description: str | None = None,
+        url: str | None = None,
+        language: str | None = None,
+        stars: int = 0,
+        forks: int = 0,
+        topics: Any = (),
+        created_at: str | None = None,
+        updated_at: str | None = None,
+    ) -> "RepoRecord":
+        """Build a record, interning repeated strings."""
+        return cls(
+            name,
+            description,
+            url,
+            _intern(language),
+            stars,
+            forks,
+            tuple(sys.intern(topic) for topic in topics or ()),
+            _intern(created_at),
+            _intern(updated_at),
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by name, like dict.get."""
+        return getattr(self, key, default)
+
+
+def compact_calendar(calendar: Mapping[str, Any]) -> dict[str, Any]:
+    """Store a contribution calendar's days as one array of daily counts.
+
+    ``weeks[].contributionDays[]`` as returned by GitHub (one dict per day)
+    becomes ``startDate`` (the first day) and ``counts``, an ``array("I")``
+    of the counts of consecutive days. Calendars that are already compact,
+    or have no days, are returned unchanged (as a dict).
+    """
+    weeks = calendar.get("weeks")
+    if weeks is None:
+        return dict(calendar)
+    counts = array("I")
+    start = None
+    for week in weeks:
+        for day in week.get("contributionDays") or ():
+            if start is None:
+                start = day.get("date")
+            counts.append(day.get("contributionCount") or 0)
+    compact = {k: v for k, v in calendar.items() if k != "weeks"}
+    if start is not None:
+        compact["startDate"] = start
+        compact["counts"] = counts
+    return compact
@@ -1,5 +1,7 @@
 """Decorator-based registration for parsers and formatters."""
 
+import importlib
+
 from .protocols import SectionFormatter, SectionParser
 
 
@@ -43,9 +45,21 @@ def register_formatter[T](cls: type[T]) -> type[T]:
     return cls
 
 
+def _load_builtin_plugins() -> None:
+    """Import the built-in parsers and formatters so they self-register.
+
+    Deferred until a registry is first requested, so importing the package
+    (e.g. for ``github2md --help``) does not load every plugin module.
+    """
+    importlib.import_module(f"{__package__}.parsers")
+    importlib.import_module(f"{__package__}.formatters")
+
+
 def get_parser_registry() -> DefaultParserRegistry:
+    _load_builtin_plugins()
     return _parser_registry
 
 
 def get_formatter_registry() -> DefaultFormatterRegistry:
+    _load_builtin_plugins()
     return _formatter_registry
@@ -0,0 +1,36 @@
+"""In-process store for data fetched once and shared within a run."""
+
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+
+
+class SharedStore[K: Hashable, V]:
+    """Memoize loads by key; concurrent callers of one key share one load.
+
+    Failed loads are not remembered: their callers see the error and the
+    next caller loads again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[K, Future[V]] = {}
+
+    def get(self, key: K, load: Callable[[], V]) -> V:
+        """Return the value for key, calling load only if nobody has yet."""
+        with self._lock:
+            entry = self._entries.get(key)
+            owner = entry is None
+            if entry is None:
+                entry = self._entries[key] = Future()
+        if owner:
+            try:
+                entry.set_result(load())
+            except BaseException as e:
+                with self._lock:
+                    del self._entries[key]
+                entry.set_exception(e)
+        return entry.result()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,130 @@
+"""Raw data snapshots: record extractions to disk and replay them offline."""
+
+import gzip
+import json
+import os
+from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from .constants import SNAPSHOT_COMPRESS_LEVEL, SNAPSHOT_SUFFIX
+from .protocols import DataExtractor
+
+# Keys the converter adds to raw data; they are not part of a snapshot.
+_DERIVED_KEYS = ("options", "parsed")
+
+
+def materialize(value: Any) -> Any:
+    """Return value with every lazy iterable (e.g. repo pages) made a list."""
+    if isinstance(value, Mapping):
+        return {key: materialize(item) for key, item in value.items()}
+    if isinstance(value, str | bytes | int | float | bool) or value is None:
+        return value
+    if isinstance(value, Iterable):
+        return [materialize(item) for item in value]
+    return value
+
+
+class SnapshotStore:
+    """Compressed raw-data snapshots, one file per user and capture time.
+
+    Snapshots live in ``directory/<username>/<timestamp>.json.gz``, so every
+    capture is kept and the latest one sorts last.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._dir = directory
+
+    def _user_dir(self, username: str) -> Path:
+        if (
+            not username
+            or username.startswith(".")
+            or any(c in username for c in "/\\\x00")
+        ):
+            raise ValueError(f"Invalid username: {username}")
+        return self._dir / username
+
+    def save(self, raw_data: Mapping[str, Any]) -> Path:
+        """Write a snapshot of raw_data (which must be materialized).
+
+        Returns:
+            The snapshot's path.
+        """
+        user_dir = self._user_dir(raw_data["username"])
+        user_dir.mkdir(parents=True, exist_ok=True)
+        now = datetime.now(UTC)
+        data = {k: v for k, v in raw_data.items() if k not in _DERIVED_KEYS}
+        payload = {"version": 1, "created_at": now.isoformat(), "data": data}
+        path = user_dir / f"{now:%Y%m%dT%H%M%S%fZ}{SNAPSHOT_SUFFIX}"
+        tmp = path.with_name(f".{path.name}.tmp")
+        with gzip.open(
+            tmp, "wt", encoding="utf-8", compresslevel=SNAPSHOT_COMPRESS_LEVEL
+        ) as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp, path)
+        return path
+
+    def history(self, username: str) -> list[Path]:
+        """Return a user's snapshots, oldest first."""
+        return sorted(self._user_dir(username).glob(f"*{SNAPSHOT_SUFFIX}"))
+
+    def usernames(self) -> list[str]:
+        """Return the users that have at least one snapshot, sorted."""
+        if not self._dir.is_dir():
+            return []
+        return sorted(
+            entry.name
+            for entry in self._dir.iterdir()
+            if entry.is_dir() and any(entry.glob(f"*{SNAPSHOT_SUFFIX}"))
+        )
+
+    def load(self, path: Path) -> dict[str, Any]:
+        """Read the raw data stored in a snapshot.
+
+        Raises:
+            RuntimeError: If the snapshot cannot be read.
+        """
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)["data"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise RuntimeError(f"Unreadable snapshot {path}: {e}") from e
+
+    def latest(self, username: str) -> dict[str, Any]:
+        """Read a user's most recent snapshot.
+
+        Raises:
+            RuntimeError: If the user has no readable snapshot.
+        """
+        snapshots = self.history(username)
+        if not snapshots:
+            raise RuntimeError(f"No snapshot for user: {username}")
+        return self.load(snapshots[-1])
+
+
+class SnapshotExtractor(DataExtractor):
+    """Replay the latest snapshot of each user, without network access."""
+
+    def __init__(self, store: SnapshotStore) -> None:
+        self._store = store
+
+    def extract(self, username: str) -> dict[str, Any]:
+        return self._store.latest(username)
+
+
+class RecordingExtractor(DataExtractor):
+    """Extract with another extractor and save a snapshot of each result.
+
+    Lazy sections (repository pages) are read in full before saving, so
+    they are no longer streamed to the parsers.
+    """
+
+    def __init__(self, extractor: DataExtractor, store: SnapshotStore) -> None:
+        self._extractor = extractor
+        self._store = store
+
+    def extract(self, username: str) -> dict[str, Any]:
+        raw_data = materialize(self._extractor.extract(username))
+        self._store.save(raw_data)
+        return raw_data
@@ -0,0 +1,148 @@
+"""Transports that carry GitHub API requests for the extractors."""
+
+import json
+import os
+import re
+import subprocess
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from .constants import JSON_STREAM_CHUNK_SIZE
+from .jsonstream import iter_json_array
+from .protocols import ApiTransport
+
+_ARRAY_START_RE = re.compile(rb"\s*\[")
+
+
+@dataclass(slots=True)
+class ApiResponse:
+    """An HTTP response from the GitHub API.
+
+    Header names are lower-cased; the body is kept as raw bytes.
+    """
+
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def json(self) -> Any:
+        """Decode the body as JSON, returning {} when empty or invalid."""
+        if not self.body.strip():
+            return {}
+        try:
+            return json.loads(self.body)
+        except json.JSONDecodeError:
+            return {}
+
+    def iter_json(self) -> Iterator[Any]:
+        """Decode the buffered JSON array body element by element.
+
+        The body has already been read in full (the cache and Link-header
+        pagination need it); only decoding is incremental, so the decoded
+        elements are never all held at once. Yields nothing if the body is
+        not an array.
+
+        Raises:
+            ValueError: If the array is malformed.
+        """
+        if not _ARRAY_START_RE.match(self.body):
+            return iter(())
+        body = memoryview(self.body)
+        return iter_json_array(
+            body[i : i + JSON_STREAM_CHUNK_SIZE]
+            for i in range(0, len(body), JSON_STREAM_CHUNK_SIZE)
+        )
+
+
+def resolve_token(token: str | None = None) -> str | None:
+    """Resolve a GitHub token the way gh does.
+
+    An explicit token wins, then GH_TOKEN and GITHUB_TOKEN, then the token
+    stored by ``gh auth login``.
+    """
+    if token:
+        return token
+    for name in ("GH_TOKEN", "GITHUB_TOKEN"):
+        if os.environ.get(name):
+            return os.environ[name]
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"], capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip() or None
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+
+def parse_http_response(raw: bytes) -> ApiResponse:
+    """Parse a status line, headers and body as printed by ``gh api -i``."""
+    for separator in (b"\r\n\r\n", b"\n\n"):
+        head, sep, body = raw.partition(separator)
+        if sep:
+            break
+    else:
+        head, body = raw, b""
+
+    status_line, *header_lines = head.decode("iso-8859-1").splitlines()
+    headers: dict[str, str] = {}
+    for line in header_lines:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return ApiResponse(int(status_line.split()[1]), headers, body)
+
+
+class GhCliTransport(ApiTransport):
+    """Send requests by running ``gh api``.
+
+    gh handles authentication, so this needs no token unless one is given.
+    """
+
+    def __init__(self, token: str | None = None) -> None:
+        self._token = token
+
+    def _command(
+        self, method: str, path: str, body: Any, headers: dict[str, str] | None
+    ) -> tuple[list[str], bytes | None]:
+        """Build the gh api argument list and its stdin."""
+        args = ["gh", "api", "--include", "--method", method, path.lstrip("/")]
+        for name, value in (headers or {}).items():
+            args += ["-H", f"{name}: {value}"]
+        stdin = None
+        if body is not None:
+            args += ["--input", "-"]
+            stdin = json.dumps(body).encode()
+        return args, stdin
+
+    def _env(self) -> dict[str, str] | None:
+        if not self._token:
+            return None
+        env = os.environ.copy()
+        env["GH_TOKEN"] = self._token
+        return env
+
+    def _response(self, stdout: bytes, stderr: bytes) -> ApiResponse:
+        """Parse gh output into a response, or raise if gh itself failed."""
+        # gh prints the response even for HTTP errors; anything else is a
+        # failure of gh itself (not installed, not authenticated, ...).
+        if not stdout.startswith(b"HTTP/"):
+            message = stderr.decode(errors="replace").lower()
+            if "rate limit" in message:
+                raise RuntimeError("GitHub API rate limit exceeded")
+            if "not found" in message:
+                raise RuntimeError("User or resource not found")
+            raise RuntimeError("GitHub CLI command failed")
+        return parse_http_response(stdout)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> ApiResponse:
+        args, stdin = self._command(method, path, body, headers)
+        result = subprocess.run(args, input=stdin, capture_output=True, env=self._env())
+        return self._response(result.stdout, result.stderr)
@@ -1,19 +1,30 @@
 """Output writers for markdown files."""
 
+import filecmp
+import os
+from collections.abc import Iterable
 from pathlib import Path
 
-from github2md.protocols import OutputWriter
+from github2md.protocols import StreamingOutputWriter
 
 
-class MarkdownFileWriter(OutputWriter):
+class MarkdownFileWriter(StreamingOutputWriter):
     """Write markdown content to files.
 
+    Files are replaced atomically through a temporary file, and left
+    untouched (mtime included) when their content would not change. With
+    fsync, written files are made durable together by ``flush()``, once
+    per export instead of once per file.
+
     Single Responsibility: Only handles file I/O with security validation.
     """
 
-    def __init__(self, output_dir: Path) -> None:
+    def __init__(self, output_dir: Path, fsync: bool = False) -> None:
         self._output_dir = output_dir
         self._output_dir.mkdir(parents=True, exist_ok=True)
+        self._root = output_dir.resolve()
+        self._fsync = fsync
+        self._pending: list[Path] = []
 
     def _validate_filename(self, filename: str) -> None:
         """Validate filename to prevent path traversal and injection attacks.
@@ -38,11 +49,19 @@ class MarkdownFileWriter(OutputWriter):
             raise ValueError(f"Invalid filename: {filename}")
 
         # Ensure resolved path stays within output directory (canonical check)
-        test_path = (self._output_dir / filename).resolve()
-        output_resolved = self._output_dir.resolve()
-        if not str(test_path).startswith(str(output_resolved)):
+        if not (self._root / filename).resolve().is_relative_to(self._root):
             raise ValueError(f"Invalid filename: {filename}")
 
+    def _target(self, filename: str) -> Path:
+        """Validate filename and return the path it is written to."""
+        self._validate_filename(filename)
+
+        # Add .md extension if not present
+        if not filename.endswith(".md"):
+            filename = f"{filename}.md"
+
+        return self._output_dir / filename
+
     def write(self, filename: str, content: str) -> Path:
         """Write content to a file and return the path.
 
@@ -56,18 +75,95 @@ class MarkdownFileWriter(OutputWriter):
         Raises:
             ValueError: If filename contains path traversal attempts.
         """
-        self._validate_filename(filename)
+        filepath = self._target(filename)
+        data = content.encode("utf-8")
+        if _has_content(filepath, data):
+            return filepath
+        tmp = _tmp_path(filepath)
+        try:
+            tmp.write_bytes(data)
+            self._replace(tmp, filepath)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return filepath
 
-        # Add .md extension if not present
-        if not filename.endswith(".md"):
-            filename = f"{filename}.md"
+    def write_chunks(self, filename: str, chunks: Iterable[str]) -> Path:
+        """Write content chunk by chunk and return the path.
+
+        Chunks are encoded and written as bytes, exactly like ``write``, to
+        a temporary file that replaces the target only once all of them
+        were written, so a failing producer leaves the previous file in
+        place.
 
-        filepath = self._output_dir / filename
-        filepath.write_text(content, encoding="utf-8")
+        Raises:
+            ValueError: If filename contains path traversal attempts.
+        """
+        filepath = self._target(filename)
+        tmp = _tmp_path(filepath)
+        try:
+            with tmp.open("wb") as f:
+                f.writelines(chunk.encode("utf-8") for chunk in chunks)
+            if _same_file_content(tmp, filepath):
+                tmp.unlink()
+            else:
+                self._replace(tmp, filepath)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
         return filepath
 
+    def _replace(self, tmp: Path, filepath: Path) -> None:
+        os.replace(tmp, filepath)
+        if self._fsync:
+            self._pending.append(filepath)
+
+    def flush(self) -> None:
+        """Fsync files written since the last flush, then their directory.
+
+        Does nothing unless the writer was created with fsync.
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        for path in pending:
+            _fsync_path(path, os.O_RDONLY)
+        _fsync_path(self._output_dir, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+
+
+def _tmp_path(filepath: Path) -> Path:
+    return filepath.with_name(f".{filepath.name}.tmp")
+
 
-class InMemoryWriter(OutputWriter):
+def _has_content(path: Path, data: bytes) -> bool:
+    """Whether the file at path holds exactly data."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def _same_file_content(new: Path, old: Path) -> bool:
+    try:
+        return filecmp.cmp(new, old, shallow=False)
+    except OSError:
+        return False
+
+
+def _fsync_path(path: Path, flags: int) -> None:
+    try:
+        fd = os.open(path, flags)
+    except OSError:
+        return  # e.g. directories cannot be opened on Windows
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class InMemoryWriter(StreamingOutputWriter):
     """In-memory writer for testing.
 
     Single Responsibility: Store output in memory.
@@ -84,3 +180,7 @@ class InMemoryWriter(OutputWriter):
 
         self.files[filename] = content
         return Path(filename)
+
+    def write_chunks(self, filename: str, chunks: Iterable[str]) -> Path:
+        """Store joined chunks in memory."""
+        return self.write(filename, "".join(chunks))
@@ -0,0 +1,46 @@
+"""Test doubles shared by several test modules."""
+
+from github2md.extractor import DictExtractor
+from github2md.transport import ApiResponse
+
+
+class FakeClock:
+    """A monotonic clock that only moves when told to (or slept on)."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeTransport:
+    """Answer requests with canned responses, recording each request."""
+
+    def __init__(self, *responses: ApiResponse):
+        self.responses = list(responses)
+        self.requests = []
+
+    @property
+    def calls(self):
+        return len(self.requests)
+
+    def request(self, method, path, *, body=None, headers=None):
+        self.requests.append((method, path, headers or {}))
+        return self.responses.pop(0)
+
+
+class FailingForGhost(DictExtractor):
+    """Fail like GitHub for "ghost", and unexpectedly for "odd"."""
+
+    def extract(self, username):
+        if username == "ghost":
+            raise RuntimeError("User or resource not found")
+        if username == "odd":
+            raise KeyError("login")
+        return super().extract(username)
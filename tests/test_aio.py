@@ -0,0 +1,158 @@
+"""Tests for asyncio extraction."""
+
+import asyncio
+import json
+import os
+from datetime import date
+
+import pytest
+
+from github2md.aio import (
+    AsyncCachingTransport,
+    AsyncGhCliTransport,
+    AsyncGitHubExtractor,
+    AsyncRateLimitedTransport,
+)
+from github2md.batch import export_batch_async
+from github2md.cache import ResponseCache
+from github2md.converter import GitHubToMarkdownConverter
+from github2md.extractor import DictExtractor, GitHubExtractor
+from github2md.ratelimit import RateLimiter
+from github2md.transport import ApiResponse
+from github2md.writer import InMemoryWriter
+
+from .conftest import FakeClock, FakeTransport
+
+
+class FakeAsyncTransport:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _response(self, path, body):
+        if path == "graphql" and "search" in body["variables"]:
+            search = {"issueCount": 1, "nodes": [{"title": "Fix"}]}
+            payload = {"data": {"search": search}}
+        elif path == "graphql":
+            collection = {"totalCommitContributions": 3}
+            payload = {"data": {"user": {"contributionsCollection": collection}}}
+        elif path.endswith("/repos?per_page=100"):
+            payload = [{"name": "repo1", "full_name": "octocat/repo1"}]
+        elif path.endswith("/languages"):
+            payload = {"Python": 100}
+        else:
+            payload = {"login": "octocat"}
+        return ApiResponse(200, {}, json.dumps(payload).encode())
+
+    def request(self, method, path, *, body=None, headers=None):
+        return self._response(path, body)
+
+    async def request_async(self, method, path, *, body=None, headers=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self._response(path, body)
+
+
+class FakeDualTransport(FakeTransport):
+    async def request_async(self, method, path, *, body=None, headers=None):
+        return self.request(method, path, body=body, headers=headers)
+
+
+class TestAsyncGitHubExtractor:
+    def test_extract_async_gathers_sections(self):
+        transport = FakeAsyncTransport()
+        extractor = AsyncGitHubExtractor(transport=transport)  # type: ignore[arg-type]
+        data = asyncio.run(extractor.extract_async("octocat"))
+        assert data["profile"] == [{"login": "octocat"}]
+        assert data["repos"] == [[{"name": "repo1", "full_name": "octocat/repo1"}]]
+        assert data["contributions"] == {"totalCommitContributions": 3}
+        assert data["pull_requests"]["own"]["total"] == 1
+        assert transport.max_in_flight == 3
+
+    @pytest.mark.parametrize(
+        "options", [{}, {"since": date(2020, 1, 1), "languages": True}]
+    )
+    def test_sections_match_the_sync_extractor(self, options):
+        transport = FakeAsyncTransport()
+        extractor = AsyncGitHubExtractor(transport=transport, **options)  # type: ignore[arg-type]
+        data = asyncio.run(extractor.extract_async("octocat"))
+        expected = GitHubExtractor(transport=transport, **options).extract("octocat")
+        assert data.keys() == expected.keys()
+        assert data["contributions"] == expected["contributions"]
+
+    def test_sync_extract_wraps_async(self):
+        extractor = AsyncGitHubExtractor(transport=FakeAsyncTransport())  # type: ignore[arg-type]
+        assert extractor.extract("octocat")["profile"] == [{"login": "octocat"}]
+
+
+class TestAsyncTransportWrappers:
+    def test_rate_limited_requests_wait_without_blocking(self):
+        clock = FakeClock()
+        limited = ApiResponse(429, {"retry-after": "30"})
+        inner = FakeDualTransport(limited, ApiResponse(200, {}, b"{}"))
+
+        async def sleep(seconds):
+            clock.sleep(seconds)
+
+        transport = AsyncRateLimitedTransport(
+            inner, RateLimiter(clock=clock, sleep=clock.sleep), sleep=sleep
+        )
+        response = asyncio.run(transport.request_async("GET", "/users/u"))
+
+        assert response.status == 200
+        assert inner.calls == 2
+        assert clock.sleeps == [30.0]
+
+    def test_cached_requests_revalidate(self, tmp_path):
+        inner = FakeDualTransport(
+            ApiResponse(200, {"etag": '"v1"'}, b"[1]"),
+            ApiResponse(304, {"etag": '"v1"'}),
+        )
+        transport = AsyncCachingTransport(inner, ResponseCache(tmp_path, ttl=0))
+
+        async def run():
+            await transport.request_async("GET", "/users/u/repos")
+            return await transport.request_async("GET", "/users/u/repos")
+
+        response = asyncio.run(run())
+        assert response.json() == [1]
+        assert inner.requests[1][2]["If-None-Match"] == '"v1"'
+        assert transport.stats.revalidated == 1
+
+
+class TestAsyncGhCliTransport:
+    def test_runs_gh_as_subprocess(self, tmp_path, monkeypatch):
+        gh = tmp_path / "gh"
+        response = 'HTTP/2.0 200 OK\\r\\nEtag: "x"\\r\\n\\r\\n{"ok": 1}'
+        gh.write_text(f"#!/bin/sh\nprintf '{response}'\n")
+        gh.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+        async def run():
+            transport = AsyncGhCliTransport(concurrency=2)
+            return await asyncio.gather(
+                *(transport.request_async("GET", "/users/u") for _ in range(5))
+            )
+
+        responses = asyncio.run(run())
+        assert [r.json() for r in responses] == [{"ok": 1}] * 5
+        assert responses[0].headers["etag"] == '"x"'
+
+
+def test_export_batch_async_accepts_sync_extractors(tmp_path):
+    extractor = DictExtractor({"profile": [{"name": "Someone"}]})
+    results = asyncio.run(export_batch_async(["alice", "bob"], tmp_path, extractor))
+    assert [r.ok for r in results] == [True, True]
+    assert (tmp_path / "bob" / "profile.md").exists()
+
+
+def test_convert_runs_async_only_extractors(tmp_path):
+    class AsyncOnly:
+        async def extract_async(self, username):
+            return {"profile": [{"name": "Async"}]}
+
+    writer = InMemoryWriter()
+    GitHubToMarkdownConverter(AsyncOnly(), writer).convert("octocat")
+    assert "Async" in writer.files["profile.md"]
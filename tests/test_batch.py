@@ -0,0 +1,35 @@
+"""Tests for batch export."""
+
+from github2md.batch import export_batch, read_usernames
+
+from .conftest import FailingForGhost
+
+
+class TestReadUsernames:
+    def test_skips_comments_blanks_and_duplicates(self):
+        lines = ["alice\n", "\n", "# team\n", "bob carol  # leads\n", "alice\n"]
+        assert read_usernames(lines) == ["alice", "bob", "carol"]
+
+
+class TestExportBatch:
+    def test_writes_per_user_directories_and_reports_failures(self, tmp_path):
+        extractor = FailingForGhost({"profile": [{"name": "Someone"}]})
+        results = export_batch(
+            ["alice", "ghost", "../etc", "bob"], tmp_path, extractor, workers=2
+        )
+
+        assert [r.username for r in results] == ["alice", "ghost", "../etc", "bob"]
+        assert [r.ok for r in results] == [True, False, False, True]
+        assert results[1].error == "User or resource not found"
+        assert results[2].error == "Invalid username"
+        assert (tmp_path / "alice" / "profile.md").exists()
+        assert (tmp_path / "bob" / "profile.md").exists()
+        assert not (tmp_path / "ghost").exists()
+
+    def test_unexpected_errors_fail_only_that_user(self, tmp_path):
+        extractor = FailingForGhost({"profile": [{"name": "Someone"}]})
+        results = export_batch(["odd", "alice"], tmp_path, extractor, workers=1)
+
+        assert [r.ok for r in results] == [False, True]
+        assert results[0].error == "KeyError: 'login'"
+        assert (tmp_path / "alice" / "profile.md").exists()
@@ -0,0 +1,77 @@
+"""Tests for single-file bundle output."""
+
+import tarfile
+import zipfile
+
+import pytest
+
+from github2md.batch import ExportConfig, export_batch
+from github2md.bundle import Bundle, open_bundle
+
+from .conftest import FailingForGhost
+
+DATA = {"profile": [{"name": "Someone"}], "repos": [[{"name": "tool"}]]}
+
+
+def _export(tmp_path, kind):
+    with open_bundle(tmp_path / "out", kind) as bundle:
+        config = ExportConfig(bundle=bundle)
+        results = export_batch(
+            ["bob", "ghost", "alice"], tmp_path, FailingForGhost(DATA), 2, config
+        )
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[0].files[0].parts[0] == "bob"
+    return bundle.path
+
+
+def test_zip_bundle_holds_every_user(tmp_path):
+    path = _export(tmp_path, "zip")
+    assert path == tmp_path / "out.zip"
+    with zipfile.ZipFile(path) as archive:
+        names = archive.namelist()
+        assert "alice/profile.md" in names
+        assert "bob/repositories.md" in names
+        assert not any(name.startswith("ghost/") for name in names)
+        assert "Someone" in archive.read("alice/profile.md").decode()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.zip"]
+
+
+def test_tar_bundle_holds_every_user(tmp_path):
+    with tarfile.open(_export(tmp_path, "tar.gz")) as archive:
+        profile = archive.extractfile("bob/profile.md")
+        assert profile is not None
+        assert b"Someone" in profile.read()
+
+
+def test_markdown_bundle_has_sorted_contents(tmp_path):
+    text = _export(tmp_path, "md").read_text(encoding="utf-8")
+    assert text.startswith("# Contents\n\n- [alice/contributions.md]")
+    assert "- [bob/profile.md](#bob-profile-md)" in text
+    assert '<a id="bob-profile-md"></a>' in text
+    assert text.index('id="alice-profile-md"') < text.index('id="bob-profile-md"')
+
+
+def test_failed_block_keeps_previous_bundle(tmp_path):
+    with open_bundle(tmp_path / "out", "md") as bundle:
+        bundle.add("a.md", "old\n")
+    with pytest.raises(RuntimeError), open_bundle(tmp_path / "out", "md") as bundle:
+        bundle.add("a.md", "new\n")
+        raise RuntimeError("boom")
+    assert "old" in (tmp_path / "out.md").read_text(encoding="utf-8")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.md"]
+
+
+def test_writer_rejects_traversal(tmp_path):
+    with open_bundle(tmp_path / "out", "zip") as bundle:
+        with pytest.raises(ValueError):
+            bundle.writer("alice/").write("../bob/profile.md", "x")
+
+
+def test_bundle_without_format_cannot_be_created(tmp_path):
+    class Incomplete(Bundle):
+        def _open(self, tmp):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete(tmp_path / "out.zip")  # type: ignore[abstract]
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,61 @@
+"""Tests for the response cache."""
+
+from github2md.cache import CachingTransport, ResponseCache
+from github2md.transport import ApiResponse
+
+from .conftest import FakeClock, FakeTransport
+
+
+class TestCachingTransport:
+    def test_fresh_entries_skip_the_network(self, tmp_path):
+        inner = FakeTransport(ApiResponse(200, {"etag": '"v1"'}, b'{"a": 1}'))
+        transport = CachingTransport(inner, ResponseCache(tmp_path, ttl=60))
+
+        first = transport.request("GET", "/users/u")
+        second = transport.request("GET", "/users/u")
+
+        assert first.json() == second.json() == {"a": 1}
+        assert len(inner.requests) == 1
+        assert (transport.stats.hits, transport.stats.misses) == (1, 1)
+
+    def test_stale_entries_revalidate_with_etag(self, tmp_path):
+        clock = FakeClock()
+        cache = ResponseCache(tmp_path, ttl=60, clock=clock)
+        inner = FakeTransport(
+            ApiResponse(200, {"etag": '"v1"', "x-other": "1"}, b"[1]"),
+            ApiResponse(304, {"etag": '"v1"'}),
+        )
+        transport = CachingTransport(inner, cache)
+        transport.request("GET", "/users/u/repos")
+        clock.now += 120
+
+        response = transport.request("GET", "/users/u/repos")
+
+        assert response.status == 200
+        assert response.json() == [1]
+        assert inner.requests[1][2]["If-None-Match"] == '"v1"'
+        assert cache.stats.revalidated == 1
+        entry = cache.get("GET /users/u/repos")
+        assert entry is not None
+        assert entry.headers == {"etag": '"v1"'}
+
+    def test_graphql_requests_are_not_cached(self, tmp_path):
+        inner = FakeTransport(ApiResponse(200), ApiResponse(200))
+        transport = CachingTransport(inner, ResponseCache(tmp_path))
+        transport.request("POST", "graphql", body={"query": "{}"})
+        transport.request("POST", "graphql", body={"query": "{}"})
+        assert len(inner.requests) == 2
+
+
+class TestResponseCache:
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=400)
+        cache.put("a", {}, b"x" * 100)
+        cache.put("b", {}, b"x" * 100)
+        cache.get("a")
+        cache.put("c", {}, b"x" * 100)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats.evictions == 1
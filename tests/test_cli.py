@@ -1,8 +1,16 @@
 """Tests for CLI module."""
 
+import argparse
+from datetime import date, timedelta
 from unittest.mock import MagicMock, patch
 
-from github2md.cli import get_authenticated_user
+import pytest
+
+from github2md.bundle import BUNDLE_TYPES
+from github2md.cli import _iso_date, get_authenticated_user
+from github2md.constants import BACKENDS, BUNDLE_FORMATS, SORT_KEYS, TRANSPORT_NAMES
+from github2md.converter import EXTRACTOR_BACKENDS, TRANSPORTS
+from github2md.ranking import RANKING_KEYS
 
 
 class TestGetAuthenticatedUser:
@@ -19,3 +27,18 @@ class TestGetAuthenticatedUser:
             mock_run.side_effect = CalledProcessError(1, "gh")
             result = get_authenticated_user()
             assert result is None
+
+
+def test_cli_choices_match_factories():
+    # The CLI takes its choices from constants to keep its imports lazy.
+    assert set(BACKENDS) == set(EXTRACTOR_BACKENDS)
+    assert set(TRANSPORT_NAMES) == set(TRANSPORTS)
+    assert set(SORT_KEYS) == set(RANKING_KEYS)
+    assert set(BUNDLE_FORMATS) == set(BUNDLE_TYPES)
+
+
+def test_since_rejects_future_dates():
+    assert _iso_date("2020-02-29") == date(2020, 2, 29)
+    tomorrow = date.today() + timedelta(days=1)
+    with pytest.raises(argparse.ArgumentTypeError, match="future"):
+        _iso_date(tomorrow.isoformat())
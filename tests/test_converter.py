@@ -0,0 +1,97 @@
+"""Tests for the conversion pipeline."""
+
+import threading
+from graphlib import CycleError
+
+import pytest
+
+from github2md.converter import GitHubToMarkdownConverter
+from github2md.extractor import DictExtractor
+from github2md.formatters.base import BaseFormatter
+from github2md.parsers.base import BaseParser
+from github2md.registry import DefaultFormatterRegistry, DefaultParserRegistry
+from github2md.writer import InMemoryWriter
+
+
+class KeyParser(BaseParser):
+    def __init__(self, key, depends_on=(), parse=None):
+        self.section_key = key
+        self.depends_on = depends_on
+        self._parse = parse or (lambda raw: raw.get(key))
+
+    def parse(self, raw_data):
+        return self._parse(raw_data)
+
+
+class KeyFormatter(BaseFormatter):
+    def __init__(self, key, depends_on=()):
+        self.section_key = key
+        self.output_filename = f"{key}.md"
+        self.depends_on = depends_on
+
+    def format(self, data):
+        return f"{self.section_key}: {data}\n"
+
+
+def _convert(parsers, formatters, data, **kwargs):
+    parser_registry = DefaultParserRegistry()
+    formatter_registry = DefaultFormatterRegistry()
+    for parser in parsers:
+        parser_registry.register(parser)
+    for formatter in formatters:
+        formatter_registry.register(formatter)
+    writer = InMemoryWriter()
+    converter = GitHubToMarkdownConverter(
+        DictExtractor(data),
+        writer,
+        parser_registry=parser_registry,
+        formatter_registry=formatter_registry,
+        **kwargs,
+    )
+    return converter.convert("octocat"), writer.files
+
+
+class TestSectionGraph:
+    def test_dependent_parser_receives_parsed_dependencies(self):
+        def summarize(raw):
+            parsed = raw["parsed"]
+            return f"{parsed['profile']} has {parsed['repos']} repos"
+
+        parsers = [
+            KeyParser("summary", ("profile", "repos"), summarize),
+            KeyParser("profile"),
+            KeyParser("repos"),
+        ]
+        formatters = [KeyFormatter(k) for k in ("summary", "profile", "repos")]
+        files, written = _convert(parsers, formatters, {"profile": "Octo", "repos": 3})
+
+        assert [f.name for f in files] == ["summary.md", "profile.md", "repos.md"]
+        assert written["summary.md"] == "summary: Octo has 3 repos\n"
+
+    def test_independent_sections_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_other(raw):
+            barrier.wait()
+            return "done"
+
+        parsers = [KeyParser(k, parse=wait_for_other) for k in ("a", "b")]
+        formatters = [KeyFormatter("a"), KeyFormatter("b")]
+        files, _ = _convert(parsers, formatters, {}, max_workers=2)
+        assert [f.name for f in files] == ["a.md", "b.md"]
+
+    def test_failures_warn_and_continue(self, capsys):
+        def fail(raw):
+            raise RuntimeError("boom")
+
+        parsers = [KeyParser("bad", parse=fail), KeyParser("good")]
+        formatters = [KeyFormatter("bad"), KeyFormatter("good", depends_on=("bad",))]
+        files, _ = _convert(parsers, formatters, {"good": 1})
+
+        assert [f.name for f in files] == ["good.md"]
+        assert "Warning: Parser 'bad' failed: boom" in capsys.readouterr().err
+
+    def test_rejects_circular_dependencies(self):
+        parsers = [KeyParser("a", ("b",)), KeyParser("b", ("a",))]
+        with pytest.raises(CycleError):
+            _convert(parsers, [], {})
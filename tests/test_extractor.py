@@ -0,0 +1,219 @@
+"""Tests for extractors."""
+
+import json
+import threading
+from collections import Counter
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from github2md.cache import ResponseCache
+from github2md.extractor import GitHubExtractor
+from github2md.graphql import GitHubGraphQLExtractor
+from github2md.parsers.repos import ReposParser
+from github2md.transport import ApiResponse
+
+
+class TestGitHubExtractor:
+    def test_extract_fetches_sections_concurrently(self, monkeypatch):
+        extractor = GitHubExtractor()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(value):
+            def _fetch(username):
+                barrier.wait()
+                return value
+
+            return _fetch
+
+        monkeypatch.setattr(extractor, "_get_profile", fetch({"login": "u"}))
+        monkeypatch.setattr(extractor, "_get_repos", fetch([]))
+        monkeypatch.setattr(extractor, "_get_contributions", fetch({}))
+        monkeypatch.setattr(extractor, "_get_authored", lambda u, key: {})
+
+        data = extractor.extract("u")
+        assert data == {
+            "username": "u",
+            "profile": [{"login": "u"}],
+            "repos": [],
+            "contributions": {},
+            "pull_requests": {},
+            "issues": {},
+        }
+
+    def test_extract_raises_section_error_after_all_settle(self, monkeypatch):
+        extractor = GitHubExtractor(max_workers=1)
+        fetched = []
+
+        def fail(username):
+            raise RuntimeError("User or resource not found")
+
+        monkeypatch.setattr(extractor, "_get_profile", fail)
+        monkeypatch.setattr(extractor, "_get_repos", lambda u: fetched.append(u))
+        monkeypatch.setattr(extractor, "_get_contributions", lambda u: {})
+        monkeypatch.setattr(extractor, "_get_authored", lambda u, key: {})
+
+        with pytest.raises(RuntimeError, match="not found"):
+            extractor.extract("u")
+        assert fetched == ["u"]
+
+    def test_rejects_empty_pool(self):
+        with pytest.raises(ValueError):
+            GitHubExtractor(max_workers=0)
+
+    def test_get_repos_follows_link_headers(self):
+        extractor = GitHubExtractor()
+        next_url = "https://api.github.com/user/1/repos?per_page=100&page=2"
+        responses = [
+            b"HTTP/2.0 200 OK\r\n"
+            + f'Link: <{next_url}>; rel="next"\r\n\r\n'.encode()
+            + b'[{"name": "a"}, {"name": "b"}]',
+            b'HTTP/2.0 200 OK\r\n\r\n[{"name": "c"}]',
+        ]
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [MagicMock(stdout=r) for r in responses]
+            pages = extractor._get_repos("u")
+            assert mock_run.call_count == 1
+            assert [[r["name"] for r in page] for page in pages] == [
+                ["a", "b"],
+                ["c"],
+            ]
+        assert mock_run.call_args.args[0][-1] == next_url
+
+    def test_languages_are_fetched_once_per_push(self, tmp_path, monkeypatch):
+        repos = [
+            {"full_name": "u/a", "pushed_at": "2025-01-01T00:00:00Z"},
+            {"full_name": "u/b", "pushed_at": "2025-02-01T00:00:00Z"},
+            {"full_name": "u/fork", "fork": True},
+        ]
+        routes = {
+            "/users/u": {"login": "u"},
+            "/users/u/repos": repos,
+            "/repos/u/a/languages": {"Python": 300, "C": 100},
+            "/repos/u/b/languages": {"Python": 50},
+        }
+        requests = Counter()
+
+        class Transport:
+            def request(self, method, path, *, body=None, headers=None):
+                route = path.split("?")[0]
+                requests[route] += 1
+                status, payload = (200, routes[route]) if route in routes else (404, {})
+                return ApiResponse(status, {}, json.dumps(payload).encode())
+
+        cache = ResponseCache(tmp_path, ttl=0)
+        extractor = GitHubExtractor(
+            transport=Transport(), data_cache=cache, languages=True
+        )
+        monkeypatch.setattr(extractor, "_get_contributions", lambda u: {})
+        monkeypatch.setattr(extractor, "_get_authored", lambda u, key: {})
+
+        data = extractor.extract("u")
+        assert data["languages"] == {
+            "u/a": {"Python": 300, "C": 100},
+            "u/b": {"Python": 50},
+        }
+        assert [r["full_name"] for r in ReposParser()._iter_repos(data["repos"])] == [
+            "u/a",
+            "u/b",
+            "u/fork",
+        ]
+        assert requests["/users/u/repos"] == 1
+        assert "/repos/u/fork/languages" not in requests
+
+        repos[1]["pushed_at"] = "2025-03-01T00:00:00Z"
+        requests.clear()
+        extractor.extract("u")
+        assert "/repos/u/a/languages" not in requests
+        assert requests["/repos/u/b/languages"] == 1
+
+    def test_search_stops_paginating_at_limit(self, monkeypatch):
+        extractor = GitHubExtractor()
+        calls = []
+
+        def graphql(query, **variables):
+            calls.append(variables)
+            nodes = [
+                {"number": len(calls) * 1000 + i} for i in range(variables["first"])
+            ]
+            info = {"hasNextPage": True, "endCursor": f"c{len(calls)}"}
+            return {
+                "data": {
+                    "search": {"issueCount": 900, "nodes": nodes, "pageInfo": info}
+                }
+            }
+
+        monkeypatch.setattr(extractor, "_graphql", graphql)
+        result = extractor._search("author:u is:pr", 150)
+        assert [(c["first"], c.get("after")) for c in calls] == [
+            (100, None),
+            (50, "c1"),
+        ]
+        assert len(result["nodes"]) == 150
+        assert result["total"] == 900
+
+    def test_authored_splits_own_and_external_repos(self, monkeypatch):
+        extractor = GitHubExtractor()
+        searches = []
+
+        def search(query, limit):
+            searches.append((query, limit))
+            return {"total": 0, "nodes": []}
+
+        monkeypatch.setattr(extractor, "_search", search)
+        result = extractor._get_authored("u", "pull_requests")
+        assert set(result) == {"own", "external"}
+        assert [query.split()[-2] for query, _ in searches] == ["user:u", "-user:u"]
+        assert all("is:pr" in query for query, _ in searches)
+
+
+class TestGitHubGraphQLExtractor:
+    def _user(self, nodes, has_next=False, cursor=None):
+        return {
+            "data": {
+                "user": {
+                    "login": "u",
+                    "name": "User",
+                    "websiteUrl": "https://example.com",
+                    "followers": {"totalCount": 3},
+                    "repositories": {
+                        "totalCount": 2,
+                        "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+                        "nodes": nodes,
+                    },
+                    "contributionsCollection": {"totalCommitContributions": 7},
+                }
+            }
+        }
+
+    def test_extract_returns_rest_shape_in_one_query(self, monkeypatch):
+        extractor = GitHubGraphQLExtractor()
+        calls = []
+
+        def graphql(query, **variables):
+            calls.append(variables)
+            if len(calls) == 1:
+                node = {"name": "a", "stargazerCount": 5, "isFork": False}
+                return self._user([node], has_next=True, cursor="c1")
+            return self._user([{"name": "b", "primaryLanguage": {"name": "Go"}}])
+
+        monkeypatch.setattr(extractor, "_graphql", graphql)
+        data = extractor.extract("u")
+        assert len(calls) == 1
+        assert "-user:u" in calls[0]["external_issues"]
+        assert data["pull_requests"]["own"] == {"total": 0, "nodes": []}
+        assert data["profile"][0]["blog"] == "https://example.com"
+        assert data["profile"][0]["followers"] == 3
+        assert data["contributions"] == {"totalCommitContributions": 7}
+
+        result = ReposParser().parse(data)
+        assert len(calls) == 2
+        assert calls[1]["after"] == "c1"
+        assert result["total"] == 2
+        assert result["languages"] == {"Go": 1}
+
+    def test_extract_raises_for_missing_user(self, monkeypatch):
+        extractor = GitHubGraphQLExtractor()
+        monkeypatch.setattr(extractor, "_graphql", lambda q, **v: {"data": None})
+        with pytest.raises(RuntimeError, match="not found"):
+            extractor.extract("ghost")
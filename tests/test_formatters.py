@@ -1,8 +1,13 @@
 """Tests for formatters."""
 
+from github2md.formatters.base import BaseFormatter
 from github2md.formatters.contributions import ContributionsFormatter
+from github2md.formatters.issues import IssuesFormatter
+from github2md.formatters.languages import LanguagesFormatter
 from github2md.formatters.profile import ProfileFormatter
+from github2md.formatters.pull_requests import PullRequestsFormatter
 from github2md.formatters.repos import ReposFormatter
+from github2md.records import RepoRecord
 
 
 class TestProfileFormatter:
@@ -44,6 +49,32 @@ class TestReposFormatter:
         assert "# Repositories" in result
         assert "repo1" in result
 
+    def test_format_chunks_matches_format(self):
+        formatter = ReposFormatter()
+        data = {
+            "total": 2,
+            "languages": {"Python": 2},
+            "repos": [{"name": "a", "stars": 3}, {"name": "b", "language": "Go"}],
+        }
+        chunks = list(formatter.format_chunks(data))
+        assert len(chunks) > 3
+        assert "".join(chunks) == formatter.format(data)
+
+    def test_format_repo_records(self):
+        formatter = ReposFormatter()
+        records = [
+            RepoRecord("a", url="https://github.com/user/a", stars=3),
+            RepoRecord("b", description="B | b", language="Go"),
+        ]
+        dicts = [
+            {"name": "a", "url": "https://github.com/user/a", "stars": 3},
+            {"name": "b", "description": "B | b", "language": "Go"},
+        ]
+        result = formatter.format({"total": 2, "repos": records})
+        assert "### [a](https://github.com/user/a)" in result
+        assert "- **Language:** Go | **Stars:** 0" in result
+        assert result == formatter.format({"total": 2, "repos": dicts})
+
 
 class TestContributionsFormatter:
     def test_section_key(self):
@@ -60,3 +91,107 @@ class TestContributionsFormatter:
         result = formatter.format(data)
         assert "# Contributions" in result
         assert "500" in result
+        assert "## Calendar" not in result
+
+    def test_format_calendar(self):
+        data = {
+            "calendar_start": "2025-01-01",
+            "calendar_end": "2025-01-11",
+            "calendar_days": 11,
+            "active_days": 6,
+            "current_streak": 1,
+            "longest_streak": 3,
+            "longest_streak_start": "2025-01-05",
+            "longest_streak_end": "2025-01-07",
+            "weekly": [3, 12, 0],
+            "monthly": {"2025-01": 15},
+            "weekdays": {"Monday": 4},
+        }
+        result = ContributionsFormatter().format(data)
+        assert "- **Current streak:** 1 day\n" in result
+        assert "3 days (2025-01-05 to 2025-01-07)" in result
+        assert "`▃█▁`" in result
+        assert "| 2025-01 | 15 |" in result
+
+
+class TestLanguagesFormatter:
+    def test_format_breakdown(self):
+        data = {
+            "languages": [
+                {"name": "Python", "bytes": 3 * 1024 * 1024, "share": 75.0, "repos": 4},
+                {"name": "C", "bytes": 700, "share": 25.0, "repos": 1},
+            ],
+            "total_bytes": 4 * 1024 * 1024,
+            "other_bytes": 0,
+            "other_share": 0.0,
+            "repos_counted": 5,
+        }
+        result = LanguagesFormatter().format(data)
+        assert result.startswith("# Languages\n")
+        assert "4.0 MB of code across 5 repositories" in result
+        assert "| Python | 3.0 MB | 75.0% | 4 |" in result
+        assert "| C | 700 B | 25.0% | 1 |" in result
+        assert "Other" not in result
+
+    def test_empty_breakdown_renders_nothing(self):
+        assert not LanguagesFormatter().format({"languages": []}).strip()
+
+
+class TestPullRequestsFormatter:
+    DATA = {
+        "external": [
+            {
+                "title": "Fix it",
+                "url": "https://github.com/o/r/pull/7",
+                "state": "MERGED",
+                "repo": "o/r",
+                "repo_url": "https://github.com/o/r",
+                "created_at": "2025-01-02",
+            }
+        ],
+        "total_external": 3,
+        "own": [],
+        "total_own": 0,
+        "total": 3,
+    }
+
+    def test_format_external_with_more(self):
+        result = PullRequestsFormatter().format(self.DATA)
+        assert result.startswith("# Pull Requests (3 total)\n")
+        assert (
+            "- \u2705 [Fix it](https://github.com/o/r/pull/7) "
+            "([o/r](https://github.com/o/r), 2025-01-02)\n"
+        ) in result
+        assert "*...and 2 more pull requests*" in result
+        assert "Own Repositories" not in result
+
+    def test_issues_use_issue_icons(self):
+        data = {
+            **self.DATA,
+            "external": [{**self.DATA["external"][0], "state": "OPEN"}],
+        }
+        result = IssuesFormatter().format(data)
+        assert result.startswith("# Issues (3 total)\n")
+        assert "- \U0001f7e2 [Fix it]" in result
+        assert "*...and 2 more issues*" in result
+
+    def test_nothing_to_show_renders_nothing(self):
+        assert not PullRequestsFormatter().format({"total": 0}).strip()
+
+
+class TestBaseFormatterHelpers:
+    def test_escape_md(self):
+        formatter = BaseFormatter()
+        assert formatter._escape_md(None) == ""
+        assert formatter._escape_md("plain") == "plain"
+        assert formatter._escape_md("a | b\r\nc") == "a \\| b c"
+
+    def test_sanitize_url(self):
+        formatter = BaseFormatter()
+        assert formatter._sanitize_url(" https://x.y/a(b)[c] ") == (
+            "https://x.y/a(b%29%5Bc%5D"
+        )
+        assert formatter._sanitize_url("MAILTO:me@x.y") == "MAILTO:me@x.y"
+        assert formatter._sanitize_url("javascript:alert(1)") == ""
+        assert formatter._sanitize_url("//x.y/a") == ""
+        assert formatter._make_link("t", "javascript:x") == "t"
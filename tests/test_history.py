@@ -0,0 +1,110 @@
+"""Tests for multi-year contribution history."""
+
+import json
+from array import array
+from datetime import UTC, date, datetime
+
+import pytest
+
+from github2md.cache import ResponseCache
+from github2md.extractor import GitHubExtractor
+from github2md.history import contribution_windows, merge_contributions, since_years
+from github2md.parsers.contributions import ContributionsParser
+from github2md.transport import ApiResponse
+
+NOW = datetime(2025, 3, 1, 12, 0, tzinfo=UTC)
+
+
+def test_windows_are_calendar_years_and_past_ones_closed():
+    windows = contribution_windows(date(2023, 6, 1), NOW)
+    assert [(w.start.date(), w.end.date(), w.closed) for w in windows] == [
+        (date(2023, 6, 1), date(2023, 12, 31), True),
+        (date(2024, 1, 1), date(2024, 12, 31), True),
+        (date(2025, 1, 1), date(2025, 3, 1), False),
+    ]
+    assert since_years(3, NOW.date()) == date(2023, 1, 1)
+    with pytest.raises(ValueError):
+        since_years(0, NOW.date())
+
+
+def test_merge_lays_days_out_on_one_timeline():
+    parts = [
+        {
+            "totalCommitContributions": 2,
+            "contributionCalendar": {
+                "totalContributions": 3,
+                "startDate": "2024-12-30",
+                "counts": array("I", [1, 2]),
+            },
+        },
+        {
+            "totalCommitContributions": 5,
+            "contributionCalendar": {
+                "totalContributions": 5,
+                "startDate": "2025-01-01",
+                "counts": [5],
+            },
+        },
+    ]
+    merged = merge_contributions(date(2024, 12, 29), parts)
+    assert merged["totalCommitContributions"] == 7
+    calendar = merged["contributionCalendar"]
+    assert calendar["totalContributions"] == 8
+    assert calendar["counts"] == array("I", [0, 1, 2, 5])
+
+    parsed = ContributionsParser().parse({"contributions": merged})
+    assert parsed["period"] == "since 2024-12-29"
+    assert parsed["calendar_end"] == "2025-01-01"
+
+
+class GraphQLTransport:
+    def __init__(self):
+        self.windows = []
+
+    def request(self, method, path, *, body=None, headers=None):
+        assert body is not None
+        variables = body["variables"]
+        self.windows.append(variables["from"][:10])
+        collection = {
+            "totalCommitContributions": 1,
+            "contributionCalendar": {
+                "totalContributions": 1,
+                "weeks": [
+                    {
+                        "contributionDays": [
+                            {"date": variables["from"][:10], "contributionCount": 1}
+                        ]
+                    }
+                ],
+            },
+        }
+        payload = {"data": {"user": {"contributionsCollection": collection}}}
+        return ApiResponse(200, {}, json.dumps(payload).encode())
+
+
+def test_closed_years_are_fetched_once(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path, ttl=0)
+    since = date(datetime.now(UTC).year - 2, 1, 1)
+
+    def run():
+        transport = GraphQLTransport()
+        extractor = GitHubExtractor(transport=transport, since=since, data_cache=cache)
+        return extractor._get_contributions("octocat"), transport.windows
+
+    first, fetched = run()
+    assert sorted(fetched) == [f"{since.year + i}-01-01" for i in range(3)]
+    assert first["totalCommitContributions"] == 3
+
+    second, fetched = run()
+    assert len(fetched) == 1  # only the current year
+    assert second["contributionCalendar"] == first["contributionCalendar"]
+
+
+def test_future_since_fetches_nothing():
+    transport = GraphQLTransport()
+    since = date(datetime.now(UTC).year + 1, 1, 1)
+    extractor = GitHubExtractor(transport=transport, since=since)
+    result = extractor._get_contributions("octocat")
+    assert transport.windows == []
+    assert result["totalCommitContributions"] == 0
+    assert "counts" not in result["contributionCalendar"]
@@ -0,0 +1,53 @@
+"""Tests for incremental JSON decoding."""
+
+import json
+
+import pytest
+
+from github2md.jsonstream import iter_json_array
+from github2md.transport import ApiResponse
+
+
+def _chunks(raw, size):
+    return [raw[i : i + size] for i in range(0, len(raw), size)]
+
+
+class TestIterJsonArray:
+    @pytest.mark.parametrize("size", [1, 3, 64, 10_000])
+    def test_decodes_across_chunk_boundaries(self, size):
+        items = [{"name": f"r{i}", "desc": "é" * i, "n": i * 1.5} for i in range(40)]
+        items += [12345, "text", None, [1, [2]]]
+        raw = json.dumps(items).encode()
+        assert list(iter_json_array(_chunks(raw, size))) == items
+
+    @pytest.mark.parametrize(
+        ("chunks", "expected"),
+        [
+            ([b"[1.", b"5]"], [1.5]),
+            ([b"[1.5e", b"3]"], [1500.0]),
+            ([b"[-", b"2, 1", b"0]"], [-2, 10]),
+        ],
+    )
+    def test_numbers_split_across_chunks(self, chunks, expected):
+        assert list(iter_json_array(chunks)) == expected
+
+    def test_concatenated_arrays_form_one_sequence(self):
+        assert list(iter_json_array([b"[1, 2]\n[]", b"[3]"])) == [1, 2, 3]
+
+    def test_yields_before_input_ends(self):
+        def chunks():
+            yield b'[{"a": 1}, '
+            raise AssertionError("read past the first element")
+
+        assert next(iter_json_array(chunks())) == {"a": 1}
+
+    @pytest.mark.parametrize("raw", [b"{}", b"[1,", b"[1 2]", b"[1,]"])
+    def test_rejects_malformed_input(self, raw):
+        with pytest.raises(ValueError):
+            list(iter_json_array([raw]))
+
+
+def test_api_response_iter_json():
+    assert list(ApiResponse(200, {}, b' [{"a": 1}]').iter_json()) == [{"a": 1}]
+    assert list(ApiResponse(404, {}, b'{"message": "x"}').iter_json()) == []
+    assert list(ApiResponse(200, {}, b"").iter_json()) == []
@@ -0,0 +1,67 @@
+"""Tests for incremental export."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from github2md.converter import GitHubToMarkdownConverter
+from github2md.extractor import DictExtractor
+from github2md.manifest import MANIFEST_FILENAME, Manifest, hash_data
+from github2md.writer import MarkdownFileWriter
+
+
+def _convert(tmp_path, data):
+    converter = GitHubToMarkdownConverter(
+        DictExtractor(data), MarkdownFileWriter(tmp_path), Manifest(tmp_path)
+    )
+    return converter, converter.convert("octocat")
+
+
+class TestIncrementalExport:
+    def test_skips_unchanged_sections(self, tmp_path):
+        data = {
+            "profile": [{"name": "Octo"}],
+            "contributions": {"totalCommitContributions": 1},
+        }
+        _, first = _convert(tmp_path, data)
+        assert {"profile.md", "contributions.md"} <= {p.name for p in first}
+        assert (tmp_path / MANIFEST_FILENAME).exists()
+
+        data["contributions"] = {"totalCommitContributions": 2}
+        converter, second = _convert(tmp_path, data)
+        assert [p.name for p in second] == ["contributions.md"]
+        assert "profile.md" in converter.unchanged
+
+    def test_relative_output_dir(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        data = {"profile": [{"name": "Octo"}]}
+        _convert(Path("out"), data)
+        converter, files = _convert(Path("out"), data)
+        assert files == []
+        assert "profile.md" in converter.unchanged
+
+    def test_rewrites_modified_or_deleted_output(self, tmp_path):
+        data = {"profile": [{"name": "Octo"}]}
+        _convert(tmp_path, data)
+        (tmp_path / "profile.md").write_text("edited", encoding="utf-8")
+        _, files = _convert(tmp_path, data)
+        assert [p.name for p in files] == ["profile.md"]
+
+        (tmp_path / "profile.md").unlink()
+        _, files = _convert(tmp_path, data)
+        assert [p.name for p in files] == ["profile.md"]
+
+    def test_corrupt_manifest_is_ignored(self, tmp_path):
+        (tmp_path / MANIFEST_FILENAME).write_text("{not json", encoding="utf-8")
+        _, files = _convert(tmp_path, {"profile": [{"name": "Octo"}]})
+        assert "profile.md" in {p.name for p in files}
+
+
+def test_hash_data_is_order_independent_and_handles_dataclasses():
+    @dataclass
+    class Point:
+        x: int
+        y: int
+
+    assert hash_data({"a": 1, "b": 2}) == hash_data({"b": 2, "a": 1})
+    assert hash_data([Point(1, 2)]) == hash_data([{"x": 1, "y": 2}])
+    assert hash_data([Point(1, 2)]) != hash_data([Point(2, 1)])
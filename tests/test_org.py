@@ -0,0 +1,129 @@
+"""Tests for organization exports and the shared fetch store."""
+
+import json
+import threading
+from collections import Counter
+
+import pytest
+
+from github2md.extractor import DictExtractor
+from github2md.org import OrgExtractor, export_org, print_org_summary
+from github2md.shared import SharedStore
+from github2md.transport import ApiResponse
+
+ORG_REPOS = [
+    {"name": "core", "full_name": "acme/core", "stargazers_count": 50},
+    {"name": "docs", "full_name": "acme/docs", "stargazers_count": 5},
+    {"name": "fork", "full_name": "acme/fork", "fork": True},
+]
+ROUTES = {
+    "/orgs/acme/members": [{"login": "alice"}, {"login": "bob"}],
+    "/orgs/acme/repos": ORG_REPOS,
+    "/repos/acme/core/contributors": [
+        {"login": "alice", "contributions": 40},
+        {"login": "carol", "contributions": 30},
+        {"login": "ci", "contributions": 99, "type": "Bot"},
+    ],
+    "/repos/acme/docs/contributors": [{"login": "alice", "contributions": 5}],
+}
+
+
+class RoutingTransport:
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = Counter()
+        self._lock = threading.Lock()
+
+    def request(self, method, path, *, body=None, headers=None):
+        route = path.split("?")[0]
+        with self._lock:
+            self.requests[route] += 1
+        if route not in self.routes:
+            return ApiResponse(404, {}, b'{"message": "Not Found"}')
+        return ApiResponse(200, {}, json.dumps(self.routes[route]).encode())
+
+
+def test_export_org_writes_summary_and_members(tmp_path):
+    transport = RoutingTransport(ROUTES)
+    members = DictExtractor({"profile": [{"name": "Member"}]})
+    summary, results = export_org(
+        "acme", tmp_path, OrgExtractor(transport=transport), members
+    )
+
+    assert (summary.username, summary.ok) == ("acme", True)
+    assert [(r.username, r.ok) for r in results] == [("alice", True), ("bob", True)]
+    assert (tmp_path / "alice" / "profile.md").exists()
+    repos = (tmp_path / "repositories.md").read_text(encoding="utf-8")
+    assert "# Repositories (2 total)" in repos
+    contributors = (tmp_path / "contributors.md").read_text(encoding="utf-8")
+    assert "| alice | 45 | 2 | ✓ |" in contributors
+    assert "| carol | 30 | 1 |  |" in contributors
+    assert "ci" not in contributors
+    assert "- [bob](bob/profile.md)" in contributors
+
+    # Shared data is fetched once although several sections use it.
+    assert set(transport.requests.values()) == {1}
+    assert "/repos/acme/fork/contributors" not in transport.requests
+
+
+def test_unknown_org_raises(tmp_path):
+    extractor = OrgExtractor(transport=RoutingTransport({}))
+    with pytest.raises(RuntimeError):
+        export_org("ghost", tmp_path, extractor, DictExtractor({}))
+
+
+def test_summary_failure_is_reported_apart_from_members(tmp_path, capsys):
+    class BrokenOrgExtractor(OrgExtractor):
+        def _get_contributors(self, org):
+            raise KeyError("full_name")
+
+    transport = RoutingTransport(ROUTES)
+    summary, results = export_org(
+        "acme", tmp_path, BrokenOrgExtractor(transport=transport), DictExtractor({})
+    )
+    assert summary.error == "KeyError: 'full_name'"
+    assert [r.ok for r in results] == [True, True]
+
+    print_org_summary(summary, results, tmp_path)
+    out = capsys.readouterr().out
+    assert "Org summary for acme FAILED: KeyError: 'full_name'" in out
+    assert "Exported 2/2 users" in out
+
+
+class TestSharedStore:
+    def test_concurrent_callers_share_one_load(self):
+        store = SharedStore()
+        started = threading.Event()
+        release = threading.Event()
+        loads = []
+
+        def load():
+            loads.append(1)
+            started.set()
+            release.wait()
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(store.get("k", load)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        started.wait()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["value"] * 4
+        assert len(loads) == 1
+
+    def test_failures_are_not_remembered(self):
+        store = SharedStore()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            store.get("k", fail)
+        assert store.get("k", lambda: 1) == 1
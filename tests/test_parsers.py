@@ -1,8 +1,13 @@
 """Tests for parsers."""
 
+from array import array
+
 from github2md.parsers.contributions import ContributionsParser
+from github2md.parsers.languages import LanguagesParser
 from github2md.parsers.profile import ProfileParser
+from github2md.parsers.pull_requests import PullRequestsParser
 from github2md.parsers.repos import ReposParser
+from github2md.records import RepoRecord, compact_calendar
 
 
 class TestProfileParser:
@@ -44,6 +49,35 @@ class TestReposParser:
         assert result["total"] == 2
         assert result["total_stars"] == 15
 
+    def test_parse_repo_pages(self):
+        parser = ReposParser()
+        pages = iter(
+            [
+                [{"name": "repo1", "stargazers_count": 1}],
+                [{"name": "repo2", "stargazers_count": 2, "fork": True}],
+                [{"name": "repo3", "stargazers_count": 3}],
+            ]
+        )
+        result = parser.parse({"repos": pages})
+        assert result["total"] == 2
+        assert [r["name"] for r in result["repos"]] == ["repo3", "repo1"]
+
+    def test_parse_returns_compact_records(self):
+        parser = ReposParser()
+        language = "".join(["Pyt", "hon"])
+        raw_data = {
+            "repos": [
+                {"name": "a", "language": language, "topics": ["cli", "md"]},
+                {"name": "b", "language": "Python", "html_url": "https://x/b"},
+            ]
+        }
+        a, b = parser.parse(raw_data)["repos"]
+        assert isinstance(a, RepoRecord)
+        assert a.topics == ("cli", "md")
+        assert a.language is b.language
+        assert b.get("url") == "https://x/b"
+        assert not hasattr(a, "__dict__")
+
 
 class TestContributionsParser:
     def test_section_key(self):
@@ -61,3 +95,95 @@ class TestContributionsParser:
         result = parser.parse(raw_data)
         assert result["total_commits"] == 100
         assert result["total_prs"] == 20
+        assert "calendar_days" not in result
+
+    def test_calendar_rollups_and_streaks(self):
+        # 2025-01-01 is a Wednesday; weeks start on Sunday 2025-01-05.
+        counts = [1, 0, 2, 0, 4, 4, 1, 0, 0, 3, 0]
+        days = [
+            {"date": f"2025-01-{i + 1:02d}", "contributionCount": count}
+            for i, count in enumerate(counts)
+        ]
+        weeks = [{"contributionDays": days[:4]}, {"contributionDays": days[4:]}]
+        raw_data = {"contributions": {"contributionCalendar": {"weeks": weeks}}}
+
+        result = ContributionsParser().parse(raw_data)
+        assert result["calendar_end"] == "2025-01-11"
+        assert result["active_days"] == 6
+        assert result["weekly"] == [3, 12]
+        assert result["best_week"] == "2025-01-05"
+        assert result["monthly"] == {"2025-01": 15}
+        assert result["busiest_weekday"] == "Friday"
+        assert result["busiest_weekday_total"] == 5
+        assert result["weekdays"]["Wednesday"] == 1
+        assert result["longest_streak"] == 3
+        assert result["longest_streak_start"] == "2025-01-05"
+        assert result["current_streak"] == 1  # the last day has none yet
+
+    def test_compact_calendar(self):
+        weeks = [{"contributionDays": [{"date": "2025-01-01", "contributionCount": 2}]}]
+        compact = compact_calendar({"totalContributions": 2, "weeks": weeks})
+        assert compact == {
+            "totalContributions": 2,
+            "startDate": "2025-01-01",
+            "counts": array("I", [2]),
+        }
+        assert compact_calendar(compact) == compact
+
+
+class TestLanguagesParser:
+    def test_aggregates_bytes_across_repos(self):
+        raw_data = {
+            "languages": {
+                "u/a": {"Python": 600, "C": 100},
+                "u/b": {"Python": 200, "Shell": 100, "Empty": 0},
+            }
+        }
+        result = LanguagesParser().parse(raw_data)
+        assert [(lang["name"], lang["bytes"]) for lang in result["languages"]] == [
+            ("Python", 800),
+            ("C", 100),
+            ("Shell", 100),
+        ]
+        assert result["languages"][0]["share"] == 80.0
+        assert result["languages"][0]["repos"] == 2
+        assert result["total_bytes"] == 1000
+        assert result["other_bytes"] == 0
+        assert result["repos_counted"] == 2
+
+    def test_without_languages(self):
+        result = LanguagesParser().parse({})
+        assert result["languages"] == []
+        assert result["total_bytes"] == 0
+
+
+class TestPullRequestsParser:
+    def test_parse_own_and_external(self):
+        node = {
+            "number": 7,
+            "title": "Fix it",
+            "url": "https://github.com/o/r/pull/7",
+            "state": "MERGED",
+            "createdAt": "2025-01-02T03:04:05Z",
+            "repository": {"nameWithOwner": "o/r", "url": "https://github.com/o/r"},
+        }
+        raw_data = {
+            "pull_requests": {
+                "own": {"total": 0, "nodes": []},
+                "external": {"total": 12, "nodes": [node]},
+            }
+        }
+        result = PullRequestsParser().parse(raw_data)
+        assert result["own"] == []
+        assert result["total"] == 12
+        assert result["external"] == [
+            {
+                "number": 7,
+                "title": "Fix it",
+                "url": "https://github.com/o/r/pull/7",
+                "state": "MERGED",
+                "repo": "o/r",
+                "repo_url": "https://github.com/o/r",
+                "created_at": "2025-01-02",
+            }
+        ]
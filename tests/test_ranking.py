@@ -0,0 +1,50 @@
+"""Tests for repository ranking."""
+
+import random
+
+import pytest
+
+from github2md.parsers.repos import ReposParser
+from github2md.ranking import TopK, ranking_key
+
+
+class TestTopK:
+    @pytest.mark.parametrize("k", [0, 1, 5, 200])
+    def test_matches_stable_sort(self, k):
+        rng = random.Random(k)
+        items = [(rng.randrange(10), i) for i in range(100)]
+        top = TopK(k)
+        for item in items:
+            top.add(item[0], item)
+        expected = sorted(items, key=lambda item: item[0], reverse=True)[:k]
+        assert top.result() == expected
+
+    def test_unknown_key(self):
+        with pytest.raises(ValueError, match="Unknown sort key"):
+            ranking_key("downloads")
+
+
+class TestReposRanking:
+    REPOS = [
+        {"name": "a", "stargazers_count": 5, "forks_count": 0, "language": "Go"},
+        {"name": "b", "stargazers_count": 1, "forks_count": 9, "language": "C"},
+        {"name": "c", "stargazers_count": 3, "forks_count": 2, "language": "Go"},
+        {"name": "d", "stargazers_count": 0, "updated_at": "2030-01-01T00:00:00Z"},
+    ]
+
+    @pytest.mark.parametrize(
+        ("sort", "expected"),
+        [
+            ("stars", ["a", "c"]),
+            ("forks", ["b", "c"]),
+            ("updated", ["d", "a"]),
+            ("score", ["b", "c"]),
+        ],
+    )
+    def test_keeps_top_k_by_sort_key(self, sort, expected):
+        options = {"sort": sort, "top": 2}
+        result = ReposParser().parse({"repos": self.REPOS, "options": options})
+        assert [r.name for r in result["repos"]] == expected
+        assert result["total"] == 4
+        assert result["total_stars"] == 9
+        assert result["languages"] == {"Go": 2, "C": 1}
@@ -0,0 +1,92 @@
+"""Tests for rate limit scheduling."""
+
+from github2md.ratelimit import (
+    RateLimitedTransport,
+    RateLimiter,
+    is_rate_limited,
+    resource_for,
+)
+from github2md.transport import ApiResponse
+
+from .conftest import FakeClock, FakeTransport
+
+
+def _limit_headers(remaining, reset, limit=5000):
+    return {
+        "x-ratelimit-limit": str(limit),
+        "x-ratelimit-remaining": str(remaining),
+        "x-ratelimit-reset": str(reset),
+    }
+
+
+class TestRateLimiter:
+    def test_unpaced_while_budget_is_plentiful(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock, clock.sleep)
+        limiter.update("core", _limit_headers(4000, clock.now + 3600))
+        for _ in range(10):
+            limiter.acquire("core")
+        assert clock.sleeps == []
+
+    def test_spreads_low_budget_until_reset(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock, clock.sleep)
+        limiter.update("core", _limit_headers(11, clock.now + 100, limit=1000))
+        for _ in range(3):
+            limiter.acquire("core")
+        assert clock.sleeps == [10.0, 10.0]
+
+    def test_waits_for_reset_when_exhausted(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock, clock.sleep)
+        limiter.update("graphql", _limit_headers(0, clock.now + 60))
+        limiter.acquire("graphql")
+        assert clock.sleeps == [61.0]
+
+    def test_budgets_are_tracked_per_resource(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock, clock.sleep)
+        limiter.update("graphql", _limit_headers(0, clock.now + 60))
+        limiter.acquire("core")
+        assert clock.sleeps == []
+
+
+class TestRateLimitedTransport:
+    def test_retries_after_secondary_limit(self):
+        clock = FakeClock()
+        inner = FakeTransport(
+            ApiResponse(403, {"retry-after": "30"}, b'{"message": "slow down"}'),
+            ApiResponse(200, {}, b"{}"),
+        )
+        transport = RateLimitedTransport(inner, RateLimiter(clock, clock.sleep))
+        response = transport.request("GET", "/users/u")
+        assert response.status == 200
+        assert inner.calls == 2
+        assert clock.sleeps == [30.0]
+
+    def test_gives_up_after_max_retries(self):
+        clock = FakeClock()
+        limited = ApiResponse(429, {}, b"")
+        inner = FakeTransport(limited, limited, limited)
+        limiter = RateLimiter(clock, clock.sleep)
+        transport = RateLimitedTransport(inner, limiter, max_retries=2)
+        assert transport.request("GET", "/users/u").status == 429
+        assert inner.calls == 3
+        assert clock.sleeps == [1.0, 2.0]
+
+
+def test_graphql_rate_limited_errors_only():
+    throttled = ApiResponse(
+        200, {}, b'{"errors": [{"type": "RATE_LIMITED", "message": "slow down"}]}'
+    )
+    mention = ApiResponse(200, {}, b'[{"name": "RATE_LIMITED", "topics": []}]')
+    assert is_rate_limited(throttled, "graphql")
+    assert not is_rate_limited(throttled, "core")
+    assert not is_rate_limited(mention, "graphql")
+    assert not is_rate_limited(mention, "core")
+
+
+def test_resource_for():
+    assert resource_for("graphql") == "graphql"
+    assert resource_for("/search/repositories?q=x") == "search"
+    assert resource_for("https://api.github.com/user/1/repos?page=2") == "core"
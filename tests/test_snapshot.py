@@ -0,0 +1,84 @@
+"""Tests for raw data snapshots and offline replay."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from github2md.cli import main
+from github2md.converter import GitHubToMarkdownConverter
+from github2md.extractor import DictExtractor
+from github2md.snapshot import (
+    RecordingExtractor,
+    SnapshotExtractor,
+    SnapshotStore,
+    materialize,
+)
+from github2md.writer import InMemoryWriter
+
+
+class LazyReposExtractor(DictExtractor):
+    """Return repos as lazy pages, like GitHubExtractor."""
+
+    def extract(self, username):
+        data = super().extract(username)
+        return {**data, "repos": iter([iter(page) for page in data["repos"]])}
+
+
+DATA = {
+    "profile": [{"name": "Someone", "login": "alice"}],
+    "repos": [[{"name": "tool", "stargazers_count": 3}], [{"name": "lib"}]],
+    "contributions": {"totalCommitContributions": 7},
+}
+
+
+def _render(extractor, username="alice"):
+    writer = InMemoryWriter()
+    GitHubToMarkdownConverter(extractor, writer).convert(username)
+    return writer.files
+
+
+def test_materialize_reads_lazy_pages():
+    raw = LazyReposExtractor(DATA).extract("alice")
+    assert materialize(raw)["repos"] == DATA["repos"]
+
+
+def test_replay_renders_like_the_recorded_run(tmp_path):
+    store = SnapshotStore(tmp_path)
+    recorded = _render(RecordingExtractor(LazyReposExtractor(DATA), store))
+
+    assert len(store.history("alice")) == 1
+    assert _render(SnapshotExtractor(store)) == recorded
+    assert "lib" in recorded["repositories.md"]
+
+
+def test_latest_snapshot_wins_and_history_is_kept(tmp_path):
+    store = SnapshotStore(tmp_path)
+    store.save({"username": "alice", "profile": [{"name": "Old"}]})
+    store.save({"username": "alice", "profile": [{"name": "New"}]})
+
+    assert len(store.history("alice")) == 2
+    assert store.latest("alice")["profile"] == [{"name": "New"}]
+    assert store.usernames() == ["alice"]
+
+
+def test_missing_or_invalid_user(tmp_path):
+    store = SnapshotStore(tmp_path)
+    with pytest.raises(RuntimeError, match="No snapshot"):
+        SnapshotExtractor(store).extract("ghost")
+    with pytest.raises(ValueError):
+        store.history("../etc")
+
+
+def test_cli_replays_every_stored_user(tmp_path):
+    store = SnapshotStore(tmp_path / "snapshots")
+    for name in ("alice", "bob"):
+        store.save({**DATA, "username": name})
+    argv = ["github2md", "--from-snapshot", str(tmp_path / "snapshots")]
+    argv += ["-o", str(tmp_path / "out")]
+
+    with patch.object(sys, "argv", argv), patch("subprocess.run") as run:
+        main()
+    run.assert_not_called()
+    assert (tmp_path / "out" / "alice" / "profile.md").exists()
+    assert (tmp_path / "out" / "bob" / "repositories.md").exists()
@@ -0,0 +1,51 @@
+"""Tests for CLI startup cost and cached gh probes."""
+
+import subprocess
+import sys
+
+from github2md.probe import ProbeCache, authenticated_user
+
+# Modules that must stay out of `import github2md.cli`; they are imported
+# on demand. See benchmarks/startup.py for timing.
+LAZY_MODULES = [
+    "asyncio",
+    "http.client",
+    "importlib.metadata",
+    "github2md.converter",
+    "github2md.parsers",
+    "github2md.formatters",
+]
+
+
+def test_cli_import_stays_lazy():
+    code = (
+        "import sys, github2md.cli; "
+        f"print([m for m in {LAZY_MODULES!r} if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+class TestProbeCache:
+    def test_login_is_reused_until_token_changes(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GH_CONFIG_DIR", str(tmp_path / "gh"))
+        monkeypatch.setenv("GH_TOKEN", "first")
+        lookups = []
+
+        def lookup():
+            lookups.append(1)
+            return f"user{len(lookups)}"
+
+        path = tmp_path / "probes.json"
+        assert authenticated_user(ProbeCache(path), lookup) == "user1"
+        assert authenticated_user(ProbeCache(path), lookup) == "user1"
+        monkeypatch.setenv("GH_TOKEN", "second")
+        assert authenticated_user(ProbeCache(path), lookup) == "user2"
+        assert len(lookups) == 2
+
+    def test_failures_are_not_cached(self, tmp_path):
+        probes = ProbeCache(tmp_path / "probes.json")
+        assert probes.get_or_compute("login", "fp", lambda: None) is None
+        assert probes.get_or_compute("login", "fp", lambda: "octocat") == "octocat"
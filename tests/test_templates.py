@@ -0,0 +1,73 @@
+"""Tests for compiled section templates."""
+
+import pytest
+
+from github2md.formatters.profile import ProfileFormatter
+from github2md.manifest import section_hash
+from github2md.templates import (
+    TemplateError,
+    bind_template,
+    compile_template,
+    set_template_dir,
+)
+
+
+def _render(source, data, **filters):
+    return "".join(bind_template(source, filters)(data))
+
+
+class TestTemplates:
+    def test_placeholders_filters_and_blocks(self):
+        source = (
+            '# {title|default:"Untitled"} {{literal}}\n'
+            "{% for name, count in counts|items|limit:2 %}\n"
+            "- {name}: {count|shout}\n"
+            "{% endfor %}\n"
+            "{% if not counts %}\n"
+            "none\n"
+            "{% elif owner.login %}\n"
+            "by {owner.login}\n"
+            "{% endif %}\n"
+        )
+        data = {"counts": {"a": 1, "b": 2, "c": 3}, "owner": {"login": "octo"}}
+        result = _render(source, data, shout=lambda v: f"{v}!")
+        assert result == "# Untitled {literal}\n- a: 1!\n- b: 2!\nby octo\n"
+        assert _render(source, {"counts": {}}, shout=str).endswith("none\n")
+
+    def test_compiled_once_per_source(self):
+        source = "x {y}\n"
+        assert compile_template(source) is compile_template(source)
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "{% if a %}\nx\n",
+            "{% endfor %}\n",
+            "{% while a %}\n",
+            "{a + b}\n",
+            "stray } brace\n",
+            "{a|upper()}\n",
+        ],
+    )
+    def test_rejects_malformed_templates(self, source):
+        with pytest.raises(TemplateError):
+            bind_template(source, {})
+
+    def test_rejects_unknown_filters(self):
+        with pytest.raises(TemplateError, match="unknown filter"):
+            bind_template("{a|nope}\n", {})
+
+
+class TestCustomTemplates:
+    def test_template_dir_overrides_builtin_layout(self, tmp_path):
+        formatter = ProfileFormatter()
+        data = {"username": "octo", "name": "Octo | Cat"}
+        builtin_hash = section_hash(formatter, data)
+        (tmp_path / "profile.md").write_text("## {username}: {name|escape}\n")
+        set_template_dir(tmp_path)
+        try:
+            assert formatter.format(data) == "## octo: Octo \\| Cat\n"
+            assert section_hash(formatter, data) != builtin_hash
+        finally:
+            set_template_dir(None)
+        assert formatter.format(data).startswith("# GitHub Profile: octo")
@@ -0,0 +1,124 @@
+"""Tests for API transports."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from github2md.extractor import GitHubExtractor
+from github2md.http_transport import HttpTransport
+from github2md.transport import parse_http_response
+
+
+class _StandInServer(ThreadingHTTPServer):
+    """Local server recording (client, path, headers) of every request."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _GitHubStandIn)
+        self.requests: list[tuple[Any, str, dict[str, str]]] = []
+
+
+class _GitHubStandIn(BaseHTTPRequestHandler):
+    """Minimal stand-in for api.github.com speaking keep-alive HTTP/1.1."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, payload, headers=None, status=200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _record(self) -> _StandInServer:
+        """Record this request and return the server."""
+        server = self.server
+        assert isinstance(server, _StandInServer)
+        server.requests.append((self.client_address, self.path, dict(self.headers)))
+        return server
+
+    def do_GET(self):
+        server = self._record()
+        base = f"http://127.0.0.1:{server.server_port}"
+        if self.path == "/users/octocat":
+            self._send({"login": "octocat", "name": "Octo Cat"})
+        elif self.path == "/users/octocat/repos?per_page=100":
+            link = f'<{base}/users/octocat/repos?per_page=100&page=2>; rel="next"'
+            self._send([{"name": "a", "stargazers_count": 1}], {"Link": link})
+        elif self.path == "/users/octocat/repos?per_page=100&page=2":
+            self._send([{"name": "b", "stargazers_count": 2}])
+        else:
+            self._send({"message": "Not Found"}, status=404)
+
+    def do_POST(self):
+        self._record()
+        length = int(self.headers["Content-Length"])
+        query = json.loads(self.rfile.read(length))
+        if "search" in query["variables"]:
+            assert "author:octocat" in query["variables"]["search"]
+            self._send({"data": {"search": {"issueCount": 0, "nodes": []}}})
+            return
+        assert query["variables"] == {"login": "octocat"}
+        contributions = {"totalCommitContributions": 42}
+        self._send({"data": {"user": {"contributionsCollection": contributions}}})
+
+
+@pytest.fixture
+def api_server():
+    server = _StandInServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _base_url(server):
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+class TestHttpTransport:
+    def test_extract_reuses_one_connection(self, api_server, monkeypatch):
+        monkeypatch.setenv("GH_TOKEN", "secret")
+        transport = HttpTransport(base_url=_base_url(api_server))
+        extractor = GitHubExtractor(max_workers=1, transport=transport)
+        data = extractor.extract("octocat")
+        pages = [[repo["name"] for repo in page] for page in data["repos"]]
+
+        assert data["profile"][0]["name"] == "Octo Cat"
+        assert pages == [["a"], ["b"]]
+        assert data["contributions"] == {"totalCommitContributions": 42}
+        # profile, two repository pages, contributions, four searches
+        assert len(api_server.requests) == 8
+        assert len({client for client, _, _ in api_server.requests}) == 1
+        assert all(
+            headers["Authorization"] == "Bearer secret"
+            for _, _, headers in api_server.requests
+        )
+
+    def test_returns_error_responses(self, api_server):
+        transport = HttpTransport(token="t", base_url=_base_url(api_server))
+        response = transport.request("GET", "/users/ghost")
+        assert response.status == 404
+        assert response.json() == {"message": "Not Found"}
+
+    def test_rejects_foreign_absolute_urls(self, api_server):
+        transport = HttpTransport(token="t", base_url=_base_url(api_server))
+        with pytest.raises(ValueError):
+            transport.request("GET", "https://example.com/users/octocat")
+
+
+def test_parse_http_response():
+    raw = b'HTTP/2.0 304 Not Modified\r\nETag: "abc"\r\n\r\n'
+    response = parse_http_response(raw)
+    assert response.status == 304
+    assert response.headers == {"etag": '"abc"'}
+    assert response.body == b""
@@ -0,0 +1,87 @@
+"""Tests for output writers and streaming conversion."""
+
+import os
+
+import pytest
+
+from github2md.converter import GitHubToMarkdownConverter
+from github2md.extractor import DictExtractor
+from github2md.writer import InMemoryWriter, MarkdownFileWriter
+
+
+class TestMarkdownFileWriter:
+    def test_write_chunks(self, tmp_path):
+        writer = MarkdownFileWriter(tmp_path)
+        path = writer.write_chunks("repositories", iter(["# A\n", "b \u2713\n"]))
+        assert path == tmp_path / "repositories.md"
+        # Same bytes as write(): UTF-8 with untranslated newlines
+        assert path.read_bytes() == "# A\nb \u2713\n".encode()
+
+    def test_failed_stream_keeps_previous_file(self, tmp_path):
+        writer = MarkdownFileWriter(tmp_path)
+        writer.write("profile.md", "old\n")
+
+        def chunks():
+            yield "new"
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            writer.write_chunks("profile.md", chunks())
+        assert (tmp_path / "profile.md").read_text(encoding="utf-8") == "old\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["profile.md"]
+
+    def test_write_chunks_rejects_traversal(self, tmp_path):
+        with pytest.raises(ValueError):
+            MarkdownFileWriter(tmp_path).write_chunks("../evil.md", ["x"])
+
+    def test_rejects_sibling_with_common_prefix(self, tmp_path):
+        (tmp_path / "out-evil").mkdir()
+        writer = MarkdownFileWriter(tmp_path / "out")
+        (tmp_path / "out" / "link").symlink_to(tmp_path / "out-evil")
+        with pytest.raises(ValueError):
+            writer.write("link/profile.md", "x")
+
+    @pytest.mark.parametrize("streamed", [False, True])
+    def test_identical_content_is_not_rewritten(self, tmp_path, streamed):
+        writer = MarkdownFileWriter(tmp_path)
+        path = writer.write("profile.md", "same\n")
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+        if streamed:
+            writer.write_chunks("profile.md", ["sa", "me\n"])
+        else:
+            writer.write("profile.md", "same\n")
+        assert path.stat().st_mtime_ns == 1_000_000_000
+        assert [p.name for p in tmp_path.iterdir()] == ["profile.md"]
+
+        writer.write("profile.md", "changed\n")
+        assert path.stat().st_mtime_ns != 1_000_000_000
+        assert path.read_text(encoding="utf-8") == "changed\n"
+
+    def test_flush_fsyncs_written_files_once(self, tmp_path, monkeypatch):
+        synced = []
+        monkeypatch.setattr(os, "fsync", synced.append)
+        writer = MarkdownFileWriter(tmp_path, fsync=True)
+        writer.write("a.md", "a")
+        writer.write_chunks("b.md", ["b"])
+        assert synced == []
+
+        writer.flush()
+        assert len(synced) == 3  # two files and the directory
+        writer.flush()
+        assert len(synced) == 3
+
+
+def test_converter_streams_repos_section(tmp_path):
+    repos = [{"name": f"repo{i}", "stargazers_count": i} for i in range(3)]
+    data = {"profile": [{"name": "Octo"}], "repos": [repos]}
+    streamed = GitHubToMarkdownConverter(
+        DictExtractor(data), MarkdownFileWriter(tmp_path)
+    )
+    streamed.convert("octocat")
+    memory = InMemoryWriter()
+    GitHubToMarkdownConverter(DictExtractor(data), memory).convert("octocat")
+
+    written = (tmp_path / "repositories.md").read_text(encoding="utf-8")
+    assert written == memory.files["repositories.md"]
+    assert "### repo2" in written